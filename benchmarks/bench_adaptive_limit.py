@@ -0,0 +1,119 @@
+"""
+Fixed vs adaptive admission limit when upstream capacity drops mid-run
+
+A closed loop of clients summarizes through admission control against a
+stub that slows every token once more than ``capacity`` generations run
+at once. Halfway through, the capacity drops. A fixed limit keeps
+sending its full concurrency and every call slows down; the adaptive
+limit backs off to what the backend can serve. With a closed loop the
+end-to-end latency is the same either way (the rest wait in the queue,
+where they can be shed or expire); the upstream column shows what the
+backend sees.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_adaptive_limit --clients 32 --seconds 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.domain.value_objects.summary_config import LMStudioConfig, SummaryConfig
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+from app.shared.adaptive_limit import AIMDLimit
+from app.shared.admission_controller import AdmissionController
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+TEXT = "벤치마크용 텍스트입니다. " * 20
+
+
+class _TimedRepository:
+    """Record how long each call spends upstream, after admission"""
+
+    def __init__(self, repository: LMStudioSummaryRepository):
+        self.repository = repository
+        self.timings: list[float] = []
+
+    async def summarize_text(self, text: str, config: SummaryConfig):
+        start = time.perf_counter()
+        summary = await self.repository.summarize_text(text, config)
+        self.timings.append((time.perf_counter() - start) * 1000)
+        return summary
+
+
+async def _phase(
+    repository: AdmissionControlledSummaryRepository, controller: AdmissionController, clients: int, seconds: float
+) -> tuple[list[float], list[int]]:
+    """Run a closed loop for a while; return call latencies (ms) and the limit sampled every 100 ms"""
+    deadline = time.perf_counter() + seconds
+    timings: list[float] = []
+    limits: list[int] = []
+
+    async def client() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await repository.summarize_text(TEXT, SummaryConfig())
+            timings.append((time.perf_counter() - start) * 1000)
+
+    async def sample() -> None:
+        while time.perf_counter() < deadline:
+            limits.append(controller.limit)
+            await asyncio.sleep(0.1)
+
+    await asyncio.gather(sample(), *(client() for _ in range(clients)))
+    return timings, limits
+
+
+async def _run(mode: str, stub_app, config: LMStudioConfig, args: argparse.Namespace) -> None:
+    adaptive_limit = AIMDLimit(initial_limit=4, max_limit=args.max_in_flight) if mode == "adaptive" else None
+    controller = AdmissionController(
+        max_in_flight=args.max_in_flight, max_queue=args.clients, queue_timeout=600, adaptive_limit=adaptive_limit
+    )
+    pool = LLMClientPool(config)
+    await pool.open()
+    upstream = _TimedRepository(LMStudioSummaryRepository(config, client_pool=pool))
+    repository = AdmissionControlledSummaryRepository(upstream, controller)
+    try:
+        for capacity in (args.capacity, args.reduced_capacity):
+            stub_app.state.capacity = capacity
+            upstream.timings = []
+            timings, limits = await _phase(repository, controller, args.clients, args.seconds)
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            upstream_p95 = statistics.quantiles(upstream.timings, n=20)[-1]
+            print(
+                f"{mode:<10}{capacity:>10}{len(timings) / args.seconds:>8.1f}{statistics.median(timings):>9.0f}"
+                f"{p95:>9.0f}{statistics.median(upstream.timings):>14.0f}{upstream_p95:>14.0f}"
+                f"{statistics.median(limits):>7.0f}   {limits[::10]}"
+            )
+    finally:
+        await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of each capacity phase")
+    parser.add_argument("--max-in-flight", type=int, default=16, help="fixed limit and adaptive maximum")
+    parser.add_argument("--capacity", type=int, default=8, help="stub generations at full speed")
+    parser.add_argument("--reduced-capacity", type=int, default=2, help="capacity in the second phase")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="stub seconds per token")
+    args = parser.parse_args()
+
+    stub_app = create_stub_app(token_delay=args.token_delay, capacity=args.capacity)
+    with BackgroundServer(stub_app, port=18234) as server:
+        config = LMStudioConfig(base_url=server.base_url, api_key="stub", timeout=120, max_retries=0)
+        print(
+            f"{'mode':<10}{'capacity':>10}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'upstream p50':>14}"
+            f"{'upstream p95':>14}{'limit':>7}   limit every second"
+        )
+        for mode in ("fixed", "adaptive"):
+            asyncio.run(_run(mode, stub_app, config, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Per-request overhead of building LLM clients vs the shared pool
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_client_pool --requests 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_openai import ChatOpenAI
+
+from app.domain.value_objects.summary_config import LMStudioConfig, SummaryConfig
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+TEXT = "벤치마크용 텍스트입니다. " * 20
+
+
+async def _fresh_client(config: LMStudioConfig, summary_config: SummaryConfig) -> None:
+    """New ChatOpenAI and a new HTTP client (cold TCP connection) per request"""
+    pool = LLMClientPool(config)
+    try:
+        await LMStudioSummaryRepository(config, client_pool=pool).summarize_text(TEXT, summary_config)
+    finally:
+        await pool.close()
+
+
+async def _per_request_handle(config: LMStudioConfig, summary_config: SummaryConfig) -> None:
+    """New ChatOpenAI per request on the library default transport (previous behaviour)"""
+    llm = ChatOpenAI(
+        base_url=config.base_url,
+        api_key=config.api_key,
+        model=summary_config.model_name,
+        temperature=summary_config.temperature,
+        max_tokens=summary_config.max_tokens,
+        timeout=config.timeout,
+        max_retries=config.max_retries,
+    )
+    await llm.ainvoke(TEXT)
+
+
+async def _run(mode: str, requests: int, config: LMStudioConfig) -> list[float]:
+    summary_config = SummaryConfig()
+    pool = LLMClientPool(config)
+    await pool.open()
+    repository = LMStudioSummaryRepository(config, client_pool=pool)
+    timings = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            if mode == "fresh-client":
+                await _fresh_client(config, summary_config)
+            elif mode == "per-request-handle":
+                await _per_request_handle(config, summary_config)
+            else:
+                await repository.summarize_text(TEXT, summary_config)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await pool.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--port", type=int, default=18234)
+    args = parser.parse_args()
+
+    with BackgroundServer(create_stub_app(), port=args.port) as server:
+        config = LMStudioConfig(base_url=server.base_url, api_key="stub", timeout=30, max_retries=0)
+        print(f"{'mode':<20}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for mode in ("fresh-client", "per-request-handle", "pooled"):
+            timings = asyncio.run(_run(mode, args.requests, config))
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            print(f"{mode:<20}{statistics.mean(timings):>10.2f}{statistics.median(timings):>10.2f}{p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Cold start: time from process start to the first ready probe and first summary
+
+Starts the app with uvicorn against the stub once per run and client
+backend, and reports the slowest imports of ``app.main`` (``-X importtime``).
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_cold_start --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+READY_PATH = "/api/v1/summary/health"
+
+
+def _env(**overrides: str) -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])),
+        "JOBS_WORKERS": "0",
+        "SUMMARY_CACHE_ENABLED": "false",
+        **overrides,
+    }
+
+
+def _start(port: int, env: dict[str, str]) -> tuple[float, float]:
+    """Seconds until the ready probe answers 200 and until the first summary returns"""
+    started = time.monotonic()
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"]
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"App exited with status {process.returncode}")
+                try:
+                    if client.get(READY_PATH).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+            ready = time.monotonic() - started
+            client.post("/api/v1/summary/", json={"text": "콜드 스타트 측정용 텍스트입니다."}).raise_for_status()
+            return ready, time.monotonic() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _import_profile(top: int) -> None:
+    """Print the imports of app.main with the largest cumulative time"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        rows.append((int(cumulative), module.rstrip()))
+    print(f"{'cumulative ms':>14}  module")
+    for cumulative, module in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>14.1f}  {module}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=18236)
+    parser.add_argument("--top", type=int, default=15, help="imports listed in the profile")
+    args = parser.parse_args()
+
+    _import_profile(args.top)
+
+    with BackgroundServer(create_stub_app(), port=18234) as stub:
+        print(f"\n{'backend':>10}{'warmup':>8}{'ready s':>10}{'first summary s':>17}")
+        for backend, warmup in (("langchain", "false"), ("langchain", "true"), ("raw", "false")):
+            env = _env(LMSTUDIO_BASE_URL=stub.base_url, LLM_CLIENT_BACKEND=backend, LLM_CLIENT_WARMUP=warmup)
+            timings = [_start(args.port, env) for _ in range(args.runs)]
+            ready = statistics.median(timing[0] for timing in timings)
+            first = statistics.median(timing[1] for timing in timings)
+            print(f"{backend:>10}{warmup:>8}{ready:>10.2f}{first:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
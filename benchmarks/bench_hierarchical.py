@@ -0,0 +1,74 @@
+"""
+Upstream calls and wall time of map-reduce summarization for long documents
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_hierarchical --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.domain.entities.summary import Summary
+from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.services.hierarchical_summary_service import HierarchicalSummaryService
+from app.domain.services.summary_service import SummaryService
+from app.domain.services.text_chunker import TextChunker
+from app.domain.value_objects.summary_config import SummaryConfig
+
+
+class _FakeRepository(SummaryRepository):
+    """Repository with a fixed upstream latency and a short summary per call"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def summarize_text(self, text: str, config: SummaryConfig) -> Summary:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return Summary(id="bench", original_text=text, summary_text=f"{self.calls}번째 부분 요약입니다. " * 20)
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def _document(length: int) -> str:
+    sentences = []
+    total = 0
+    index = 0
+    while total < length:
+        sentence = f"벤치마크 문서의 {index}번째 문장은 서로 다른 내용을 담고 있습니다. "
+        sentences.append(sentence)
+        total += len(sentence)
+        index += 1
+    return "".join(sentences)[:length]
+
+
+async def _run(length: int, args: argparse.Namespace) -> tuple[int, int, float]:
+    repository = _FakeRepository(args.latency)
+    chunker = TextChunker(max_chunk_tokens=args.chunk_tokens, overlap_tokens=args.overlap_tokens)
+    service = HierarchicalSummaryService(SummaryService(repository), chunker, max_concurrency=args.concurrency)
+    text = _document(length)
+
+    start = time.perf_counter()
+    await service.summarize_text(text)
+    return len(chunker.split(text)), repository.calls, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="fake upstream seconds per call")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--chunk-tokens", type=int, default=3000)
+    parser.add_argument("--overlap-tokens", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'characters':>12}{'chunks':>10}{'calls':>10}{'wall s':>10}{'serial s':>10}")
+    for length in (100_000, 300_000, 1_000_000):
+        chunks, calls, wall = asyncio.run(_run(length, args))
+        print(f"{length:>12}{chunks:>10}{calls:>10}{wall:>10.2f}{calls * args.latency:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Interactive latency during a bulk burst, with and without priority lanes
+
+A burst of bulk summaries fills the admission queue while interactive
+requests arrive at a steady rate. Without lanes (no API keys) both share
+one FIFO queue and interactive requests wait behind the burst; with
+lanes, keys assigned to the interactive and bulk lanes, they are
+admitted ahead of it. The admission wait
+p95 is read from the per-lane ``llmplan_admission_wait_seconds``
+histogram (bucket upper bound).
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_priority_lanes --bulk 200 --interactive 30
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import time
+
+import httpx
+
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+TEXT = "우선순위 벤치마크용 텍스트입니다. " * 20
+WAIT_BUCKET = re.compile(
+    r'^llmplan_admission_wait_seconds_bucket\{lane="(\w+)",le="([0-9.e+inf]+)"\} ([0-9.e+]+)$', re.M
+)
+
+
+def _wait_buckets(client: httpx.Client) -> dict[str, list[tuple[float, float]]]:
+    """Cumulative admission wait buckets per lane"""
+    buckets: dict[str, list[tuple[float, float]]] = {}
+    for lane, bound, count in WAIT_BUCKET.findall(client.get("/metrics").text):
+        buckets.setdefault(lane, []).append((float(bound), float(count)))
+    return buckets
+
+
+def _p95_bound(before: list[tuple[float, float]], after: list[tuple[float, float]]) -> float:
+    """Upper bound of the bucket holding the 95th percentile of the observations between two scrapes"""
+    previous = dict(before)
+    counts = [(bound, count - previous.get(bound, 0.0)) for bound, count in after]
+    total = counts[-1][1]
+    return next(bound for bound, count in counts if count >= 0.95 * total)
+
+
+async def _burst(url: str, bulk: int, interactive: int, interval: float, lanes: bool) -> tuple[list[float], float]:
+    """Send the bulk burst and the paced interactive requests; return interactive latencies (ms) and bulk seconds"""
+    bulk_headers = {"X-API-Key": "nightly-key"} if lanes else {}
+    interactive_headers = {"X-API-Key": "ui-key"} if lanes else {}
+    limits = httpx.Limits(max_connections=bulk + interactive)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=120) as client:
+
+        async def call(index: int, headers: dict) -> float:
+            start = time.perf_counter()
+            response = await client.post("/api/v1/summary/", json={"text": f"{index} {TEXT}"}, headers=headers)
+            response.raise_for_status()
+            return (time.perf_counter() - start) * 1000
+
+        async def paced() -> list[float]:
+            await asyncio.sleep(interval)
+            tasks = []
+            for index in range(interactive):
+                tasks.append(asyncio.create_task(call(-index - 1, interactive_headers)))
+                await asyncio.sleep(interval)
+            return await asyncio.gather(*tasks)
+
+        start = time.perf_counter()
+        bulk_calls = asyncio.gather(*(call(index, bulk_headers) for index in range(bulk)))
+        interactive_timings = await paced()
+        await bulk_calls
+        return interactive_timings, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bulk", type=int, default=200, help="bulk requests sent at once")
+    parser.add_argument("--interactive", type=int, default=30, help="interactive requests, one per interval")
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between interactive requests")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub prompt processing seconds")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="stub seconds per token")
+    args = parser.parse_args()
+
+    stub_app = create_stub_app(latency=args.latency, token_delay=args.token_delay)
+    with BackgroundServer(stub_app, port=18234) as stub:
+        os.environ["LMSTUDIO_BASE_URL"] = stub.base_url
+        os.environ["SUMMARY_CACHE_ENABLED"] = "false"
+        os.environ["ADMISSION_MAX_QUEUE"] = str(args.bulk + args.interactive)
+        os.environ["ADMISSION_QUEUE_TIMEOUT"] = "120"
+        os.environ["PRIORITY_AGING_SECONDS"] = "30"
+        os.environ["PRIORITY_API_KEY_LANES"] = '{"ui-key": "interactive", "nightly-key": "bulk"}'
+
+        from app.main import create_app
+
+        with BackgroundServer(create_app(), port=18235) as server, httpx.Client(base_url=server.url) as client:
+            print(f"{'mode':<10}{'interactive p50 ms':>20}{'p95 ms':>10}{'wait p95 <= s':>15}{'bulk done s':>13}")
+            for lanes in (False, True):
+                before = _wait_buckets(client)
+                timings, bulk_seconds = asyncio.run(
+                    _burst(server.url, args.bulk, args.interactive, args.interval, lanes)
+                )
+                after = _wait_buckets(client)
+                lane = "interactive" if lanes else "default"
+                wait_p95 = _p95_bound(before.get(lane, []), after[lane])
+                p95 = statistics.quantiles(timings, n=20)[-1]
+                mode = "lanes" if lanes else "fifo"
+                print(
+                    f"{mode:<10}{statistics.median(timings):>20.0f}{p95:>10.0f}{wait_p95:>15.3g}{bulk_seconds:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Per-request cost of building the system prompt and its token budget
+
+Compares formatting the prompt and counting its tokens on every request
+(previous behaviour) with a lookup in the precompiled prompt registry.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_prompt_build --iterations 20000
+"""
+
+import argparse
+import time
+
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.external_services.prompt_registry import DEFAULT_TEMPLATES, PromptRegistry
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+
+TEXT = "벤치마크용 텍스트입니다. " * 40
+CONFIGS = [
+    SummaryConfig(language=language, summary_type=summary_type)
+    for language in DEFAULT_TEMPLATES["languages"]
+    for summary_type in DEFAULT_TEMPLATES["summary_types"]
+]
+
+
+def _per_request(budgeter: PromptBudgeter, config: SummaryConfig) -> None:
+    """Rebuild the lookup dicts and the f-string, then count the prompt tokens"""
+    language_instruction = dict(DEFAULT_TEMPLATES["languages"]).get(config.language)
+    summary_style = dict(DEFAULT_TEMPLATES["summary_types"]).get(config.summary_type)
+    system_prompt = DEFAULT_TEMPLATES["system"].format(
+        summary_style=summary_style, language_instruction=language_instruction
+    )
+    budgeter.fit(system_prompt, DEFAULT_TEMPLATES["user_prefix"], TEXT, config.max_tokens)
+
+
+def _compiled(budgeter: PromptBudgeter, registry: PromptRegistry, config: SummaryConfig) -> None:
+    """Look up the compiled prompt and reuse its token count"""
+    prompt = registry.get(config.language, config.summary_type)
+    budgeter.fit(prompt.system_prompt, prompt.user_prefix, TEXT, config.max_tokens, overhead=prompt.overhead_tokens)
+
+
+def _time(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for index in range(iterations):
+        function(CONFIGS[index % len(CONFIGS)])
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--encoding", default="cl100k_base", help="tiktoken encoding; empty for the estimate")
+    args = parser.parse_args()
+
+    token_counter = TokenCounter(args.encoding)
+    token_counter.load()
+    budgeter = PromptBudgeter(token_counter)
+    registry = PromptRegistry(budgeter)
+    registry.load()
+    print(f"tokenizer: {token_counter.backend}, text: {token_counter.count(TEXT)} tokens")
+
+    print(f"{'mode':>14}{'us/request':>14}")
+    for mode, function in (
+        ("per_request", lambda config: _per_request(budgeter, config)),
+        ("compiled", lambda config: _compiled(budgeter, registry, config)),
+    ):
+        print(f"{mode:>14}{_time(function, args.iterations):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Generated tokens and latency of a Qwen3-style model with and without thinking
+
+The stub emits a ``<think>`` block before the answer unless the request
+switches thinking off (``/no_think`` or ``chat_template_kwargs``), so
+this compares the suppressed default with ``"reasoning": true``. Completion
+tokens are as reported by the stub (one per word); reasoning tokens are
+counted by the app's tokenizer.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_reasoning --requests 10
+"""
+
+import argparse
+import os
+import re
+import statistics
+import time
+
+import httpx
+
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+TEXT = "추론 벤치마크용 텍스트입니다. " * 20
+REASONING = " ".join(["사용자가 요약을 원하므로 핵심 문장을 먼저 찾는다."] * 40)
+TOKEN_METRIC = re.compile(r'^llmplan_tokens_total\{kind="(\w+)"\} ([0-9.e+]+)$', re.MULTILINE)
+
+
+def _tokens(client: httpx.Client) -> dict[str, float]:
+    return {kind: float(value) for kind, value in TOKEN_METRIC.findall(client.get("/metrics").text)}
+
+
+def _stream_ttft(client: httpx.Client, payload: dict) -> float:
+    """Milliseconds until the first delta event"""
+    start = time.perf_counter()
+    with client.stream("POST", "/api/v1/summary/stream", json=payload) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line.startswith("event: delta"):
+                return (time.perf_counter() - start) * 1000
+    raise RuntimeError("Stream ended without a delta")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1, help="stub prompt processing seconds")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="stub seconds per token")
+    parser.add_argument("--method", default="no_think", help="REASONING_DISABLE_METHOD")
+    args = parser.parse_args()
+
+    stub_app = create_stub_app(latency=args.latency, token_delay=args.token_delay, reasoning=REASONING)
+    with BackgroundServer(stub_app, port=18234) as stub:
+        os.environ["LMSTUDIO_BASE_URL"] = stub.base_url
+        os.environ["SUMMARY_CACHE_ENABLED"] = "false"
+        os.environ["REASONING_DISABLE_METHOD"] = args.method
+
+        from app.main import create_app
+
+        with BackgroundServer(create_app(), port=18235) as server, httpx.Client(base_url=server.url) as client:
+            print(f"{'reasoning':>10}{'completion tok':>16}{'reasoning tok':>15}{'p50 ms':>10}{'stream ttft ms':>16}")
+            for reasoning in (False, True):
+                payload = {"text": TEXT, "reasoning": reasoning}
+                before = _tokens(client)
+                timings = []
+                for _ in range(args.requests):
+                    start = time.perf_counter()
+                    response = client.post("/api/v1/summary/", json=payload)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    response.raise_for_status()
+                    assert "<think>" not in response.json()["summary_text"]
+                after = _tokens(client)
+                ttft = statistics.median(_stream_ttft(client, payload) for _ in range(args.requests))
+
+                completion = (after.get("completion", 0) - before.get("completion", 0)) / args.requests
+                thinking = (after.get("reasoning", 0) - before.get("reasoning", 0)) / args.requests
+                print(
+                    f"{str(reasoning).lower():>10}{completion:>16.0f}{thinking:>15.0f}"
+                    f"{statistics.median(timings):>10.1f}{ttft:>16.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
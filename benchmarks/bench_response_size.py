@@ -0,0 +1,99 @@
+"""
+Bytes on the wire and serialization cost of full vs slim summary responses
+
+Compares jsonable_encoder + json.dumps (previous response path) with
+model_dump_json, then measures full and slim responses with and without gzip.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_response_size --requests 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+
+from app.application.dtos.responses.summary_response import SummaryResponse
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+SIZES = (1_000, 10_000, 50_000)
+SENTENCE = "응답 크기 벤치마크를 위한 원문 문장입니다. "
+
+
+def _text(length: int) -> str:
+    return (SENTENCE * (length // len(SENTENCE) + 1))[:length]
+
+
+def _serialization_us(length: int, iterations: int) -> tuple[float, float, float]:
+    """Microseconds per response for jsonable_encoder + json.dumps, model_dump_json and the slim projection"""
+    response = SummaryResponse(
+        id="00000000-0000-0000-0000-000000000000",
+        original_text=_text(length),
+        summary_text="요약된 텍스트입니다. " * 10,
+        created_at=datetime.now(),
+        model_name="qwen/qwen3-4b",
+        summary_length=120,
+        original_length=length,
+        compression_ratio=round(120 / length, 3),
+    )
+    timings = []
+    for serialize in (
+        lambda: json.dumps(jsonable_encoder(response)).encode(),
+        lambda: response.model_dump_json(),
+        lambda: response.model_dump_json(exclude={"original_text"}),
+    ):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            serialize()
+        timings.append((time.perf_counter() - start) / iterations * 1e6)
+    return timings[0], timings[1], timings[2]
+
+
+def _wire(client: httpx.Client, length: int, view: str, gzip: bool, requests: int) -> tuple[int, float]:
+    """(bytes downloaded, p50 milliseconds) of one request shape"""
+    headers = {"Accept-Encoding": "gzip" if gzip else "identity"}
+    sizes, timings = [], []
+    for index in range(requests):
+        # A unique suffix keeps the result cache out of the measurement
+        payload = {"text": f"{_text(length)} {index}", "temperature": 0.3}
+        start = time.perf_counter()
+        response = client.post("/api/v1/summary/", json=payload, params={"view": view}, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        sizes.append(response.num_bytes_downloaded)
+    return int(statistics.median(sizes)), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'characters':>12}{'encoder us':>12}{'dump us':>10}{'slim us':>10}")
+    for length in SIZES:
+        encoder, dump, slim = _serialization_us(length, args.iterations)
+        print(f"{length:>12}{encoder:>12.1f}{dump:>10.1f}{slim:>10.1f}")
+
+    with BackgroundServer(create_stub_app(), port=18234) as stub:
+        os.environ["LMSTUDIO_BASE_URL"] = stub.base_url
+        os.environ["CONTEXT_WINDOW_TOKENS"] = "131072"
+
+        from app.main import create_app
+
+        with BackgroundServer(create_app(), port=18235) as server, httpx.Client(base_url=server.url) as client:
+            print(f"\n{'characters':>12}{'view':>6}{'bytes':>10}{'gzip bytes':>12}{'p50 ms':>10}{'gzip p50 ms':>13}")
+            for length in SIZES:
+                for view in ("full", "slim"):
+                    plain_bytes, plain_ms = _wire(client, length, view, False, args.requests)
+                    gzip_bytes, gzip_ms = _wire(client, length, view, True, args.requests)
+                    print(f"{length:>12}{view:>6}{plain_bytes:>10}{gzip_bytes:>12}{plain_ms:>10.1f}{gzip_ms:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
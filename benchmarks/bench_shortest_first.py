@@ -0,0 +1,143 @@
+"""
+FIFO vs shortest-expected-job-first admission on a mixed workload
+
+Replays a trace of summaries, from a few words to 50,000 characters, with
+mixed summary types and max_tokens, arriving at random (Poisson) through
+admission control with a few slots. The stub's prefill and generation time
+grow with the input and the completion, which it caps at max_tokens. Both
+modes start from an untrained service time estimator that learns online.
+The trace is generated from ``--seed``, or written to and read from
+``--trace`` so runs can be compared across changes.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_shortest_first --requests 300 --load 0.85
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+from app.domain.value_objects.summary_config import LMStudioConfig, SummaryConfig
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+from app.shared.admission_controller import AdmissionController
+from app.shared.service_time import ServiceTimeEstimator
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+SENTENCE = "벤치마크용 요약 대상 문장입니다. "
+# Share of requests per size class and their character range
+SIZES = {"short": (0.6, 20, 500), "medium": (0.3, 1000, 5000), "long": (0.1, 20000, 50000)}
+LATENCY = 0.02
+PREFILL_DELAY = 0.0001
+TOKEN_DELAY = 0.001
+COMPLETION_RATIO = 0.2
+
+
+def _service_seconds(characters: int, max_tokens: int) -> float:
+    """Stub service time of a request, ignoring the prompt template"""
+    words = len((SENTENCE * (characters // len(SENTENCE) + 1))[:characters].split())
+    return LATENCY + PREFILL_DELAY * words + TOKEN_DELAY * min(max_tokens, max(20, int(COMPLETION_RATIO * words)))
+
+
+def generate_trace(requests: int, load: float, slots: int, seed: int) -> list[dict]:
+    """Requests with arrival offsets giving the target utilization of the slots"""
+    rng = random.Random(seed)
+    classes = list(SIZES)
+    items = []
+    for _ in range(requests):
+        size = rng.choices(classes, weights=[SIZES[name][0] for name in classes])[0]
+        characters = rng.randint(SIZES[size][1], SIZES[size][2])
+        items.append(
+            {
+                "size": size,
+                "characters": characters,
+                "summary_type": rng.choice(["concise", "bullet_points", "detailed"]),
+                "max_tokens": rng.choice([200, 500, 1000]),
+            }
+        )
+    mean_service = statistics.mean(_service_seconds(item["characters"], item["max_tokens"]) for item in items)
+    rate = load * slots / mean_service
+    offset = 0.0
+    for item in items:
+        offset += rng.expovariate(rate)
+        item["arrival"] = round(offset, 4)
+    return items
+
+
+async def _replay(
+    trace: list[dict], config: LMStudioConfig, shortest_first: bool, slots: int, aging: float | None
+) -> dict[str, list]:
+    controller = AdmissionController(
+        max_in_flight=slots, max_queue=len(trace), queue_timeout=600, aging_seconds=aging, shortest_first=shortest_first
+    )
+    pool = LLMClientPool(config)
+    await pool.open()
+    budgeter = PromptBudgeter(TokenCounter(), context_window=65536)
+    upstream = LMStudioSummaryRepository(config, client_pool=pool, prompt_budgeter=budgeter, client_backend="raw")
+    repository = AdmissionControlledSummaryRepository(upstream, controller, ServiceTimeEstimator())
+    latencies: dict[str, list] = {size: [] for size in SIZES}
+    start = time.perf_counter()
+
+    async def call(index: int, item: dict) -> None:
+        await asyncio.sleep(max(0.0, start + item["arrival"] - time.perf_counter()))
+        text = f"{index} " + (SENTENCE * (item["characters"] // len(SENTENCE) + 1))[: item["characters"]]
+        config = SummaryConfig(summary_type=item["summary_type"], max_tokens=item["max_tokens"])
+        issued = time.perf_counter()
+        await repository.summarize_text(text, config)
+        latencies[item["size"]].append((time.perf_counter() - issued) * 1000)
+
+    try:
+        await asyncio.gather(*(call(index, item) for index, item in enumerate(trace)))
+    finally:
+        await pool.close()
+    return latencies
+
+
+def _row(label: str, timings: list[float]) -> str:
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    return (
+        f"{label:<16}{len(timings):>6}{statistics.mean(timings):>10.0f}{statistics.median(timings):>10.0f}{p95:>10.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--load", type=float, default=0.85, help="offered load as a fraction of the slots' capacity")
+    parser.add_argument("--slots", type=int, default=2, help="admission max_in_flight")
+    parser.add_argument("--aging", type=float, default=5.0, help="anti-starvation bound, PRIORITY_AGING_SECONDS")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--trace", type=Path, help="JSON trace to replay; written from --seed if missing")
+    args = parser.parse_args()
+
+    if args.trace is not None and args.trace.exists():
+        trace = json.loads(args.trace.read_text())
+    else:
+        trace = generate_trace(args.requests, args.load, args.slots, args.seed)
+        if args.trace is not None:
+            args.trace.write_text(json.dumps(trace))
+
+    stub_app = create_stub_app(
+        latency=LATENCY, token_delay=TOKEN_DELAY, prefill_delay=PREFILL_DELAY, completion_ratio=COMPLETION_RATIO
+    )
+    with BackgroundServer(stub_app, port=18234) as server:
+        config = LMStudioConfig(base_url=server.base_url, api_key="stub", timeout=600, max_retries=0)
+        print(f"{len(trace)} requests over {trace[-1]['arrival']:.0f} s, {args.slots} slots")
+        print(f"{'mode / size':<16}{'n':>6}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for mode, shortest_first in (("fifo", False), ("sjf", True)):
+            latencies = asyncio.run(_replay(trace, config, shortest_first, args.slots, args.aging))
+            print(_row(mode, [timing for timings in latencies.values() for timing in timings]))
+            for size, timings in latencies.items():
+                print(_row(f"  {size}", timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Time to first byte of /summary/ vs /summary/stream
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.bench_stream_ttfb --requests 20
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import httpx
+
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+PAYLOAD = {"text": "스트리밍 벤치마크용 텍스트입니다. " * 20, "summary_type": "detailed"}
+
+
+def _measure(client: httpx.Client, path: str) -> tuple[float, float]:
+    """Return (time to first delta/body byte, total time) in milliseconds"""
+    start = time.perf_counter()
+    first_byte = None
+    with client.stream("POST", path, json=PAYLOAD, headers={"Accept-Encoding": "gzip"}) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes():
+            if first_byte is None and chunk.strip():
+                first_byte = time.perf_counter()
+    end = time.perf_counter()
+    return (first_byte - start) * 1000, (end - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.1, help="stub prompt processing seconds")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="stub seconds per token")
+    args = parser.parse_args()
+
+    stub_app = create_stub_app(latency=args.latency, token_delay=args.token_delay)
+    with BackgroundServer(stub_app, port=18234) as stub:
+        os.environ["LMSTUDIO_BASE_URL"] = stub.base_url
+
+        from app.main import create_app
+
+        with BackgroundServer(create_app(), port=18235) as server, httpx.Client(base_url=server.url) as client:
+            print(f"{'endpoint':<24}{'ttfb p50 ms':>14}{'total p50 ms':>14}")
+            for path in ("/api/v1/summary/", "/api/v1/summary/stream"):
+                timings = [_measure(client, path) for _ in range(args.requests)]
+                ttfb = statistics.median(t for t, _ in timings)
+                total = statistics.median(t for _, t in timings)
+                print(f"{path:<24}{ttfb:>14.1f}{total:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+"""
+Load test of the API against the stub LLM server
+
+Starts the stub and the app (plain uvicorn, optionally with several workers,
+or the production entry point ``python -m app``), records how long it took
+to answer,
+drives each scenario at each concurrency level with a closed loop of
+clients, and writes throughput, latency percentiles and per-process CPU
+and memory to JSON so runs can be compared across commits.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.load_test --concurrency 1,8,32 --duration 10
+    PYTHONPATH=src python -m benchmarks.load_test --requests-file requests.jsonl --baseline old.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from benchmarks.stub_llm_server import BackgroundServer, create_stub_app
+
+SCENARIOS = ("summary", "stream", "batch", "health")
+DEFAULT_TEXT = "부하 테스트용 텍스트입니다. 여러 문장으로 이루어진 충분히 긴 본문입니다. " * 20
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def load_payloads(path: str | None) -> list[dict]:
+    """
+    Read summary request bodies from a JSON lines file
+
+    Lines are either ``SummaryRequest`` bodies (with ``text``) or recorded
+    work items with a ``body`` field, whose body becomes the text.
+    """
+    if path is None:
+        return [{"text": DEFAULT_TEXT}]
+
+    payloads = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "text" not in record:
+            record = {"text": record.get("body") or record.get("title") or DEFAULT_TEXT}
+        payloads.append(record)
+    return payloads
+
+
+class _Requests:
+    """Endless request bodies; a counter suffix keeps texts unique unless caching is measured"""
+
+    def __init__(self, payloads: list[dict], unique: bool):
+        self._payloads = itertools.cycle(payloads)
+        self._counter = itertools.count()
+        self.unique = unique
+
+    def next(self) -> dict:
+        payload = dict(next(self._payloads))
+        if self.unique:
+            payload["text"] = f"{payload['text']} [{next(self._counter)}]"
+        return payload
+
+
+async def _send(client: httpx.AsyncClient, scenario: str, requests: _Requests, batch_size: int) -> tuple[bool, float]:
+    """Send one request and read the whole response; return (success, time to first byte)"""
+    if scenario == "health":
+        request = client.build_request("GET", "/api/v1/health")
+    elif scenario == "batch":
+        items = [requests.next() for _ in range(batch_size)]
+        request = client.build_request("POST", "/api/v1/summary/batch", json={"items": items})
+    elif scenario == "stream":
+        request = client.build_request("POST", "/api/v1/summary/stream", json=requests.next())
+    else:
+        request = client.build_request("POST", "/api/v1/summary/", json=requests.next())
+
+    start = time.perf_counter()
+    first_byte = None
+    response = await client.send(request, stream=True)
+    try:
+        body = []
+        async for chunk in response.aiter_bytes():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            body.append(chunk)
+    finally:
+        await response.aclose()
+
+    success = response.is_success
+    if success and scenario == "stream":
+        success = b"event: error" not in b"".join(body)
+    elif success and scenario == "batch":
+        success = json.loads(b"".join(body))["failed"] == 0
+    return success, first_byte if first_byte is not None else time.perf_counter() - start
+
+
+async def _drive(
+    base_url: str,
+    scenario: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    requests: _Requests,
+    batch_size: int,
+    timeout: float,
+) -> dict:
+    """Closed-loop load: each client sends its next request as soon as the previous one finished"""
+    latencies: list[float] = []
+    first_bytes: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        start = time.perf_counter()
+        measure_from = start + warmup
+        deadline = measure_from + duration
+
+        async def client_loop() -> None:
+            nonlocal errors
+            while (now := time.perf_counter()) < deadline:
+                try:
+                    success, first_byte = await _send(client, scenario, requests, batch_size)
+                except httpx.HTTPError:
+                    success, first_byte = False, 0.0
+                if now < measure_from:
+                    continue
+                latencies.append(time.perf_counter() - now)
+                first_bytes.append(first_byte)
+                errors += not success
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - measure_from
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": _percentiles(latencies),
+        "first_byte_ms": _percentiles(first_bytes),
+    }
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def at(quantile: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] * 1000, 2)
+
+    return {
+        "mean": round(statistics.fmean(ordered) * 1000, 2),
+        "p50": at(0.50),
+        "p95": at(0.95),
+        "p99": at(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+class ProcessSampler:
+    """CPU time and resident memory of the server process and its workers, read from /proc (Linux)"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self._cpu_start: dict[int, float] = {}
+        self._rss_max: dict[int, int] = {}
+        self._started = 0.0
+
+    def pids(self) -> list[int]:
+        """The server process and its direct children (uvicorn workers)"""
+        children = []
+        for entry in Path("/proc").iterdir():
+            if not entry.name.isdigit():
+                continue
+            stat = self._read_stat(int(entry.name))
+            if stat is not None and stat[1] == self.pid:
+                children.append(int(entry.name))
+        return [self.pid, *sorted(children)]
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._cpu_start = {pid: self._cpu_seconds(pid) for pid in self.pids()}
+        self._rss_max = {}
+
+    def sample(self) -> None:
+        for pid in self.pids():
+            self._rss_max[pid] = max(self._rss_max.get(pid, 0), self._rss_bytes(pid))
+
+    def stop(self) -> list[dict]:
+        elapsed = time.perf_counter() - self._started
+        processes = []
+        for pid in self.pids():
+            cpu = self._cpu_seconds(pid) - self._cpu_start.get(pid, 0.0)
+            processes.append(
+                {
+                    "pid": pid,
+                    "role": self._role(pid),
+                    "cpu_percent": round(100 * cpu / elapsed, 1) if elapsed else 0.0,
+                    "rss_mb_max": round(max(self._rss_max.get(pid, 0), self._rss_bytes(pid)) / 2**20, 1),
+                }
+            )
+        return processes
+
+    def _role(self, pid: int) -> str:
+        if pid == self.pid:
+            return "main"
+        try:
+            command = Path(f"/proc/{pid}/cmdline").read_bytes()
+        except OSError:
+            return "worker"
+        # multiprocessing starts a resource tracker next to the uvicorn workers
+        return "helper" if b"resource_tracker" in command else "worker"
+
+    @staticmethod
+    def _read_stat(pid: int) -> tuple[str, int, float] | None:
+        """(state, parent pid, user + system CPU seconds)"""
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+        except OSError:
+            return None
+        # The command name may contain spaces, so split after its closing parenthesis
+        fields = stat[stat.rindex(")") + 2 :].split()
+        return fields[0], int(fields[1]), (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+    def _cpu_seconds(self, pid: int) -> float:
+        stat = self._read_stat(pid)
+        return stat[2] if stat is not None else 0.0
+
+    @staticmethod
+    def _rss_bytes(pid: int) -> int:
+        try:
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+
+async def _run_scenario(args: argparse.Namespace, base_url: str, scenario: str, concurrency: int, sampler) -> dict:
+    requests = _Requests(load_payloads(args.requests_file), unique=not args.cacheable)
+    if sampler is not None:
+        sampler.start()
+
+    async def sample_memory() -> None:
+        while True:
+            sampler.sample()
+            await asyncio.sleep(0.5)
+
+    sampling = asyncio.create_task(sample_memory()) if sampler is not None else None
+    try:
+        result = await _drive(
+            base_url,
+            scenario,
+            concurrency,
+            args.duration,
+            args.warmup,
+            requests,
+            args.batch_size,
+            args.timeout,
+        )
+    finally:
+        if sampling is not None:
+            sampling.cancel()
+
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        **result,
+        "processes": sampler.stop() if sampler is not None else [],
+    }
+
+
+def _start_app(args: argparse.Namespace, stub_base_url: str) -> tuple[subprocess.Popen, float]:
+    """Run the app in a child process and wait until it answers; returns the process and its startup seconds"""
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])),
+        "LMSTUDIO_BASE_URL": stub_base_url,
+        "JOBS_WORKERS": "0",
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_PORT": str(args.port),
+        "SERVER_WORKERS": str(args.workers),
+    }
+    if args.server == "production":
+        command = [sys.executable, "-m", "app"]
+    else:
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ]
+    started = time.monotonic()
+    process = subprocess.Popen(command, env=env)
+
+    deadline = started + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited with status {process.returncode}")
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/api/v1/health", timeout=1)
+            return process, time.monotonic() - started
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("App did not start within 60 seconds")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(results: list[dict], baseline: dict | None) -> None:
+    previous = {(r["scenario"], r["concurrency"]): r for r in (baseline or {}).get("results", [])}
+    header = f"{'scenario':<10}{'conc':>6}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    print(header + (f"{'Δrps':>9}{'Δp95':>9}" if previous else ""))
+    for result in results:
+        latency = result["latency_ms"]
+        line = (
+            f"{result['scenario']:<10}{result['concurrency']:>6}{result['rps']:>10.1f}"
+            f"{latency.get('p50', 0):>10.1f}{latency.get('p95', 0):>10.1f}{latency.get('p99', 0):>10.1f}"
+            f"{result['errors']:>8}"
+        )
+        old = previous.get((result["scenario"], result["concurrency"]))
+        if old is not None and old["rps"] and old["latency_ms"].get("p95"):
+            line += (
+                f"{result['rps'] / old['rps'] - 1:>+9.0%}{latency.get('p95', 0) / old['latency_ms']['p95'] - 1:>+9.0%}"
+            )
+        print(line)
+        for process in result["processes"]:
+            print(
+                f"{'':<16}pid {process['pid']} ({process['role']}): cpu {process['cpu_percent']}%, rss {process['rss_mb_max']} MB"
+            )
+
+
+async def _run(args: argparse.Namespace, base_url: str, sampler: ProcessSampler | None) -> list[dict]:
+    results = []
+    for scenario in args.scenarios:
+        for concurrency in args.concurrency:
+            results.append(await _run_scenario(args, base_url, scenario, concurrency, sampler))
+    return results
+
+
+def _csv(kind):
+    return lambda value: [kind(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", type=_csv(str), default=list(SCENARIOS), help=f"any of {','.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", type=_csv(int), default=[1, 8, 32], help="comma-separated client counts")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per scenario and concurrency")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds before each measurement")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--requests-file", help="JSON lines of request bodies to replay")
+    parser.add_argument("--cacheable", action="store_true", help="send repeated texts so the result cache can hit")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument(
+        "--server", choices=("uvicorn", "production"), default="uvicorn", help="plain uvicorn or python -m app"
+    )
+    parser.add_argument("--port", type=int, default=18235)
+    parser.add_argument("--app-url", help="load an already running app instead of starting one")
+    parser.add_argument("--latency", type=float, default=0.2, help="stub seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="stub tokens per second; 0 for instant")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub completions that fail")
+    parser.add_argument("--output", help="result JSON path; defaults to benchmarks/results/<commit>-<time>.json")
+    parser.add_argument("--baseline", help="earlier result JSON to compare against")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    stub_app = create_stub_app(
+        latency=args.latency,
+        token_delay=1 / args.token_rate if args.token_rate else 0.0,
+        error_rate=args.error_rate,
+    )
+    with BackgroundServer(stub_app, port=18234) as stub:
+        process, startup_seconds = (None, None) if args.app_url else _start_app(args, stub.base_url)
+        if startup_seconds is not None:
+            print(f"App answered after {startup_seconds:.2f}s")
+        try:
+            base_url = args.app_url or f"http://127.0.0.1:{args.port}"
+            sampler = ProcessSampler(process.pid) if process is not None and Path("/proc").is_dir() else None
+            results = asyncio.run(_run(args, base_url, sampler))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+
+    commit = _git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "startup_seconds": startup_seconds,
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        },
+        "results": results,
+    }
+    output = Path(args.output or f"benchmarks/results/{commit or 'unknown'}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    _print_results(results, baseline)
+    print(f"\nWrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Local stub of an OpenAI-compatible LLM server for benchmarks"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+DEFAULT_COMPLETION = "요약된 텍스트입니다. " * 10
+
+
+def create_stub_app(
+    latency: float = 0.0,
+    token_delay: float = 0.0,
+    completion: str = DEFAULT_COMPLETION,
+    error_rate: float = 0.0,
+    reasoning: str = "",
+    capacity: int | None = None,
+    prefill_delay: float = 0.0,
+    completion_ratio: float = 0.0,
+) -> FastAPI:
+    """
+    Create a FastAPI app that mimics the LMStudio OpenAI-compatible API
+
+    Args:
+        latency: Seconds to wait before the first token (prompt processing)
+        token_delay: Seconds between generated tokens
+        completion: Content returned for every chat completion
+        error_rate: Fraction of chat completions answered with a 500 after the latency
+        reasoning: Text of a ``<think>`` block generated before the completion, as Qwen3 does;
+            an empty block is generated when a ``/no_think`` directive or
+            ``chat_template_kwargs.enable_thinking=false`` switches thinking off
+        capacity: Generations served at full speed; beyond it every token slows in proportion
+            (processor sharing, like a saturated GPU). ``app.state.capacity`` changes it mid-run
+        prefill_delay: Seconds per prompt word added to the latency
+        completion_ratio: Generate this many tokens per prompt word (repeating the completion)
+            when that is longer than the completion; every completion is capped by ``max_tokens``
+    """
+    app = FastAPI()
+    app.state.capacity = capacity
+    active = 0
+
+    def _token_delay() -> float:
+        if not app.state.capacity:
+            return token_delay
+        return token_delay * max(1.0, active / app.state.capacity)
+
+    def _prompt_words(payload: dict) -> int:
+        return sum(len(message.get("content", "").split()) for message in payload.get("messages", []))
+
+    def _answer(payload: dict) -> list[str]:
+        words = completion.split(" ")
+        if completion_ratio:
+            length = max(len(words), int(completion_ratio * _prompt_words(payload)))
+            words = (words * (length // len(words) + 1))[:length]
+        return words[: payload.get("max_tokens") or payload.get("max_completion_tokens") or None]
+
+    def _tokens(payload: dict) -> list[str]:
+        if not reasoning:
+            return _answer(payload)
+        thinking_off = payload.get("chat_template_kwargs", {}).get("enable_thinking") is False or any(
+            "/no_think" in message.get("content", "") for message in payload.get("messages", [])
+        )
+        block = "<think>\n\n</think>\n\n" if thinking_off else f"<think>\n{reasoning}\n</think>\n\n"
+        return (block + " ".join(_answer(payload))).split(" ")
+
+    @app.get("/v1/models")
+    async def list_models() -> dict:
+        return {"object": "list", "data": [{"id": "qwen/qwen3-4b", "object": "model", "owned_by": "stub"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        nonlocal active
+        payload = await request.json()
+        tokens = _tokens(payload)
+        first_token_delay = latency + prefill_delay * _prompt_words(payload)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = payload.get("model", "qwen/qwen3-4b")
+
+        if error_rate and random.random() < error_rate:
+            await asyncio.sleep(first_token_delay)
+            return JSONResponse(status_code=500, content={"error": {"message": "Stub failure", "type": "server_error"}})
+
+        if payload.get("stream"):
+            return StreamingResponse(
+                _stream(completion_id, model, tokens, first_token_delay), media_type="text/event-stream"
+            )
+
+        if app.state.capacity:
+            active += 1
+            try:
+                await asyncio.sleep(first_token_delay)
+                for _ in tokens:
+                    await asyncio.sleep(_token_delay())
+            finally:
+                active -= 1
+        elif first_token_delay or token_delay:
+            await asyncio.sleep(first_token_delay + token_delay * len(tokens))
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": " ".join(tokens)},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+        }
+
+    async def _stream(completion_id: str, model: str, tokens: list[str], first_token_delay: float):
+        nonlocal active
+        active += 1
+        try:
+            if first_token_delay:
+                await asyncio.sleep(first_token_delay)
+            for index, token in enumerate(tokens):
+                if token_delay:
+                    await asyncio.sleep(_token_delay())
+                content = token if index == 0 else f" {token}"
+                yield _chunk(completion_id, model, {"content": content}, None)
+        finally:
+            active -= 1
+        yield _chunk(completion_id, model, {}, "stop")
+        yield "data: [DONE]\n\n"
+
+    return app
+
+
+def _chunk(completion_id: str, model: str, delta: dict, finish_reason: str | None) -> str:
+    """Format one streamed chat completion chunk"""
+    data = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class BackgroundServer:
+    """Run an ASGI app with uvicorn on a background thread"""
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 18234):
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-compatible API base URL"""
+        return f"{self.url}/v1"
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.should_exit = True
+        self._thread.join()
@@ -0,0 +1,8 @@
+"""
+Production server: python -m app
+"""
+
+from app.main import run
+
+if __name__ == "__main__":
+    run()
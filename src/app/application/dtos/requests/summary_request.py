@@ -1,12 +1,19 @@
 """Summary request DTOs"""
 
+from typing import Any
+
 from pydantic import BaseModel, Field, field_validator
 
 
 class SummaryRequest(BaseModel):
     """Request DTO for text summarization"""
 
-    text: str = Field(..., min_length=10, max_length=50000, description="Text to be summarized")
+    text: str = Field(
+        ...,
+        min_length=10,
+        max_length=1_000_000,
+        description="Text to be summarized; texts over 50,000 characters require the hierarchical strategy",
+    )
 
     max_tokens: int | None = Field(default=1000, ge=50, le=4000, description="Maximum number of tokens for summary")
 
@@ -24,6 +31,22 @@ class SummaryRequest(BaseModel):
 
     language: str | None = Field(default="korean", description="Language for summary output")
 
+    reasoning: bool | None = Field(
+        default=None,
+        description="Let reasoning models (e.g. Qwen3) think before answering; unset for the model's default",
+    )
+
+    strategy: str | None = Field(
+        default="auto",
+        description="Summarization strategy: auto, single, hierarchical (chunked map-reduce)",
+    )
+
+    token_budget: int | None = Field(
+        default=None, ge=1, description="Maximum prompt plus completion tokens across all model calls"
+    )
+
+    time_budget: float | None = Field(default=None, gt=0, description="Maximum seconds spent on the request")
+
     @field_validator("summary_type")
     @classmethod
     def validate_summary_type(cls, v):
@@ -42,6 +65,15 @@ class SummaryRequest(BaseModel):
             raise ValueError(f"language must be one of: {', '.join(allowed_languages)}")
         return v
 
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v):
+        """Validate summarization strategy"""
+        allowed_strategies = ["auto", "single", "hierarchical"]
+        if v not in allowed_strategies:
+            raise ValueError(f"strategy must be one of: {', '.join(allowed_strategies)}")
+        return v
+
     @field_validator("text")
     @classmethod
     def validate_text(cls, v):
@@ -51,6 +83,47 @@ class SummaryRequest(BaseModel):
         return v.strip()
 
 
+class SummaryJobRequest(SummaryRequest):
+    """Request DTO for background text summarization"""
+
+    priority: int = Field(default=0, ge=0, le=9, description="Queue priority; higher runs first")
+
+    callback_url: str | None = Field(
+        default=None, max_length=2048, description="URL that receives the finished job as a JSON POST"
+    )
+
+    @field_validator("callback_url")
+    @classmethod
+    def validate_callback_url(cls, v):
+        """Validate callback URL"""
+        if v is not None and not v.startswith(("http://", "https://")):
+            raise ValueError("callback_url must be an http or https URL")
+        return v
+
+
+class SummaryBatchRequest(BaseModel):
+    """Request DTO for batch text summarization"""
+
+    # Validated one by one by the use case, so an invalid item fails alone instead of the whole batch
+    items: list[Any] = Field(
+        ..., min_length=1, description="Summary requests to process, each in the shape of a single summary request"
+    )
+
+
+class SummaryListRequest(BaseModel):
+    """Request DTO for listing stored summaries"""
+
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of summaries returned")
+
+    offset: int = Field(default=0, ge=0, description="Number of summaries skipped")
+
+    model_name: str | None = Field(default=None, description="Only summaries generated by this model")
+
+    content_hash: str | None = Field(
+        default=None, description="Only summaries of the text with this SHA-256 hex digest of the normalized text"
+    )
+
+
 class HealthCheckRequest(BaseModel):
     """Request DTO for health check"""
 
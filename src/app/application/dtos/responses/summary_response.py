@@ -4,13 +4,19 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.domain.entities.summary_job import SummaryJob
+from app.domain.exceptions import CircuitOpenError, ServiceOverloadedError
+
 
 class SummaryResponse(BaseModel):
     """Response DTO for text summarization"""
 
     id: str = Field(..., description="Unique identifier for the summary")
 
-    original_text: str = Field(..., description="Original text that was summarized")
+    original_text: str | None = Field(
+        default=None,
+        description="Original text that was summarized; omitted in the slim view and from streamed summaries",
+    )
 
     summary_text: str = Field(..., description="Generated summary text")
 
@@ -24,6 +30,18 @@ class SummaryResponse(BaseModel):
 
     compression_ratio: float = Field(..., description="Ratio of summary length to original length")
 
+    cache_status: str | None = Field(default=None, description="Result cache status: hit, miss or bypass")
+
+    prompt_tokens: int | None = Field(default=None, description="Tokens in the prompt sent to the model")
+
+    completion_tokens: int | None = Field(default=None, description="Tokens generated by the model")
+
+    truncated: bool = Field(
+        default=False,
+        description="Whether part of the text was left out: cut to fit the model's context window, or beyond the "
+        "hierarchical reduce depth",
+    )
+
     @classmethod
     def from_domain_entity(cls, summary) -> "SummaryResponse":
         """Create response DTO from domain entity"""
@@ -39,9 +57,19 @@ class SummaryResponse(BaseModel):
             summary_length=summary.summary_length,
             original_length=original_length,
             compression_ratio=round(compression_ratio, 3),
+            cache_status=summary.cache_status,
+            prompt_tokens=summary.prompt_tokens,
+            completion_tokens=summary.completion_tokens,
+            truncated=summary.truncated,
         )
 
 
+class SummaryDeltaResponse(BaseModel):
+    """Response DTO for an incremental piece of a streamed summary"""
+
+    text: str = Field(..., description="Newly generated summary text")
+
+
 class HealthCheckResponse(BaseModel):
     """Response DTO for health check"""
 
@@ -53,6 +81,15 @@ class HealthCheckResponse(BaseModel):
 
     details: str | None = Field(default=None, description="Additional details about health status")
 
+    circuit_breakers: dict[str, str] | None = Field(
+        default=None, description="Circuit breaker state per upstream endpoint: closed, half_open or open"
+    )
+
+    ready: dict[str, bool | None] | None = Field(
+        default=None,
+        description="Whether the latest generation probe per upstream endpoint succeeded; null before the first probe",
+    )
+
 
 class ErrorResponse(BaseModel):
     """Response DTO for error cases"""
@@ -64,3 +101,104 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp when error occurred")
 
     details: str | None = Field(default=None, description="Additional error details")
+
+    @classmethod
+    def from_exception(cls, error: Exception) -> "ErrorResponse":
+        """Create error DTO from an exception raised while summarizing"""
+        if isinstance(error, ValueError):
+            return cls(error=str(error), error_code="VALIDATION_ERROR", details="Request validation failed")
+
+        if isinstance(error, CircuitOpenError):
+            return cls(
+                error=str(error),
+                error_code="UPSTREAM_UNAVAILABLE",
+                details=f"Retry after {error.retry_after:.0f} seconds",
+            )
+
+        if isinstance(error, ServiceOverloadedError):
+            return cls(
+                error=str(error),
+                error_code="SERVICE_OVERLOADED",
+                details=f"Retry after {error.retry_after:.0f} seconds",
+            )
+
+        if isinstance(error, RuntimeError):
+            return cls(error=str(error), error_code="SUMMARIZATION_ERROR", details="Failed to generate summary")
+
+        return cls(error="Internal server error", error_code="INTERNAL_ERROR", details=str(error))
+
+
+class SummaryBatchItemResponse(BaseModel):
+    """Response DTO for one item of a batch summarization"""
+
+    index: int = Field(..., description="Position of the item in the batch request")
+
+    status: str = Field(..., description="Item status: success or error")
+
+    result: SummaryResponse | None = Field(default=None, description="Summary when the item succeeded")
+
+    error: ErrorResponse | None = Field(default=None, description="Error when the item failed")
+
+
+class SummaryBatchResponse(BaseModel):
+    """Response DTO for batch text summarization"""
+
+    items: list[SummaryBatchItemResponse] = Field(..., description="Per-item results in request order")
+
+    total: int = Field(..., description="Number of items in the batch")
+
+    succeeded: int = Field(..., description="Number of items summarized successfully")
+
+    failed: int = Field(..., description="Number of items that failed")
+
+    @classmethod
+    def from_items(cls, items: list[SummaryBatchItemResponse]) -> "SummaryBatchResponse":
+        """Create batch response DTO from per-item responses"""
+        succeeded = sum(1 for item in items if item.status == "success")
+        return cls(items=items, total=len(items), succeeded=succeeded, failed=len(items) - succeeded)
+
+
+class SummaryListResponse(BaseModel):
+    """Response DTO for a page of stored summaries"""
+
+    items: list[SummaryResponse] = Field(..., description="Summaries, newest first")
+
+    total: int = Field(..., description="Number of summaries matching the filters")
+
+    limit: int = Field(..., description="Maximum number of summaries in this page")
+
+    offset: int = Field(..., description="Number of summaries skipped")
+
+
+class SummaryJobResponse(BaseModel):
+    """Response DTO for a background summarization job"""
+
+    id: str = Field(..., description="Unique identifier for the job")
+
+    status: str = Field(..., description="Job status: queued, running, succeeded or failed")
+
+    priority: int = Field(..., description="Queue priority; higher runs first")
+
+    attempts: int = Field(..., description="Attempts started so far")
+
+    created_at: datetime = Field(..., description="Timestamp when the job was submitted")
+
+    updated_at: datetime = Field(..., description="Timestamp of the latest status change")
+
+    result: SummaryResponse | None = Field(default=None, description="Summary once the job succeeded")
+
+    error: ErrorResponse | None = Field(default=None, description="Error of the latest failed attempt")
+
+    @classmethod
+    def from_domain_entity(cls, job: SummaryJob) -> "SummaryJobResponse":
+        """Create response DTO from domain entity"""
+        return cls(
+            id=job.id,
+            status=job.status,
+            priority=job.priority,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            result=SummaryResponse.model_validate(job.result) if job.result is not None else None,
+            error=ErrorResponse.model_validate(job.error) if job.error is not None else None,
+        )
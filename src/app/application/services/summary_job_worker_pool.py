@@ -0,0 +1,155 @@
+"""Background workers draining the summary job queue"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from app.application.dtos.requests.summary_request import SummaryRequest
+from app.application.dtos.responses.summary_response import ErrorResponse, SummaryJobResponse
+from app.application.use_cases.summary_use_cases import SummarizeTextUseCase
+from app.domain.entities.summary_job import JOB_FAILED, JOB_SUCCEEDED, SummaryJob
+from app.domain.exceptions import ServiceOverloadedError
+from app.domain.repositories.summary_job_queue import SummaryJobQueue
+
+
+class SummaryJobWorkerPool:
+    """
+    Run queued summarization jobs with a fixed number of workers
+
+    Jobs go through the same use case, and thus the same admission control,
+    as synchronous requests; the queue absorbs bursts instead of the
+    admission controller rejecting them. Failed attempts are retried with
+    exponential backoff and jitter. Invalid requests fail at once.
+    """
+
+    def __init__(
+        self,
+        job_queue: SummaryJobQueue,
+        summarize_text_use_case: SummarizeTextUseCase,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 900.0,
+        retry_backoff: float = 2.0,
+        retry_backoff_max: float = 300.0,
+        notify: Callable[[str, dict], Awaitable[bool]] | None = None,
+    ):
+        """
+        Initialize summary job worker pool
+
+        Args:
+            job_queue: Durable queue to drain
+            summarize_text_use_case: Use case running each job
+            workers: Number of jobs processed at the same time
+            poll_interval: Seconds an idle worker waits before checking the queue again
+            lease_seconds: Seconds a job may run before another worker may claim it
+            retry_backoff: Seconds before the first retry, doubling with each attempt
+            retry_backoff_max: Upper bound of the retry delay
+            notify: Delivers finished jobs to a callback URL
+        """
+        self.job_queue = job_queue
+        self.summarize_text_use_case = summarize_text_use_case
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.notify = notify
+
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._notifications: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the workers (idempotent)"""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs are claimed again once their lease expires"""
+        tasks = [*self._tasks, *self._notifications]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._notifications.clear()
+
+    def wake(self) -> None:
+        """Tell idle workers that a job was queued"""
+        self._wakeup.set()
+
+    async def run_once(self) -> bool:
+        """
+        Claim and process one job
+
+        Returns:
+            True if a job was processed, False when none was ready
+        """
+        job = await self.job_queue.claim(self.lease_seconds)
+        if job is None:
+            return False
+        await self._process(job)
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                if await self.run_once():
+                    continue
+            except Exception:
+                # Storage errors must not kill the worker; try again after the poll interval
+                pass
+            try:
+                async with asyncio.timeout(self.poll_interval):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+
+    async def _process(self, job: SummaryJob) -> None:
+        """Run one attempt of a job and record its outcome"""
+        if job.attempts > job.max_attempts:
+            # The lease of the last attempt expired, e.g. because the process died mid-job
+            error = ErrorResponse(error="Job did not finish in time", error_code="JOB_EXPIRED")
+            await self._fail(job, error)
+            return
+
+        try:
+            response = await self.summarize_text_use_case.execute(SummaryRequest.model_validate(job.request))
+        except ValueError as e:
+            await self._fail(job, ErrorResponse.from_exception(e))
+        except Exception as e:
+            error = ErrorResponse.from_exception(e)
+            if job.attempts >= job.max_attempts:
+                await self._fail(job, error)
+            else:
+                await self.job_queue.retry(job.id, error.model_dump(mode="json"), self._retry_delay(job, e))
+        else:
+            result = response.model_dump(mode="json")
+            # The stored job carries the callbacks identical submissions attached while it ran
+            finished = await self.job_queue.complete(job.id, result)
+            self.deliver(finished or replace(job, status=JOB_SUCCEEDED, result=result))
+
+    async def _fail(self, job: SummaryJob, error: ErrorResponse) -> None:
+        payload = error.model_dump(mode="json")
+        finished = await self.job_queue.fail(job.id, payload)
+        self.deliver(finished or replace(job, status=JOB_FAILED, error=payload))
+
+    def _retry_delay(self, job: SummaryJob, error: Exception) -> float:
+        """Exponential backoff with jitter, never sooner than an overload hint asks for"""
+        delay = min(self.retry_backoff_max, self.retry_backoff * 2 ** (job.attempts - 1))
+        delay *= random.uniform(0.5, 1.0)
+        if isinstance(error, ServiceOverloadedError):
+            delay = max(delay, error.retry_after)
+        return delay
+
+    def deliver(self, job: SummaryJob, callback_urls: list[str] | None = None) -> None:
+        """Send a finished job to callback URLs, by default all of its own, without holding up the caller"""
+        callback_urls = job.callback_urls if callback_urls is None else callback_urls
+        if not callback_urls or self.notify is None:
+            return
+        payload = SummaryJobResponse.from_domain_entity(job).model_dump(mode="json")
+        for url in callback_urls:
+            task = asyncio.create_task(self.notify(url, payload))
+            self._notifications.add(task)
+            task.add_done_callback(self._notifications.discard)
@@ -1,28 +1,58 @@
 """Summary use cases"""
 
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from pydantic import ValidationError
+
 from app.application.dtos.requests.summary_request import (
     HealthCheckRequest,
+    SummaryBatchRequest,
+    SummaryJobRequest,
+    SummaryListRequest,
     SummaryRequest,
 )
 from app.application.dtos.responses.summary_response import (
+    ErrorResponse,
     HealthCheckResponse,
+    SummaryBatchItemResponse,
+    SummaryBatchResponse,
+    SummaryDeltaResponse,
+    SummaryJobResponse,
+    SummaryListResponse,
     SummaryResponse,
 )
+from app.domain.entities.summary_job import SummaryJob
+from app.domain.repositories.summary_job_queue import SummaryJobQueue
+from app.domain.repositories.summary_store import SummaryStore
+from app.domain.services.hierarchical_summary_service import HierarchicalSummaryService
 from app.domain.services.summary_service import SummaryService
-from app.domain.value_objects.summary_config import SummaryConfig
+from app.domain.value_objects.content_key import summary_key
+from app.domain.value_objects.summary_config import SummaryBudget, SummaryConfig
 
 
 class SummarizeTextUseCase:
     """Use case for text summarization"""
 
-    def __init__(self, summary_service: SummaryService):
+    def __init__(
+        self,
+        summary_service: SummaryService,
+        hierarchical_summary_service: HierarchicalSummaryService | None = None,
+        summary_store: SummaryStore | None = None,
+    ):
         """
         Initialize summarize text use case
 
         Args:
             summary_service: Domain service for text summarization
+            hierarchical_summary_service: Domain service for chunked summarization of long text
+            summary_store: Keeps generated summaries for later lookup
         """
         self.summary_service = summary_service
+        self.hierarchical_summary_service = hierarchical_summary_service
+        self.summary_store = summary_store
 
     async def execute(self, request: SummaryRequest) -> SummaryResponse:
         """
@@ -44,6 +74,7 @@ class SummarizeTextUseCase:
             temperature=request.temperature,
             summary_type=request.summary_type,
             language=request.language,
+            reasoning=request.reasoning,
         )
 
         # Validate configuration
@@ -51,23 +82,372 @@ class SummarizeTextUseCase:
             raise ValueError("Invalid summary configuration")
 
         # Perform summarization
-        summary = await self.summary_service.summarize_text(text=request.text, config=config)
+        if self._is_hierarchical(request):
+            budget = SummaryBudget(max_tokens=request.token_budget, max_seconds=request.time_budget)
+            summary = await self.hierarchical_summary_service.summarize_text(request.text, config, budget)
+        else:
+            summary = await self.summary_service.summarize_text(text=request.text, config=config)
+
+        if self.summary_store is not None:
+            await self.summary_store.add(summary)
 
         # Convert to response DTO
         return SummaryResponse.from_domain_entity(summary)
 
+    def _is_hierarchical(self, request: SummaryRequest) -> bool:
+        """Whether the request goes through chunked summarization"""
+        if self.hierarchical_summary_service is None or request.strategy == "single":
+            return False
+
+        if request.strategy == "hierarchical" or request.token_budget or request.time_budget:
+            return True
+
+        return self.hierarchical_summary_service.needs_chunking(request.text)
+
+
+class SummarizeTextStreamUseCase:
+    """Use case for streaming text summarization"""
+
+    def __init__(self, summary_service: SummaryService, summary_store: SummaryStore | None = None):
+        """
+        Initialize summarize text stream use case
+
+        Args:
+            summary_service: Domain service for text summarization
+            summary_store: Keeps generated summaries for later lookup
+        """
+        self.summary_service = summary_service
+        self.summary_store = summary_store
+
+    async def execute(self, request: SummaryRequest) -> AsyncIterator[SummaryDeltaResponse | SummaryResponse]:
+        """
+        Execute streaming text summarization use case
+
+        Validation runs before the stream is returned, so request errors
+        surface before any output is sent.
+
+        Args:
+            request: Summary request DTO
+
+        Returns:
+            Async iterator of summary deltas ending with the summary response DTO
+
+        Raises:
+            ValueError: If request validation fails
+        """
+        config = SummaryConfig(
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            summary_type=request.summary_type,
+            language=request.language,
+            reasoning=request.reasoning,
+        )
+
+        if not self.summary_service.validate_summary_config(config):
+            raise ValueError("Invalid summary configuration")
+
+        chunks = self.summary_service.summarize_text_stream(text=request.text, config=config)
+        return self._to_responses(chunks)
+
+    async def _to_responses(self, chunks) -> AsyncIterator[SummaryDeltaResponse | SummaryResponse]:
+        """Convert domain chunks to response DTOs"""
+        async for chunk in chunks:
+            if chunk.summary is not None:
+                if self.summary_store is not None:
+                    await self.summary_store.add(chunk.summary)
+                yield SummaryResponse.from_domain_entity(chunk.summary)
+            elif chunk.text:
+                yield SummaryDeltaResponse(text=chunk.text)
+
+
+class SummarizeBatchUseCase:
+    """Use case for batch text summarization with bounded concurrency"""
+
+    def __init__(self, summarize_text_use_case: SummarizeTextUseCase, max_items: int = 100, max_concurrency: int = 4):
+        """
+        Initialize summarize batch use case
+
+        Args:
+            summarize_text_use_case: Use case summarizing a single request
+            max_items: Maximum number of items accepted in one batch
+            max_concurrency: Maximum number of items summarized at the same time
+        """
+        self.summarize_text_use_case = summarize_text_use_case
+        self.max_items = max_items
+        self.max_concurrency = max_concurrency
+
+    async def execute(self, request: SummaryBatchRequest) -> SummaryBatchResponse:
+        """
+        Execute batch summarization use case
+
+        Args:
+            request: Batch summary request DTO
+
+        Returns:
+            Batch response DTO with per-item results in request order
+
+        Raises:
+            ValueError: If the batch exceeds the maximum number of items
+        """
+        self._validate(request)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        items = await asyncio.gather(
+            *(self._summarize_item(index, item, semaphore) for index, item in enumerate(request.items))
+        )
+        return SummaryBatchResponse.from_items(list(items))
+
+    def execute_stream(self, request: SummaryBatchRequest) -> AsyncIterator[SummaryBatchItemResponse]:
+        """
+        Execute batch summarization use case, yielding items as they finish
+
+        Args:
+            request: Batch summary request DTO
+
+        Returns:
+            Async iterator of per-item responses in completion order
+
+        Raises:
+            ValueError: If the batch exceeds the maximum number of items
+        """
+        self._validate(request)
+        return self._stream_items(request)
+
+    async def _stream_items(self, request: SummaryBatchRequest) -> AsyncIterator[SummaryBatchItemResponse]:
+        """Yield per-item responses in completion order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._summarize_item(index, item, semaphore))
+            for index, item in enumerate(request.items)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _summarize_item(self, index: int, item: Any, semaphore: asyncio.Semaphore) -> SummaryBatchItemResponse:
+        """Validate and summarize one item, capturing its failure instead of aborting the batch"""
+        try:
+            item = self._parse_item(item)
+        except ValueError as e:
+            return SummaryBatchItemResponse(index=index, status="error", error=ErrorResponse.from_exception(e))
+
+        async with semaphore:
+            try:
+                result = await self.summarize_text_use_case.execute(item)
+                return SummaryBatchItemResponse(index=index, status="success", result=result)
+            except Exception as e:
+                return SummaryBatchItemResponse(index=index, status="error", error=ErrorResponse.from_exception(e))
+
+    @staticmethod
+    def _parse_item(item: Any) -> SummaryRequest:
+        """Validate a raw batch item as a summary request"""
+        try:
+            return SummaryRequest.model_validate(item)
+        except ValidationError as e:
+            raise ValueError(
+                "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in e.errors()
+                )
+            ) from e
+
+    def _validate(self, request: SummaryBatchRequest) -> None:
+        """Validate batch size"""
+        if len(request.items) > self.max_items:
+            raise ValueError(f"Batch is too large (maximum {self.max_items} items)")
+
+
+class SubmitSummaryJobUseCase:
+    """Use case for queueing a summarization to run in the background"""
+
+    def __init__(
+        self,
+        summary_service: SummaryService,
+        job_queue: SummaryJobQueue,
+        max_attempts: int = 3,
+        on_enqueued: Callable[[], None] | None = None,
+        check_callback_url: Callable[[str], None] | None = None,
+        deliver: Callable[[SummaryJob, list[str]], None] | None = None,
+    ):
+        """
+        Initialize submit summary job use case
+
+        Args:
+            summary_service: Domain service for text summarization
+            job_queue: Durable queue drained by the job workers
+            max_attempts: Attempts per job before it is marked failed
+            on_enqueued: Called after a new job is stored, e.g. to wake idle workers
+            check_callback_url: Raises ValueError for callback URLs that may not be called
+            deliver: Sends an already finished job to the callback URLs of a resubmission
+        """
+        self.summary_service = summary_service
+        self.job_queue = job_queue
+        self.max_attempts = max_attempts
+        self.on_enqueued = on_enqueued
+        self.check_callback_url = check_callback_url
+        self.deliver = deliver
+
+    async def execute(self, request: SummaryJobRequest) -> SummaryJobResponse:
+        """
+        Execute submit summary job use case
+
+        Identical requests share one job, so resubmitting returns the existing job;
+        the resubmission's callback URL is notified as well.
+
+        Args:
+            request: Summary job request DTO
+
+        Returns:
+            Job response DTO
+
+        Raises:
+            ValueError: If request validation fails
+        """
+        config = SummaryConfig(
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            summary_type=request.summary_type,
+            language=request.language,
+            reasoning=request.reasoning,
+        )
+        if not self.summary_service.validate_summary_config(config):
+            raise ValueError("Invalid summary configuration")
+        if request.callback_url is not None and self.check_callback_url is not None:
+            self.check_callback_url(request.callback_url)
+
+        options = {
+            "strategy": request.strategy,
+            "token_budget": request.token_budget,
+            "time_budget": request.time_budget,
+        }
+        callback_urls = [request.callback_url] if request.callback_url is not None else []
+        job = SummaryJob(
+            id=str(uuid.uuid4()),
+            request=request.model_dump(mode="json", exclude={"priority", "callback_url"}),
+            dedup_key=summary_key(request.text, config, options),
+            priority=request.priority,
+            max_attempts=self.max_attempts,
+            callback_urls=callback_urls,
+        )
+        stored = await self.job_queue.enqueue(job)
+        if stored.id == job.id and self.on_enqueued is not None:
+            self.on_enqueued()
+        elif stored.is_finished and callback_urls and self.deliver is not None:
+            # The existing job will not be delivered again, so notify this submitter now
+            self.deliver(stored, callback_urls)
+        return SummaryJobResponse.from_domain_entity(stored)
+
+
+class GetSummaryJobUseCase:
+    """Use case for looking up a background summarization job"""
+
+    def __init__(self, job_queue: SummaryJobQueue):
+        """
+        Initialize get summary job use case
+
+        Args:
+            job_queue: Durable queue holding the jobs
+        """
+        self.job_queue = job_queue
+
+    async def execute(self, job_id: str) -> SummaryJobResponse | None:
+        """
+        Execute get summary job use case
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job response DTO, or None when the job is unknown
+        """
+        job = await self.job_queue.get(job_id)
+        return SummaryJobResponse.from_domain_entity(job) if job is not None else None
+
+
+class GetSummaryUseCase:
+    """Use case for looking up a stored summary"""
+
+    def __init__(self, summary_store: SummaryStore):
+        """
+        Initialize get summary use case
+
+        Args:
+            summary_store: Store of generated summaries
+        """
+        self.summary_store = summary_store
+
+    async def execute(self, summary_id: str) -> SummaryResponse | None:
+        """
+        Execute get summary use case
+
+        Args:
+            summary_id: Summary identifier
+
+        Returns:
+            Summary response DTO, or None when the summary is unknown
+        """
+        summary = await self.summary_store.get(summary_id)
+        return SummaryResponse.from_domain_entity(summary) if summary is not None else None
+
+
+class ListSummariesUseCase:
+    """Use case for paging through stored summaries"""
+
+    def __init__(self, summary_store: SummaryStore):
+        """
+        Initialize list summaries use case
+
+        Args:
+            summary_store: Store of generated summaries
+        """
+        self.summary_store = summary_store
+
+    async def execute(self, request: SummaryListRequest) -> SummaryListResponse:
+        """
+        Execute list summaries use case
+
+        Args:
+            request: Page and filters
+
+        Returns:
+            Page of summary response DTOs, newest first
+        """
+        summaries, total = await self.summary_store.list_summaries(
+            limit=request.limit,
+            offset=request.offset,
+            model_name=request.model_name,
+            content_hash=request.content_hash,
+        )
+        return SummaryListResponse(
+            items=[SummaryResponse.from_domain_entity(summary) for summary in summaries],
+            total=total,
+            limit=request.limit,
+            offset=request.offset,
+        )
+
 
 class HealthCheckUseCase:
     """Use case for service health check"""
 
-    def __init__(self, summary_service: SummaryService):
+    def __init__(
+        self,
+        summary_service: SummaryService,
+        circuit_states: Callable[[], dict[str, str]] | None = None,
+        readiness: Callable[[], dict[str, bool | None]] | None = None,
+    ):
         """
         Initialize health check use case
 
         Args:
             summary_service: Domain service for text summarization
+            circuit_states: Reports the circuit breaker state per upstream endpoint
+            readiness: Reports the latest generation probe per upstream endpoint
         """
         self.summary_service = summary_service
+        self.circuit_states = circuit_states
+        self.readiness = readiness
 
     async def execute(self, request: HealthCheckRequest) -> HealthCheckResponse:
         """
@@ -79,13 +459,31 @@ class HealthCheckUseCase:
         Returns:
             Health check response DTO
         """
+        circuit_breakers = self.circuit_states() if self.circuit_states is not None else None
+        ready = self.readiness() if self.readiness is not None else None
+
         try:
             is_healthy = await self.summary_service.check_service_health()
 
             if is_healthy:
-                return HealthCheckResponse(status="healthy", details="LMStudio service is responding correctly")
+                return HealthCheckResponse(
+                    status="healthy",
+                    details="LMStudio service is responding correctly",
+                    circuit_breakers=circuit_breakers,
+                    ready=ready,
+                )
             else:
-                return HealthCheckResponse(status="unhealthy", details="LMStudio service is not responding")
+                return HealthCheckResponse(
+                    status="unhealthy",
+                    details="LMStudio service is not responding",
+                    circuit_breakers=circuit_breakers,
+                    ready=ready,
+                )
 
         except Exception as e:
-            return HealthCheckResponse(status="unhealthy", details=f"Health check failed: {str(e)}")
+            return HealthCheckResponse(
+                status="unhealthy",
+                details=f"Health check failed: {str(e)}",
+                circuit_breakers=circuit_breakers,
+                ready=ready,
+            )
@@ -2,16 +2,76 @@
 
 from dependency_injector import containers, providers
 
+from app.application.services.summary_job_worker_pool import SummaryJobWorkerPool
 from app.application.use_cases.summary_use_cases import (
+    GetSummaryJobUseCase,
+    GetSummaryUseCase,
     HealthCheckUseCase,
+    ListSummariesUseCase,
+    SubmitSummaryJobUseCase,
+    SummarizeBatchUseCase,
+    SummarizeTextStreamUseCase,
     SummarizeTextUseCase,
 )
 from app.config.settings import Settings
+from app.domain.services.hierarchical_summary_service import HierarchicalSummaryService
 from app.domain.services.summary_service import SummaryService
-from app.domain.value_objects.summary_config import LMStudioConfig
+from app.domain.services.text_chunker import TextChunker
+from app.domain.value_objects.summary_config import LMStudioConfig, SummaryBudget
+from app.infrastructure.cache.in_memory_summary_cache import InMemorySummaryCache
+from app.infrastructure.cache.sqlite_summary_cache import SQLiteSummaryCache
+from app.infrastructure.database.sqlite_summary_store import SQLiteSummaryStore
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.external_services.prompt_registry import PromptRegistry
+from app.infrastructure.external_services.reasoning import ReasoningPolicy
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+from app.infrastructure.external_services.upstream_health_monitor import UpstreamHealthMonitor
+from app.infrastructure.external_services.webhook_notifier import WebhookNotifier
+from app.infrastructure.jobs.sqlite_summary_job_queue import SQLiteSummaryJobQueue
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.infrastructure.repositories.cached_summary_repository import (
+    CachedSummaryRepository,
+)
 from app.infrastructure.repositories.lmstudio_summary_repository import (
     LMStudioSummaryRepository,
 )
+from app.infrastructure.repositories.routing_summary_repository import (
+    Endpoint,
+    RoutingSummaryRepository,
+)
+from app.shared.adaptive_limit import AIMDLimit
+from app.shared.admission_controller import AdmissionController
+from app.shared.circuit_breaker import CircuitBreaker
+from app.shared.rate_limiter import TokenBucketRateLimiter
+from app.shared.service_time import ServiceTimeEstimator
+from app.shared.single_flight import SingleFlight
+
+
+def create_lmstudio_endpoints(
+    base_urls: list[str],
+    default_base_url: str,
+    repository_factory: providers.Factory,
+    breaker_factory: providers.Factory,
+    max_concurrency: int | None,
+    concurrency_overrides: dict[str, int],
+) -> list[Endpoint]:
+    """Build one repository, with its own health monitor and circuit breaker, per configured endpoint"""
+    return [
+        Endpoint(
+            name=base_url,
+            repository=repository_factory(lmstudio_config__base_url=base_url, health_monitor__base_url=base_url),
+            max_concurrency=concurrency_overrides.get(base_url, max_concurrency),
+            breaker=breaker_factory(name=base_url),
+        )
+        for base_url in base_urls or [default_base_url]
+    ]
+
+
+def create_adaptive_limit(enabled: bool, limit_factory: providers.Factory) -> AIMDLimit | None:
+    """Build the adaptive concurrency limit when enabled"""
+    return limit_factory() if enabled else None
 
 
 class Container(containers.DeclarativeContainer):
@@ -20,6 +80,7 @@ class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=[
             "app.presentation.routers.health",
+            "app.presentation.routers.stats",
             "app.presentation.routers.summary",
         ],
     )
@@ -35,25 +96,274 @@ class Container(containers.DeclarativeContainer):
         max_retries=settings.provided.LMSTUDIO_MAX_RETRIES,
     )
 
+    # External services
+    llm_client_pool = providers.Singleton(
+        LLMClientPool,
+        lmstudio_config=lmstudio_config,
+        max_connections=settings.provided.LMSTUDIO_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.provided.LMSTUDIO_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.provided.LMSTUDIO_KEEPALIVE_EXPIRY,
+        http2=settings.provided.LMSTUDIO_HTTP2,
+    )
+
+    token_counter = providers.Singleton(
+        TokenCounter,
+        encoding_name=settings.provided.TOKENIZER_ENCODING,
+    )
+
+    prompt_budgeter = providers.Singleton(
+        PromptBudgeter,
+        token_counter=token_counter,
+        context_window=settings.provided.CONTEXT_WINDOW_TOKENS,
+        min_completion_tokens=settings.provided.MIN_COMPLETION_TOKENS,
+        overflow_policy=settings.provided.CONTEXT_OVERFLOW_POLICY,
+    )
+
+    reasoning_policy = providers.Singleton(
+        ReasoningPolicy,
+        enabled=settings.provided.REASONING_ENABLED,
+        models=settings.provided.REASONING_MODELS,
+        thinking_models=settings.provided.REASONING_THINKING_MODELS,
+        disable_method=settings.provided.REASONING_DISABLE_METHOD,
+    )
+
+    prompt_registry = providers.Singleton(
+        PromptRegistry,
+        prompt_budgeter=prompt_budgeter,
+        templates_path=settings.provided.PROMPT_TEMPLATES_PATH,
+    )
+
+    # Caches
+    summary_cache_backend = providers.Selector(
+        settings.provided.SUMMARY_CACHE_BACKEND,
+        memory=providers.Object(None),
+        sqlite=providers.Singleton(
+            SQLiteSummaryCache,
+            path=settings.provided.SUMMARY_CACHE_SQLITE_PATH,
+            max_entries=settings.provided.SUMMARY_CACHE_SQLITE_MAX_ENTRIES,
+            ttl=settings.provided.SUMMARY_CACHE_TTL,
+        ),
+    )
+
+    summary_cache = providers.Singleton(
+        InMemorySummaryCache,
+        max_entries=settings.provided.SUMMARY_CACHE_MAX_ENTRIES,
+        ttl=settings.provided.SUMMARY_CACHE_TTL,
+        backend=summary_cache_backend,
+    )
+
+    # Summary Store
+    summary_store = providers.Singleton(
+        SQLiteSummaryStore,
+        path=settings.provided.SUMMARY_STORE_SQLITE_PATH,
+        batch_size=settings.provided.SUMMARY_STORE_BATCH_SIZE,
+        flush_interval=settings.provided.SUMMARY_STORE_FLUSH_INTERVAL,
+        max_pending=settings.provided.SUMMARY_STORE_MAX_PENDING,
+    )
+
+    # Job Queue
+    summary_job_queue = providers.Singleton(
+        SQLiteSummaryJobQueue,
+        path=settings.provided.JOBS_SQLITE_PATH,
+        retention=settings.provided.JOBS_RETENTION,
+    )
+
+    webhook_notifier = providers.Singleton(
+        WebhookNotifier,
+        timeout=settings.provided.JOBS_WEBHOOK_TIMEOUT,
+        max_attempts=settings.provided.JOBS_WEBHOOK_MAX_ATTEMPTS,
+        allowed_hosts=settings.provided.JOBS_WEBHOOK_ALLOWED_HOSTS,
+        allow_private=settings.provided.JOBS_WEBHOOK_ALLOW_PRIVATE,
+    )
+
     # Repositories
-    summary_repository = providers.Factory(
+    lmstudio_summary_repository = providers.Factory(
         LMStudioSummaryRepository,
         lmstudio_config=lmstudio_config,
+        client_pool=llm_client_pool,
+        max_cached_clients=settings.provided.LMSTUDIO_CLIENT_CACHE_SIZE,
+        prompt_budgeter=prompt_budgeter,
+        prompt_registry=prompt_registry,
+        client_backend=settings.provided.LLM_CLIENT_BACKEND,
+        reasoning_policy=reasoning_policy,
+        health_monitor=providers.Factory(
+            UpstreamHealthMonitor,
+            client_pool=llm_client_pool,
+            model_name=settings.provided.DEFAULT_MODEL_NAME,
+            ttl=settings.provided.LMSTUDIO_HEALTH_CHECK_TTL,
+            deep_interval=settings.provided.LMSTUDIO_HEALTH_CHECK_DEEP_INTERVAL,
+            probe_timeout=settings.provided.LMSTUDIO_HEALTH_CHECK_TIMEOUT,
+        ),
+    )
+
+    circuit_breaker = providers.Factory(
+        CircuitBreaker,
+        failure_threshold=settings.provided.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout=settings.provided.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        half_open_max_calls=settings.provided.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+    )
+
+    lmstudio_endpoints = providers.Singleton(
+        create_lmstudio_endpoints,
+        base_urls=settings.provided.LMSTUDIO_BASE_URLS,
+        default_base_url=settings.provided.LMSTUDIO_BASE_URL,
+        repository_factory=lmstudio_summary_repository.provider,
+        breaker_factory=circuit_breaker.provider,
+        max_concurrency=settings.provided.LMSTUDIO_ENDPOINT_MAX_CONCURRENCY,
+        concurrency_overrides=settings.provided.LMSTUDIO_ENDPOINT_CONCURRENCY,
+    )
+
+    routing_summary_repository = providers.Singleton(
+        RoutingSummaryRepository,
+        endpoints=lmstudio_endpoints,
+        strategy=settings.provided.LMSTUDIO_ROUTING_STRATEGY,
+        hedging=settings.provided.HEDGING_ENABLED,
+        hedge_quantile=settings.provided.HEDGING_LATENCY_QUANTILE,
+        hedge_min_delay=settings.provided.HEDGING_MIN_DELAY,
+        hedge_min_samples=settings.provided.HEDGING_MIN_SAMPLES,
+    )
+
+    admission_controller = providers.Singleton(
+        AdmissionController,
+        max_in_flight=settings.provided.ADMISSION_MAX_IN_FLIGHT,
+        max_queue=settings.provided.ADMISSION_MAX_QUEUE,
+        queue_timeout=settings.provided.ADMISSION_QUEUE_TIMEOUT,
+        lane_weights=settings.provided.PRIORITY_LANE_WEIGHTS,
+        default_lane=settings.provided.PRIORITY_DEFAULT_LANE,
+        aging_seconds=settings.provided.PRIORITY_AGING_SECONDS,
+        shortest_first=settings.provided.ADMISSION_SHORTEST_FIRST,
+        adaptive_limit=providers.Singleton(
+            create_adaptive_limit,
+            enabled=settings.provided.ADMISSION_ADAPTIVE,
+            limit_factory=providers.Factory(
+                AIMDLimit,
+                initial_limit=settings.provided.ADMISSION_MAX_IN_FLIGHT,
+                min_limit=settings.provided.ADMISSION_ADAPTIVE_MIN_IN_FLIGHT,
+                max_limit=settings.provided.ADMISSION_ADAPTIVE_MAX_IN_FLIGHT,
+                tolerance=settings.provided.ADMISSION_ADAPTIVE_TOLERANCE,
+                backoff_ratio=settings.provided.ADMISSION_ADAPTIVE_BACKOFF,
+            ).provider,
+        ),
+    )
+
+    service_time_estimator = providers.Singleton(ServiceTimeEstimator)
+
+    rate_limiter = providers.Singleton(
+        TokenBucketRateLimiter,
+        tokens_per_minute=settings.provided.RATE_LIMIT_TOKENS_PER_MINUTE,
+        capacity=settings.provided.RATE_LIMIT_BURST_TOKENS,
+        key_tokens_per_minute=settings.provided.RATE_LIMIT_API_KEY_TOKENS_PER_MINUTE,
+    )
+
+    admission_controlled_summary_repository = providers.Singleton(
+        AdmissionControlledSummaryRepository,
+        summary_repository=routing_summary_repository,
+        admission_controller=admission_controller,
+        service_time_estimator=service_time_estimator,
+        count_tokens=token_counter,
+    )
+
+    summary_repository = providers.Singleton(
+        CachedSummaryRepository,
+        summary_repository=admission_controlled_summary_repository,
+        cache=summary_cache,
+        enabled=settings.provided.SUMMARY_CACHE_ENABLED,
+        cache_nondeterministic=settings.provided.SUMMARY_CACHE_NONDETERMINISTIC,
+        prompt_registry=prompt_registry,
     )
 
     # Services
+    single_flight = providers.Singleton(SingleFlight)
+
     summary_service = providers.Factory(
         SummaryService,
         summary_repository=summary_repository,
+        single_flight=single_flight,
+    )
+
+    text_chunker = providers.Singleton(
+        TextChunker,
+        max_chunk_tokens=settings.provided.HIERARCHICAL_CHUNK_TOKENS,
+        overlap_tokens=settings.provided.HIERARCHICAL_CHUNK_OVERLAP_TOKENS,
+        count_tokens=token_counter,
+    )
+
+    hierarchical_summary_service = providers.Factory(
+        HierarchicalSummaryService,
+        summary_service=summary_service,
+        chunker=text_chunker,
+        single_pass_max_tokens=settings.provided.HIERARCHICAL_SINGLE_PASS_MAX_TOKENS,
+        max_text_length=settings.provided.HIERARCHICAL_MAX_TEXT_LENGTH,
+        max_concurrency=settings.provided.HIERARCHICAL_MAX_CONCURRENCY,
+        max_depth=settings.provided.HIERARCHICAL_MAX_DEPTH,
+        default_budget=providers.Factory(
+            SummaryBudget,
+            max_tokens=settings.provided.HIERARCHICAL_TOKEN_BUDGET,
+            max_seconds=settings.provided.HIERARCHICAL_TIME_BUDGET,
+        ),
     )
 
     # Use Cases
     summarize_text_use_case = providers.Factory(
         SummarizeTextUseCase,
         summary_service=summary_service,
+        hierarchical_summary_service=hierarchical_summary_service,
+        summary_store=summary_store,
+    )
+
+    summarize_text_stream_use_case = providers.Factory(
+        SummarizeTextStreamUseCase,
+        summary_service=summary_service,
+        summary_store=summary_store,
+    )
+
+    summarize_batch_use_case = providers.Factory(
+        SummarizeBatchUseCase,
+        summarize_text_use_case=summarize_text_use_case,
+        max_items=settings.provided.BATCH_MAX_ITEMS,
+        max_concurrency=settings.provided.BATCH_MAX_CONCURRENCY,
+    )
+
+    get_summary_use_case = providers.Factory(
+        GetSummaryUseCase,
+        summary_store=summary_store,
+    )
+
+    list_summaries_use_case = providers.Factory(
+        ListSummariesUseCase,
+        summary_store=summary_store,
+    )
+
+    summary_job_worker_pool = providers.Singleton(
+        SummaryJobWorkerPool,
+        job_queue=summary_job_queue,
+        summarize_text_use_case=summarize_text_use_case,
+        workers=settings.provided.JOBS_WORKERS,
+        poll_interval=settings.provided.JOBS_POLL_INTERVAL,
+        lease_seconds=settings.provided.JOBS_LEASE_SECONDS,
+        retry_backoff=settings.provided.JOBS_RETRY_BACKOFF,
+        retry_backoff_max=settings.provided.JOBS_RETRY_BACKOFF_MAX,
+        notify=webhook_notifier.provided.notify,
+    )
+
+    submit_summary_job_use_case = providers.Factory(
+        SubmitSummaryJobUseCase,
+        summary_service=summary_service,
+        job_queue=summary_job_queue,
+        max_attempts=settings.provided.JOBS_MAX_ATTEMPTS,
+        on_enqueued=summary_job_worker_pool.provided.wake,
+        check_callback_url=webhook_notifier.provided.check_url,
+        deliver=summary_job_worker_pool.provided.deliver,
+    )
+
+    get_summary_job_use_case = providers.Factory(
+        GetSummaryJobUseCase,
+        job_queue=summary_job_queue,
     )
 
     health_check_use_case = providers.Factory(
         HealthCheckUseCase,
         summary_service=summary_service,
+        circuit_states=routing_summary_repository.provided.circuit_states,
+        readiness=routing_summary_repository.provided.readiness,
     )
@@ -1,9 +1,14 @@
 """Application lifespan management"""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.infrastructure.repositories.lmstudio_summary_repository import load_langchain
+from app.shared.metrics import mark_process_dead
+from app.shared.priority import Priority, priority_scope
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -17,7 +22,48 @@ async def lifespan(app: FastAPI):
         packages=container.wiring_config.packages,
     )
 
+    llm_client_pool = container.llm_client_pool()
+    await llm_client_pool.open()
+
+    token_counter = container.token_counter()
+    await asyncio.to_thread(token_counter.load)
+    print(f"Tokenizer: {token_counter.backend}")
+
+    # Compiled after the tokenizer is loaded so the precomputed counts use it
+    prompt_registry = container.prompt_registry()
+    await asyncio.to_thread(prompt_registry.load)
+    print(f"Prompt templates: {prompt_registry.version} ({len(prompt_registry)} prompts)")
+
+    health_monitors = [endpoint.repository.health_monitor for endpoint in container.lmstudio_endpoints()]
+    for health_monitor in health_monitors:
+        health_monitor.start()
+
+    summary_store = container.summary_store()
+    await summary_store.start()
+
+    settings = app.state.settings
+    job_workers = container.summary_job_worker_pool()
+    # The workers' tasks inherit the lane, so queued jobs yield to interactive requests
+    with priority_scope(Priority(settings.PRIORITY_JOBS_LANE, "jobs")):
+        job_workers.start()
+
+    # Imported off the event loop after startup so readiness does not wait for LangChain
+    warmup = None
+    if settings.LLM_CLIENT_BACKEND == "langchain" and settings.LLM_CLIENT_WARMUP:
+        warmup = asyncio.create_task(asyncio.to_thread(load_langchain))
+
     yield
 
     print("Shutting down llmplan...")
+    if warmup is not None:
+        await warmup
+    await job_workers.stop()
+    await container.webhook_notifier().close()
+    await container.summary_job_queue().close()
+    await summary_store.close()
+    for health_monitor in health_monitors:
+        await health_monitor.stop()
+    await container.summary_cache().close()
+    await llm_client_pool.close()
     container.unwire()
+    mark_process_dead()
@@ -15,11 +15,77 @@ class Settings(BaseSettings):
 
     CORS_ALLOW_ORIGINS: list[str] = ["*"]
 
+    # Server (python -m app)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None  # unset for one per available CPU; metrics go via PROMETHEUS_MULTIPROC_DIR
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_TIMEOUT: int = 75  # longer than the usual 60s load balancer idle timeout
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = 60  # seconds in-flight requests get to finish on SIGTERM
+    SERVER_TRUSTED_PROXIES: list[str] = ["127.0.0.1"]  # peers whose X-Forwarded-For sets the client address
+
+    # Response Compression
+    GZIP_MINIMUM_SIZE: int = 1400  # bytes; smaller bodies fit in one packet and are sent uncompressed
+    GZIP_COMPRESS_LEVEL: int = 6
+
     # LMStudio Configuration
     LMSTUDIO_BASE_URL: str = "http://localhost:1234/v1"
     LMSTUDIO_API_KEY: str = "lm-studio"
     LMSTUDIO_TIMEOUT: int = 30
     LMSTUDIO_MAX_RETRIES: int = 3
+    LMSTUDIO_MAX_CONNECTIONS: int = 100
+    LMSTUDIO_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LMSTUDIO_KEEPALIVE_EXPIRY: float = 30.0
+    LMSTUDIO_HTTP2: bool = True
+    LMSTUDIO_CLIENT_CACHE_SIZE: int = 16
+    LMSTUDIO_HEALTH_CHECK_TTL: float = 10.0
+    LMSTUDIO_HEALTH_CHECK_DEEP_INTERVAL: float | None = 300.0  # unset to skip generation probes
+    LMSTUDIO_HEALTH_CHECK_TIMEOUT: float = 5.0
+    LLM_CLIENT_BACKEND: str = "langchain"  # langchain, raw (OpenAI-compatible HTTP without importing LangChain)
+    LLM_CLIENT_WARMUP: bool = True  # import the LangChain stack in the background once the app is serving
+
+    # LMStudio Endpoint Pool
+    LMSTUDIO_BASE_URLS: list[str] = []  # OpenAI-compatible endpoints to balance over; empty to use LMSTUDIO_BASE_URL
+    LMSTUDIO_ROUTING_STRATEGY: str = "least_outstanding"  # least_outstanding, ewma
+    LMSTUDIO_ENDPOINT_MAX_CONCURRENCY: int | None = None  # per-endpoint cap; unset for none
+    LMSTUDIO_ENDPOINT_CONCURRENCY: dict[str, int] = {}  # per-URL overrides of the cap
+
+    # Circuit Breaker and Hedging
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 3  # consecutive failures that take an endpoint out of rotation
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = 30.0
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = 1
+    HEDGING_ENABLED: bool = False
+    HEDGING_LATENCY_QUANTILE: float = 0.95
+    HEDGING_MIN_DELAY: float = 1.0
+    HEDGING_MIN_SAMPLES: int = 20
+
+    # Admission Control
+    ADMISSION_MAX_IN_FLIGHT: int = 4
+    ADMISSION_MAX_QUEUE: int = 64
+    ADMISSION_QUEUE_TIMEOUT: float = 10.0
+    ADMISSION_ADAPTIVE: bool = False  # adapt the limit to upstream latency, from ADMISSION_MAX_IN_FLIGHT
+    ADMISSION_ADAPTIVE_MIN_IN_FLIGHT: int = 1
+    ADMISSION_ADAPTIVE_MAX_IN_FLIGHT: int = 32
+    ADMISSION_ADAPTIVE_TOLERANCE: float = 1.5  # current over baseline latency treated as congestion
+    ADMISSION_ADAPTIVE_BACKOFF: float = 0.9  # limit multiplier on congestion or upstream failure
+    ADMISSION_SHORTEST_FIRST: bool = True  # admit waiters by expected service time instead of arrival
+
+    # Priority Lanes (weighted fair share of admission slots)
+    PRIORITY_LANE_WEIGHTS: dict[str, float] = {"interactive": 8.0, "default": 4.0, "bulk": 1.0}
+    PRIORITY_DEFAULT_LANE: str = "default"
+    PRIORITY_LANE_HEADER: str = "X-Priority"  # may only lower a caller's lane
+    PRIORITY_TENANT_HEADER: str = "X-Tenant-ID"  # trusted keys only; the tenant is a configured API key, else shared
+    PRIORITY_API_KEY_LANES: dict[str, str] = {}  # highest lane of each API key; others get the default lane
+    PRIORITY_TRUSTED_TENANT_KEYS: list[str] = []  # API keys (e.g. a gateway) that may name tenants
+    PRIORITY_AGING_SECONDS: float | None = 5.0  # waiters older than this go first, so no lane or long request starves
+    PRIORITY_JOBS_LANE: str = "bulk"  # lane of queued summary jobs
+
+    # Rate Limiting (per known API key, else per client address, in prompt + completion tokens)
+    RATE_LIMIT_ENABLED: bool = False
+    RATE_LIMIT_TOKENS_PER_MINUTE: float = 60000
+    RATE_LIMIT_BURST_TOKENS: float = 30000  # bucket size: tokens a caller may spend at once after idling
+    RATE_LIMIT_API_KEY_TOKENS_PER_MINUTE: dict[str, float] = {}  # per-key overrides; the burst scales with them
+    RATE_LIMIT_API_KEYS: list[str] = []  # further keys with their own bucket; unknown keys share their address's
 
     # Summary Configuration
     DEFAULT_MODEL_NAME: str = "qwen/qwen3-4b"
@@ -27,6 +93,65 @@ class Settings(BaseSettings):
     DEFAULT_TEMPERATURE: float = 0.3
     DEFAULT_SUMMARY_TYPE: str = "concise"
     DEFAULT_LANGUAGE: str = "korean"
+
+    # Reasoning Models
+    REASONING_ENABLED: bool = False  # default for models without an override; requests may set "reasoning"
+    REASONING_MODELS: dict[str, bool] = {}  # per-model overrides, e.g. {"qwen/qwen3-8b": true}
+    REASONING_THINKING_MODELS: list[str] = ["qwen3"]  # name fragments of models that think unless told not to
+    REASONING_DISABLE_METHOD: str = "no_think"  # no_think, chat_template_kwargs (vLLM, SGLang), none
+
+    # Token Budgeting
+    TOKENIZER_ENCODING: str | None = "cl100k_base"  # tiktoken encoding; empty to use the character estimate
+    CONTEXT_WINDOW_TOKENS: int = 8192  # context length the model is loaded with in LMStudio
+    MIN_COMPLETION_TOKENS: int = 256
+    CONTEXT_OVERFLOW_POLICY: str = "reject"  # reject, truncate
+
+    # Prompt Templates
+    PROMPT_TEMPLATES_PATH: str | None = None  # versioned JSON templates; unset for the built-in ones
+
+    # Summary Result Cache
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_BACKEND: str = "memory"  # memory, sqlite
+    SUMMARY_CACHE_MAX_ENTRIES: int = 1024
+    SUMMARY_CACHE_TTL: float = 86400
+    SUMMARY_CACHE_SQLITE_PATH: str = "data/summary_cache.sqlite3"
+    SUMMARY_CACHE_SQLITE_MAX_ENTRIES: int = 100000
+    SUMMARY_CACHE_NONDETERMINISTIC: bool = False
+
+    # Summary Store
+    SUMMARY_STORE_SQLITE_PATH: str = "data/summaries.sqlite3"
+    SUMMARY_STORE_BATCH_SIZE: int = 100  # summaries written per transaction
+    SUMMARY_STORE_FLUSH_INTERVAL: float = 0.5
+    SUMMARY_STORE_MAX_PENDING: int = 10000  # buffered summaries kept before the oldest are dropped
+
+    # Hierarchical (map-reduce) Summarization
+    HIERARCHICAL_MAX_TEXT_LENGTH: int = 1_000_000
+    HIERARCHICAL_SINGLE_PASS_MAX_TOKENS: int = 6000
+    HIERARCHICAL_CHUNK_TOKENS: int = 3000
+    HIERARCHICAL_CHUNK_OVERLAP_TOKENS: int = 200
+    HIERARCHICAL_MAX_CONCURRENCY: int = 4
+    HIERARCHICAL_MAX_DEPTH: int = 3
+    HIERARCHICAL_TOKEN_BUDGET: int | None = None
+    HIERARCHICAL_TIME_BUDGET: float | None = 600.0
+
+    # Background Summary Jobs
+    JOBS_SQLITE_PATH: str = "data/summary_jobs.sqlite3"
+    JOBS_WORKERS: int = 2  # 0 to only accept jobs and let another process drain the queue
+    JOBS_MAX_ATTEMPTS: int = 3
+    JOBS_RETRY_BACKOFF: float = 2.0
+    JOBS_RETRY_BACKOFF_MAX: float = 300.0
+    JOBS_LEASE_SECONDS: float = 900.0
+    JOBS_POLL_INTERVAL: float = 1.0
+    JOBS_RETENTION: float | None = 604800  # seconds finished jobs are kept
+    JOBS_WEBHOOK_TIMEOUT: float = 10.0
+    JOBS_WEBHOOK_MAX_ATTEMPTS: int = 3
+    JOBS_WEBHOOK_ALLOWED_HOSTS: list[str] = []  # callback hosts (and their subdomains) allowed; empty for any
+    JOBS_WEBHOOK_ALLOW_PRIVATE: bool = False  # allow callbacks to loopback, private and link-local addresses
+
+    # Batch Summarization
+    BATCH_MAX_ITEMS: int = 100
+    BATCH_MAX_CONCURRENCY: int = 4
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -14,6 +14,10 @@ class Summary:
     created_at: datetime | None = None
     model_name: str = "qwen/qwen3-4b"
     summary_length: int | None = None
+    cache_status: str | None = None  # hit, miss, bypass
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    truncated: bool = False  # part of the text was left out of the summary
 
     def __post_init__(self):
         """Post-initialization processing"""
@@ -22,3 +26,11 @@ class Summary:
 
         if self.summary_length is None and self.summary_text:
             self.summary_length = len(self.summary_text)
+
+
+@dataclass
+class SummaryChunk:
+    """Incremental piece of a streamed summary"""
+
+    text: str = ""
+    summary: Summary | None = None  # set on the final chunk only
@@ -0,0 +1,32 @@
+"""Summary job domain entity"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+@dataclass
+class SummaryJob:
+    """Summarization request queued for background processing"""
+
+    id: str
+    request: dict  # serialized summarization request
+    dedup_key: str  # content-addressed key; identical pending or finished jobs are reused
+    priority: int = 0  # higher runs first
+    status: str = JOB_QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    callback_urls: list[str] = field(default_factory=list)  # every submitter's webhook, delivered once finished
+    result: dict | None = None  # serialized summary response once succeeded
+    error: dict | None = None  # serialized error of the latest failed attempt
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a final state"""
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
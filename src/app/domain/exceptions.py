@@ -0,0 +1,32 @@
+"""Domain exceptions"""
+
+
+class ServiceOverloadedError(RuntimeError):
+    """The request was shed before reaching the model because upstream capacity is exhausted"""
+
+    def __init__(self, message: str, retry_after: float, queue_full: bool = True):
+        """
+        Initialize service overloaded error
+
+        Args:
+            message: Error message
+            retry_after: Seconds the client should wait before retrying
+            queue_full: True when rejected on arrival, False when the queue wait deadline expired
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.queue_full = queue_full
+
+
+class CircuitOpenError(ServiceOverloadedError):
+    """The request was rejected without calling the model because the backend is known to be failing"""
+
+    def __init__(self, message: str, retry_after: float):
+        """
+        Initialize circuit open error
+
+        Args:
+            message: Error message
+            retry_after: Seconds until the backend is tried again
+        """
+        super().__init__(message, retry_after, queue_full=False)
@@ -0,0 +1,42 @@
+"""Summary result cache interface"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.summary import Summary
+
+
+class SummaryCache(ABC):
+    """Abstract store for previously generated summaries"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Summary | None:
+        """
+        Get a cached summary
+
+        Args:
+            key: Content-addressed request key
+
+        Returns:
+            Cached summary, or None when missing or expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, summary: Summary) -> None:
+        """
+        Store a summary
+
+        Args:
+            key: Content-addressed request key
+            summary: Summary to cache
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the cache"""
+        return None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache counters"""
+        return {}
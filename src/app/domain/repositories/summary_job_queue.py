@@ -0,0 +1,103 @@
+"""Summary job queue interface"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.summary_job import SummaryJob
+
+
+class SummaryJobQueue(ABC):
+    """Abstract durable queue of summarization jobs"""
+
+    @abstractmethod
+    async def enqueue(self, job: SummaryJob) -> SummaryJob:
+        """
+        Add a job unless an equivalent one is already queued, running or succeeded
+
+        The callback URLs of a job that is reused are attached to the existing
+        job unless it already finished.
+
+        Args:
+            job: Job to add
+
+        Returns:
+            The stored job: the new one, or the existing job with the same dedup key
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, lease_seconds: float) -> SummaryJob | None:
+        """
+        Take the next ready job, highest priority first, and mark it running
+
+        Jobs whose lease expires without an outcome, e.g. because the worker
+        died, become claimable again.
+
+        Args:
+            lease_seconds: Seconds the claimer has to finish the job
+
+        Returns:
+            Claimed job, or None when no job is ready
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, job_id: str, result: dict) -> SummaryJob | None:
+        """
+        Mark a job succeeded
+
+        Args:
+            job_id: Job identifier
+            result: Serialized summary response
+
+        Returns:
+            The finished job with every callback attached so far, or None when unknown
+        """
+        pass
+
+    @abstractmethod
+    async def retry(self, job_id: str, error: dict, delay: float) -> None:
+        """
+        Put a failed attempt back in the queue
+
+        Args:
+            job_id: Job identifier
+            error: Serialized error of the failed attempt
+            delay: Seconds before the job may be claimed again
+        """
+        pass
+
+    @abstractmethod
+    async def fail(self, job_id: str, error: dict) -> SummaryJob | None:
+        """
+        Mark a job failed for good
+
+        Args:
+            job_id: Job identifier
+            error: Serialized error of the last attempt
+
+        Returns:
+            The finished job with every callback attached so far, or None when unknown
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> SummaryJob | None:
+        """
+        Get a job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job, or None when unknown or purged
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the queue"""
+        return None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Queue counters"""
+        return {}
@@ -1,8 +1,9 @@
 """Summary repository interface"""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from app.domain.entities.summary import Summary
+from app.domain.entities.summary import Summary, SummaryChunk
 from app.domain.value_objects.summary_config import SummaryConfig
 
 
@@ -23,6 +24,23 @@ class SummaryRepository(ABC):
         """
         pass
 
+    async def summarize_text_stream(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """
+        Summarize the given text, yielding the summary as it is generated
+
+        Repositories without native streaming yield the whole summary at once.
+
+        Args:
+            text: Text to summarize
+            config: Summary configuration
+
+        Yields:
+            Text chunks, then a final chunk carrying the complete Summary entity
+        """
+        summary = await self.summarize_text(text, config)
+        yield SummaryChunk(text=summary.summary_text)
+        yield SummaryChunk(summary=summary)
+
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -0,0 +1,70 @@
+"""Summary store interface"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.summary import Summary
+
+
+class SummaryStore(ABC):
+    """Abstract durable store of generated summaries"""
+
+    @abstractmethod
+    async def add(self, summary: Summary) -> None:
+        """
+        Store a summary
+
+        Implementations may buffer the write; a summary must be readable
+        through ``get`` as soon as this returns.
+
+        Args:
+            summary: Summary to store, identified by its id
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, summary_id: str) -> Summary | None:
+        """
+        Get a summary
+
+        Args:
+            summary_id: Summary identifier
+
+        Returns:
+            Summary, or None when unknown
+        """
+        pass
+
+    @abstractmethod
+    async def list_summaries(
+        self,
+        limit: int,
+        offset: int = 0,
+        model_name: str | None = None,
+        content_hash: str | None = None,
+    ) -> tuple[list[Summary], int]:
+        """
+        List summaries, newest first
+
+        Args:
+            limit: Maximum number of summaries returned
+            offset: Number of summaries skipped
+            model_name: Only summaries generated by this model
+            content_hash: Only summaries of this text (see ``content_hash``)
+
+        Returns:
+            Page of summaries and the total number matching the filters
+        """
+        pass
+
+    async def start(self) -> None:
+        """Start background work such as flushing buffered writes"""
+        return None
+
+    async def close(self) -> None:
+        """Write buffered summaries and release resources held by the store"""
+        return None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Store counters"""
+        return {}
@@ -0,0 +1,162 @@
+"""Map-reduce summarization for long documents"""
+
+import asyncio
+import uuid
+from datetime import datetime
+
+from app.domain.entities.summary import Summary
+from app.domain.services.summary_service import SummaryService
+from app.domain.services.text_chunker import TextChunker
+from app.domain.value_objects.summary_config import SummaryBudget, SummaryConfig
+
+
+class _BudgetTracker:
+    """Token spending against a SummaryBudget"""
+
+    def __init__(self, budget: SummaryBudget, count_tokens):
+        self.budget = budget
+        self.count_tokens = count_tokens
+        self.used_tokens = 0
+
+    def reserve(self, text: str, config: SummaryConfig) -> int:
+        """Reserve the worst-case cost of one upstream call"""
+        cost = self.count_tokens(text) + config.max_tokens
+        if self.budget.max_tokens is not None and self.used_tokens + cost > self.budget.max_tokens:
+            raise RuntimeError(f"Summarization token budget exceeded ({self.budget.max_tokens} tokens)")
+        self.used_tokens += cost
+        return cost
+
+    def settle(self, reserved: int, text: str, summary_text: str) -> None:
+        """Replace a reservation with the cost actually spent"""
+        self.used_tokens += self.count_tokens(text) + self.count_tokens(summary_text) - reserved
+
+
+class HierarchicalSummaryService:
+    """Summarize long text by summarizing chunks and then reducing the partial summaries"""
+
+    def __init__(
+        self,
+        summary_service: SummaryService,
+        chunker: TextChunker,
+        single_pass_max_tokens: int = 6000,
+        max_text_length: int = 1_000_000,
+        max_concurrency: int = 4,
+        max_depth: int = 3,
+        default_budget: SummaryBudget | None = None,
+    ):
+        """
+        Initialize hierarchical summary service
+
+        Args:
+            summary_service: Service summarizing a single chunk
+            chunker: Splits text into token-budgeted chunks
+            single_pass_max_tokens: Largest input summarized without chunking
+            max_text_length: Maximum accepted text length in characters
+            max_concurrency: Maximum number of chunks summarized at the same time
+            max_depth: Maximum number of reduce rounds before a final forced reduce, which is clipped to
+                the single-pass length; the summary is then marked as truncated
+            default_budget: Budget applied when a request does not set one
+        """
+        self.summary_service = summary_service
+        self.chunker = chunker
+        self.single_pass_max_tokens = single_pass_max_tokens
+        self.max_text_length = max_text_length
+        self.max_concurrency = max_concurrency
+        self.max_depth = max_depth
+        self.default_budget = default_budget or SummaryBudget()
+
+    def needs_chunking(self, text: str) -> bool:
+        """Whether text is too large for one upstream call"""
+        return len(text) > self.summary_service.MAX_TEXT_LENGTH or (
+            self.chunker.count_tokens(text) > self.single_pass_max_tokens
+        )
+
+    async def summarize_text(
+        self, text: str, config: SummaryConfig | None = None, budget: SummaryBudget | None = None
+    ) -> Summary:
+        """
+        Summarize text of any supported length
+
+        Args:
+            text: Text to summarize
+            config: Optional summary configuration
+            budget: Optional token/time budget; unset limits fall back to the service default
+
+        Returns:
+            Summary entity for the whole text, ``truncated`` when the final reduce had to be clipped
+            or a call's input was cut to fit the model
+
+        Raises:
+            ValueError: If text is empty, too long, or cannot fit the token budget
+            RuntimeError: If summarization fails or runs out of budget
+        """
+        if len(text) > self.max_text_length:
+            raise ValueError(f"Text is too long (maximum {self.max_text_length} characters)")
+
+        config = config or SummaryConfig()
+        budget = SummaryBudget(
+            max_tokens=(budget and budget.max_tokens) or self.default_budget.max_tokens,
+            max_seconds=(budget and budget.max_seconds) or self.default_budget.max_seconds,
+        )
+
+        if budget.max_tokens is not None and self.chunker.count_tokens(text) > budget.max_tokens:
+            raise ValueError(f"Text does not fit the token budget ({budget.max_tokens} tokens)")
+
+        tracker = _BudgetTracker(budget, self.chunker.count_tokens)
+        try:
+            async with asyncio.timeout(budget.max_seconds):
+                summary_text, truncated = await self._reduce(text, config, tracker, depth=0)
+        except TimeoutError as e:
+            raise RuntimeError(f"Summarization time budget exceeded ({budget.max_seconds} seconds)") from e
+
+        return Summary(
+            id=str(uuid.uuid4()),
+            original_text=text,
+            summary_text=summary_text,
+            created_at=datetime.now(),
+            model_name=config.model_name,
+            summary_length=len(summary_text),
+            truncated=truncated,
+        )
+
+    async def _reduce(self, text: str, config: SummaryConfig, tracker: _BudgetTracker, depth: int) -> tuple[str, bool]:
+        """Summarize text, recursing over partial summaries until one call suffices; also whether it was clipped"""
+        if not self.needs_chunking(text) or depth >= self.max_depth:
+            clipped = self._clip(text)
+            summary_text, truncated = await self._summarize_chunk(clipped, config, tracker)
+            return summary_text, truncated or len(clipped) < len(text)
+
+        chunks = self.chunker.split(text)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize(chunk: str) -> tuple[str, bool]:
+            async with semaphore:
+                return await self._summarize_chunk(chunk, config, tracker)
+
+        tasks = [asyncio.create_task(summarize(chunk)) for chunk in chunks]
+        try:
+            partial_summaries = await asyncio.gather(*tasks)
+        finally:
+            # Stop the remaining chunks once one fails or the budget runs out
+            for task in tasks:
+                task.cancel()
+
+        summary_text, truncated = await self._reduce(
+            "\n\n".join(text for text, _ in partial_summaries), config, tracker, depth + 1
+        )
+        return summary_text, truncated or any(chunk_truncated for _, chunk_truncated in partial_summaries)
+
+    async def _summarize_chunk(self, text: str, config: SummaryConfig, tracker: _BudgetTracker) -> tuple[str, bool]:
+        """Summarize one chunk through the single-pass service; also whether its input was cut to fit the model"""
+        if len(text.strip()) < self.summary_service.MIN_TEXT_LENGTH:
+            # Fragments too short to summarize are carried into the reduce step verbatim
+            return text.strip(), False
+
+        reserved = tracker.reserve(text, config)
+        summary = await self.summary_service.summarize_text(text, config)
+        tracker.settle(reserved, text, summary.summary_text)
+        return summary.summary_text, summary.truncated
+
+    def _clip(self, text: str) -> str:
+        """Keep the forced final reduce within the single-pass character limit"""
+        return text[: self.summary_service.MAX_TEXT_LENGTH]
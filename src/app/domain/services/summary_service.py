@@ -1,21 +1,32 @@
 """Summary domain service"""
 
-from app.domain.entities.summary import Summary
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import replace
+
+from app.domain.entities.summary import Summary, SummaryChunk
 from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.value_objects.content_key import summary_key
 from app.domain.value_objects.summary_config import SummaryConfig
+from app.shared.single_flight import SingleFlight
 
 
 class SummaryService:
     """Domain service for text summarization business logic"""
 
-    def __init__(self, summary_repository: SummaryRepository):
+    MIN_TEXT_LENGTH = 10
+    MAX_TEXT_LENGTH = 50000  # Approximately 50KB, to prevent excessive API usage per call
+
+    def __init__(self, summary_repository: SummaryRepository, single_flight: SingleFlight | None = None):
         """
         Initialize summary service
 
         Args:
             summary_repository: Repository for text summarization
+            single_flight: Group coalescing concurrent identical requests
         """
         self.summary_repository = summary_repository
+        self.single_flight = single_flight or SingleFlight()
 
     async def summarize_text(self, text: str, config: SummaryConfig | None = None) -> Summary:
         """
@@ -32,25 +43,19 @@ class SummaryService:
             ValueError: If text is empty or too short
             RuntimeError: If summarization fails
         """
-        # Validate input text
-        if not text or not text.strip():
-            raise ValueError("Text cannot be empty")
-
-        # Check minimum text length
-        if len(text.strip()) < 10:
-            raise ValueError("Text is too short to summarize (minimum 10 characters)")
-
-        # Check maximum text length (to prevent excessive API usage)
-        max_length = 50000  # Approximately 50KB
-        if len(text) > max_length:
-            raise ValueError(f"Text is too long (maximum {max_length} characters)")
+        self.validate_text(text)
 
         # Use default config if none provided
         if config is None:
             config = SummaryConfig()
 
-        # Perform summarization
-        summary = await self.summary_repository.summarize_text(text, config)
+        # Perform summarization, sharing one upstream call between identical concurrent requests
+        summary, shared = await self.single_flight.do(
+            summary_key(text, config),
+            lambda: self.summary_repository.summarize_text(text, config),
+        )
+        if shared:
+            summary = replace(summary, id=str(uuid.uuid4()), original_text=text)
 
         # Validate summary result
         if not summary.summary_text or not summary.summary_text.strip():
@@ -58,6 +63,55 @@ class SummaryService:
 
         return summary
 
+    def summarize_text_stream(self, text: str, config: SummaryConfig | None = None) -> AsyncIterator[SummaryChunk]:
+        """
+        Summarize the given text as a stream of chunks
+
+        Input is validated before the stream is returned, so invalid requests
+        fail before any output is produced.
+
+        Args:
+            text: Text to summarize
+            config: Optional summary configuration
+
+        Returns:
+            Async iterator of text chunks ending with a chunk carrying the Summary entity
+
+        Raises:
+            ValueError: If text is empty, too short or too long
+        """
+        self.validate_text(text)
+        return self._stream_summary(text, config or SummaryConfig())
+
+    async def _stream_summary(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """Stream from the repository and validate the final summary"""
+        async for chunk in self.summary_repository.summarize_text_stream(text, config):
+            if chunk.summary is not None and not chunk.summary.summary_text.strip():
+                raise RuntimeError("Failed to generate summary: empty result")
+            yield chunk
+
+    def validate_text(self, text: str) -> None:
+        """
+        Validate text to be summarized
+
+        Args:
+            text: Text to validate
+
+        Raises:
+            ValueError: If text is empty, too short or too long
+        """
+        # Validate input text
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        # Check minimum text length
+        if len(text.strip()) < self.MIN_TEXT_LENGTH:
+            raise ValueError(f"Text is too short to summarize (minimum {self.MIN_TEXT_LENGTH} characters)")
+
+        # Check maximum text length
+        if len(text) > self.MAX_TEXT_LENGTH:
+            raise ValueError(f"Text is too long (maximum {self.MAX_TEXT_LENGTH} characters)")
+
     async def check_service_health(self) -> bool:
         """
         Check if the summarization service is available
@@ -0,0 +1,125 @@
+"""Token-budgeted text chunking"""
+
+import re
+from collections.abc import Callable
+
+# Hangul, kana and CJK ideographs are roughly one token per character
+_CJK_CHARACTERS = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힣]")
+
+# Blank lines between paragraphs
+_PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+
+# Whitespace after sentence-ending punctuation (including CJK full stops)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+|(?<=[。！？])")
+
+_PARAGRAPH_END = "\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer"""
+    cjk = len(_CJK_CHARACTERS.findall(text))
+    return cjk + -(-(len(text) - cjk) // 4)
+
+
+class TextChunker:
+    """Split text into overlapping chunks that fit a token budget"""
+
+    def __init__(
+        self,
+        max_chunk_tokens: int = 3000,
+        overlap_tokens: int = 200,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Initialize text chunker
+
+        Args:
+            max_chunk_tokens: Maximum tokens per chunk
+            overlap_tokens: Tokens of trailing context repeated at the start of the next chunk
+            count_tokens: Token counting function
+        """
+        if max_chunk_tokens <= 0:
+            raise ValueError("max_chunk_tokens must be positive")
+        if not 0 <= overlap_tokens < max_chunk_tokens:
+            raise ValueError("overlap_tokens must be between 0 and max_chunk_tokens")
+
+        self.max_chunk_tokens = max_chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count_tokens = count_tokens
+
+    def split(self, text: str) -> list[str]:
+        """
+        Split text on sentence and paragraph boundaries
+
+        Segments longer than a whole chunk are cut by length. Sentences are
+        joined with a space and paragraphs with a blank line, so chunks keep
+        the document's structure.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Chunks in document order
+        """
+        segments = [(segment, self.count_tokens(segment)) for segment in self._segments(text)]
+
+        chunks: list[str] = []
+        current: list[tuple[str, int]] = []
+        current_tokens = 0
+
+        for segment, tokens in segments:
+            if current and current_tokens + tokens > self.max_chunk_tokens:
+                chunks.append(self._join(current))
+                current = self._overlap(current)
+                current_tokens = sum(t for _, t in current)
+                # Drop the overlap when it would not leave room for the next segment
+                if current_tokens + tokens > self.max_chunk_tokens:
+                    current, current_tokens = [], 0
+
+            current.append((segment, tokens))
+            current_tokens += tokens
+
+        if current:
+            chunks.append(self._join(current))
+
+        return chunks
+
+    def _segments(self, text: str) -> list[str]:
+        """Split text into sentences no longer than one chunk; the last of each paragraph ends with a blank line"""
+        segments = []
+        for paragraph in _PARAGRAPH_BOUNDARY.split(text):
+            pieces = []
+            for sentence in _SENTENCE_BOUNDARY.split(paragraph):
+                if not sentence or not sentence.strip():
+                    continue
+                tokens = self.count_tokens(sentence)
+                if tokens <= self.max_chunk_tokens:
+                    pieces.append(sentence)
+                    continue
+
+                # Cut oversized sentences into pieces proportional to their token density
+                piece_length = max(1, len(sentence) * self.max_chunk_tokens // tokens)
+                pieces.extend(sentence[start : start + piece_length] for start in range(0, len(sentence), piece_length))
+            if pieces:
+                pieces[-1] += _PARAGRAPH_END
+                segments.extend(pieces)
+        return segments
+
+    def _overlap(self, segments: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        """Trailing segments of a chunk that fit the overlap budget"""
+        overlap: list[tuple[str, int]] = []
+        tokens = 0
+        for segment, segment_tokens in reversed(segments):
+            if tokens + segment_tokens > self.overlap_tokens:
+                break
+            overlap.insert(0, (segment, segment_tokens))
+            tokens += segment_tokens
+        return overlap
+
+    @staticmethod
+    def _join(segments: list[tuple[str, int]]) -> str:
+        parts = []
+        for segment, _ in segments:
+            parts.append(segment.strip())
+            parts.append(_PARAGRAPH_END if segment.endswith(_PARAGRAPH_END) else " ")
+        return "".join(parts[:-1])
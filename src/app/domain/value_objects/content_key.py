@@ -0,0 +1,36 @@
+"""Content-addressed keys for summarization requests"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from dataclasses import asdict
+
+from app.domain.value_objects.summary_config import SummaryConfig
+
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so cosmetic differences map to the same key"""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n")
+    return _TRAILING_WHITESPACE.sub("", text).strip()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalized text"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def summary_key(text: str, config: SummaryConfig, options: dict | None = None) -> str:
+    """
+    SHA-256 hex digest identifying a (text, config) summarization request
+
+    Args:
+        text: Text to summarize
+        config: Summary configuration
+        options: Other settings that change the result, e.g. the strategy and budgets of a request
+    """
+    fields = asdict(config) if not options else {**asdict(config), "options": options}
+    config_fields = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{content_hash(text)}:{config_fields}".encode()).hexdigest()
@@ -12,6 +12,7 @@ class SummaryConfig:
     model_name: str = "qwen/qwen3-4b"
     summary_type: str = "concise"  # concise, detailed, bullet_points
     language: str = "korean"
+    reasoning: bool | None = None  # let the model think before answering; None for the model's default
 
     def __post_init__(self):
         """Validate configuration values"""
@@ -33,3 +34,19 @@ class LMStudioConfig:
     api_key: str = "lm-studio"
     timeout: int = 30
     max_retries: int = 3
+
+
+@dataclass(frozen=True)
+class SummaryBudget:
+    """Upper bounds on the work spent on one summarization request"""
+
+    max_tokens: int | None = None  # prompt plus completion tokens across every upstream call
+    max_seconds: float | None = None
+
+    def __post_init__(self):
+        """Validate budget values"""
+        if self.max_tokens is not None and self.max_tokens <= 0:
+            raise ValueError("max_tokens budget must be positive")
+
+        if self.max_seconds is not None and self.max_seconds <= 0:
+            raise ValueError("max_seconds budget must be positive")
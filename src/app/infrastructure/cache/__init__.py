@@ -0,0 +1 @@
+"""Summary result cache backends"""
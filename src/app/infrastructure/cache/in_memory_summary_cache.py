@@ -0,0 +1,46 @@
+"""In-memory summary cache"""
+
+from app.domain.entities.summary import Summary
+from app.domain.repositories.summary_cache import SummaryCache
+from app.shared.lru_cache import LRUCache
+
+
+class InMemorySummaryCache(SummaryCache):
+    """LRU+TTL summary cache, optionally backed by a persistent cache"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = 86400, backend: SummaryCache | None = None):
+        """
+        Initialize in-memory summary cache
+
+        Args:
+            max_entries: Maximum number of summaries kept in memory
+            ttl: Seconds a summary stays valid; None disables expiry
+            backend: Persistent cache consulted on a memory miss and written through on set
+        """
+        self.backend = backend
+        self._entries = LRUCache(max_size=max_entries, ttl=ttl)
+
+    async def get(self, key: str) -> Summary | None:
+        """Get a summary from memory, falling back to the backend"""
+        summary = self._entries.get(key)
+        if summary is None and self.backend is not None:
+            summary = await self.backend.get(key)
+            if summary is not None:
+                self._entries.set(key, summary)
+        return summary
+
+    async def set(self, key: str, summary: Summary) -> None:
+        """Store a summary in memory and in the backend"""
+        self._entries.set(key, summary)
+        if self.backend is not None:
+            await self.backend.set(key, summary)
+
+    async def close(self) -> None:
+        """Close the backend"""
+        if self.backend is not None:
+            await self.backend.close()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Memory tier counters"""
+        return {"size": len(self._entries), **self._entries.stats.to_dict()}
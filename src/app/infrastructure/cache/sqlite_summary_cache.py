@@ -0,0 +1,131 @@
+"""SQLite-backed persistent summary cache"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+
+from app.domain.entities.summary import Summary
+from app.domain.repositories.summary_cache import SummaryCache
+
+_SUMMARY_FIELDS = {field.name for field in fields(Summary)}
+
+
+def _dump_summary(summary: Summary) -> str:
+    """Serialize a summary to JSON"""
+    data = asdict(summary)
+    data["created_at"] = summary.created_at.isoformat() if summary.created_at else None
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _load_summary(payload: str) -> Summary:
+    """Deserialize a summary, ignoring fields unknown to this version"""
+    data = {key: value for key, value in json.loads(payload).items() if key in _SUMMARY_FIELDS}
+    if data.get("created_at"):
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return Summary(**data)
+
+
+class SQLiteSummaryCache(SummaryCache):
+    """Summary cache stored in a local SQLite file that survives restarts"""
+
+    # Trimming scans the accessed_at index, so it runs every N writes instead of on each one
+    TRIM_INTERVAL = 100
+
+    def __init__(self, path: str, max_entries: int = 100_000, ttl: float | None = 86400):
+        """
+        Initialize SQLite summary cache
+
+        Args:
+            path: Database file path
+            max_entries: Maximum number of rows kept; least recently used rows are evicted
+            ttl: Seconds a summary stays valid; None disables expiry
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    async def get(self, key: str) -> Summary | None:
+        """Get a summary"""
+        payload = await asyncio.to_thread(self._get, key)
+        return _load_summary(payload) if payload is not None else None
+
+    async def set(self, key: str, summary: Summary) -> None:
+        """Store a summary"""
+        await asyncio.to_thread(self._set, key, _dump_summary(summary))
+
+    async def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use"""
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS summary_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed_at ON summary_cache (accessed_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT payload, expires_at FROM summary_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                connection.execute("DELETE FROM summary_cache WHERE key = ?", (key,))
+                connection.commit()
+                return None
+
+            connection.execute("UPDATE summary_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            connection.commit()
+            return payload
+
+    def _set(self, key: str, payload: str) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO summary_cache (key, payload, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self.TRIM_INTERVAL == 0:
+                self._trim(connection, now)
+            connection.commit()
+
+    def _trim(self, connection: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows and the least recently used rows beyond max_entries"""
+        connection.execute("DELETE FROM summary_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        connection.execute(
+            """DELETE FROM summary_cache WHERE key IN (
+                SELECT key FROM summary_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entries,),
+        )
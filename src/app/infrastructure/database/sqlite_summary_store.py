@@ -0,0 +1,257 @@
+"""SQLite-backed summary store with batched background writes"""
+
+import asyncio
+import itertools
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from app.domain.entities.summary import Summary
+from app.domain.repositories.summary_store import SummaryStore
+from app.domain.value_objects import content_key
+
+_COLUMNS = (
+    "id, original_text, summary_text, created_at, model_name, summary_length, prompt_tokens, completion_tokens, "
+    "truncated"
+)
+
+
+def _row_to_summary(row: tuple) -> Summary:
+    """Build a summary from a row selected with ``_COLUMNS``"""
+    (
+        summary_id,
+        original_text,
+        summary_text,
+        created_at,
+        model_name,
+        summary_length,
+        prompt_tokens,
+        completion_tokens,
+        truncated,
+    ) = row
+    return Summary(
+        id=summary_id,
+        original_text=original_text,
+        summary_text=summary_text,
+        created_at=datetime.fromtimestamp(created_at),
+        model_name=model_name,
+        summary_length=summary_length,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        truncated=bool(truncated),
+    )
+
+
+class SQLiteSummaryStore(SummaryStore):
+    """
+    Summary store in a local SQLite file
+
+    ``add`` only buffers the summary in memory; a background task writes
+    the buffer in batches, one transaction each, every ``flush_interval``
+    seconds or as soon as ``batch_size`` summaries are waiting. Reads see
+    buffered summaries, so a summary can be fetched right after it was
+    returned. When the disk cannot keep up, the oldest buffered summaries
+    are dropped rather than slowing down requests.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_pending: int = 10_000,
+    ):
+        """
+        Initialize SQLite summary store
+
+        Args:
+            path: Database file path
+            batch_size: Maximum number of summaries written in one transaction
+            flush_interval: Seconds between background flushes
+            max_pending: Maximum number of buffered summaries
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+        self._pending: dict[str, Summary] = {}
+        self._writing: dict[str, Summary] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Write counters and the current buffer size"""
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+        }
+
+    async def add(self, summary: Summary) -> None:
+        """Buffer a summary for the next batch"""
+        if len(self._pending) >= self.max_pending:
+            self._pending.pop(next(iter(self._pending)))
+            self.dropped += 1
+        self._pending[summary.id] = summary
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def get(self, summary_id: str) -> Summary | None:
+        """Get a summary, buffered or written"""
+        summary = self._pending.get(summary_id) or self._writing.get(summary_id)
+        if summary is not None:
+            return summary
+        return await asyncio.to_thread(self._get, summary_id)
+
+    async def list_summaries(
+        self,
+        limit: int,
+        offset: int = 0,
+        model_name: str | None = None,
+        content_hash: str | None = None,
+    ) -> tuple[list[Summary], int]:
+        """List summaries, newest first"""
+        # Listing is rare next to writes, so it pays for consistency by flushing the buffer first
+        await self.flush()
+        return await asyncio.to_thread(self._list, limit, offset, model_name, content_hash)
+
+    async def start(self) -> None:
+        """Start flushing buffered summaries in the background (idempotent)"""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write every buffered summary"""
+        async with self._flush_lock:
+            while self._pending:
+                ids = list(itertools.islice(self._pending, self.batch_size))
+                self._writing = {summary_id: self._pending.pop(summary_id) for summary_id in ids}
+                try:
+                    await asyncio.to_thread(self._write, list(self._writing.values()))
+                    self.written += len(self._writing)
+                    self.batches += 1
+                except sqlite3.Error:
+                    # The batch is lost; keeping it would retry a failing write forever
+                    self.write_errors += len(self._writing)
+                finally:
+                    self._writing = {}
+
+    async def close(self) -> None:
+        """Stop the background flush, write what is left and close the database connection"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with asyncio.timeout(self.flush_interval):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use"""
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS summaries (
+                    id TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    original_text TEXT NOT NULL,
+                    summary_text TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    model_name TEXT NOT NULL,
+                    summary_length INTEGER,
+                    prompt_tokens INTEGER,
+                    completion_tokens INTEGER,
+                    truncated INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            columns = {name for _, name, *_ in connection.execute("PRAGMA table_info(summaries)")}
+            if "truncated" not in columns:
+                # Databases created before the column; their summaries were not marked
+                connection.execute("ALTER TABLE summaries ADD COLUMN truncated INTEGER NOT NULL DEFAULT 0")
+            # The filter columns lead so that filtered listings are read in created_at order without sorting
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_summaries_created_at ON summaries (created_at)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_model_name ON summaries (model_name, created_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_content_hash ON summaries (content_hash, created_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _write(self, summaries: list[Summary]) -> None:
+        rows = [
+            (
+                content_key.content_hash(summary.original_text),
+                summary.id,
+                summary.original_text,
+                summary.summary_text,
+                summary.created_at.timestamp(),
+                summary.model_name,
+                summary.summary_length,
+                summary.prompt_tokens,
+                summary.completion_tokens,
+                int(summary.truncated),
+            )
+            for summary in summaries
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO summaries (content_hash, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def _get(self, summary_id: str) -> Summary | None:
+        with self._lock:
+            row = self._connect().execute(f"SELECT {_COLUMNS} FROM summaries WHERE id = ?", (summary_id,)).fetchone()
+        return _row_to_summary(row) if row is not None else None
+
+    def _list(
+        self, limit: int, offset: int, model_name: str | None, content_hash: str | None
+    ) -> tuple[list[Summary], int]:
+        conditions, parameters = [], []
+        if model_name is not None:
+            conditions.append("model_name = ?")
+            parameters.append(model_name)
+        if content_hash is not None:
+            conditions.append("content_hash = ?")
+            parameters.append(content_hash)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM summaries {where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                (*parameters, limit, offset),
+            ).fetchall()
+            (total,) = connection.execute(f"SELECT COUNT(*) FROM summaries {where}", parameters).fetchone()
+        return [_row_to_summary(row) for row in rows], total
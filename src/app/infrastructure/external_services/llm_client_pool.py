@@ -0,0 +1,80 @@
+"""Shared HTTP connection pool for the LLM backend"""
+
+import importlib.util
+
+import httpx
+
+from app.domain.value_objects.summary_config import LMStudioConfig
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class LLMClientPool:
+    """Process-wide keep-alive HTTP client shared by every LLM handle"""
+
+    def __init__(
+        self,
+        lmstudio_config: LMStudioConfig,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ):
+        """
+        Initialize LLM client pool
+
+        Args:
+            lmstudio_config: LMStudio configuration
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept before closing
+            http2: Use HTTP/2 when the ``h2`` package is installed
+        """
+        self.config = lmstudio_config
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the underlying client is open"""
+        return self._client is not None and not self._client.is_closed
+
+    async def open(self) -> None:
+        """Open the shared client (idempotent)"""
+        if not self.is_open:
+            self._client = self._create_client()
+
+    async def close(self) -> None:
+        """Close the shared client and release its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared async HTTP client
+
+        The client is created on first use when the pool was not opened
+        explicitly (e.g. outside the application lifespan).
+        """
+        if not self.is_open:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client"""
+        return httpx.AsyncClient(
+            base_url=self.config.base_url,
+            limits=self.limits,
+            timeout=httpx.Timeout(self.config.timeout),
+            http2=self.http2,
+        )
@@ -0,0 +1,137 @@
+"""OpenAI-compatible chat client on the shared HTTP pool, without LangChain"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ChatResponse:
+    """A completion or one streamed delta, shaped like the LangChain message the repository reads"""
+
+    content: str
+    usage_metadata: dict | None = None
+
+
+class OpenAIChatClient:
+    """
+    Minimal ``/chat/completions`` client
+
+    Exposes the ``ainvoke``/``astream`` subset of ``ChatOpenAI`` the summary
+    repository uses, so either can back it. Importing it costs only httpx,
+    which is already loaded for the connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: float,
+        max_retries: int,
+        http_async_client: httpx.AsyncClient,
+    ):
+        """
+        Initialize chat client
+
+        Args:
+            base_url: OpenAI-compatible API root, e.g. ``http://localhost:1234/v1``
+            api_key: Bearer token
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Completion token limit; overridable per call
+            timeout: Seconds per request
+            max_retries: Retries on connection errors and retryable status codes
+            http_async_client: Shared pooled client
+        """
+        self.url = f"{base_url.rstrip('/')}/chat/completions"
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.http_client = http_async_client
+
+    def _payload(self, messages: list[dict], stream: bool, max_tokens: int | None, extra_body: dict | None) -> dict:
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens or self.max_tokens,
+            "stream": stream,
+            **(extra_body or {}),
+        }
+
+    async def _send(self, payload: dict, stream: bool) -> httpx.Response:
+        """Send the request, retrying with exponential backoff before any body is read"""
+        request = self.http_client.build_request(
+            "POST", self.url, json=payload, headers=self.headers, timeout=self.timeout
+        )
+        attempt = 0
+        while True:
+            try:
+                response = await self.http_client.send(request, stream=stream)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    if response.is_error:
+                        await response.aclose()
+                    response.raise_for_status()
+                    return response
+                await response.aclose()
+            await asyncio.sleep(min(0.5 * 2**attempt, 8.0))
+            attempt += 1
+
+    async def ainvoke(
+        self, messages: list[dict], max_tokens: int | None = None, extra_body: dict | None = None
+    ) -> ChatResponse:
+        """
+        Generate a completion
+
+        ``extra_body`` adds server-specific fields to the request, as in ``ChatOpenAI``.
+
+        Raises:
+            httpx.HTTPError: If the request fails after the retries
+        """
+        response = await self._send(self._payload(messages, False, max_tokens, extra_body), stream=False)
+        body = response.json()
+        usage = body.get("usage") or {}
+        return ChatResponse(
+            content=body["choices"][0]["message"].get("content") or "",
+            usage_metadata={
+                "input_tokens": usage.get("prompt_tokens"),
+                "output_tokens": usage.get("completion_tokens"),
+            },
+        )
+
+    async def astream(
+        self, messages: list[dict], max_tokens: int | None = None, extra_body: dict | None = None
+    ) -> AsyncIterator[ChatResponse]:
+        """
+        Stream completion deltas from the server-sent events
+
+        Raises:
+            httpx.HTTPError: If the request fails after the retries
+        """
+        response = await self._send(self._payload(messages, True, max_tokens, extra_body), stream=True)
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or [{}]
+                yield ChatResponse(content=choices[0].get("delta", {}).get("content") or "")
+        finally:
+            await response.aclose()
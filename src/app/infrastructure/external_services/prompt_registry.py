@@ -0,0 +1,149 @@
+"""Versioned summarization prompt templates, compiled once per language and summary type"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.infrastructure.external_services.token_budget import PromptBudgeter
+
+DEFAULT_TEMPLATES = {
+    "version": "v1",
+    "system": """당신은 전문적인 텍스트 요약 어시스턴트입니다.
+주어진 텍스트를 분석하여 핵심 내용을 추출하고 요약해주세요.
+
+요약 지침:
+- {summary_style}
+- {language_instruction}
+- 원본 텍스트의 주요 정보와 맥락을 유지해주세요.
+- 불필요한 세부사항은 제거하되, 중요한 내용은 누락하지 마세요.
+- 명확하고 이해하기 쉬운 문장으로 작성해주세요.""",
+    "user_prefix": "다음 텍스트를 요약해주세요:\n\n",
+    "languages": {
+        "korean": "한국어로 답변해주세요.",
+        "english": "Please respond in English.",
+        "japanese": "日本語で答えてください。",
+    },
+    "summary_types": {
+        "concise": "간결하고 핵심적인 내용으로 요약해주세요.",
+        "detailed": "상세하고 포괄적인 내용으로 요약해주세요.",
+        "bullet_points": "주요 내용을 불릿 포인트 형태로 정리해주세요.",
+    },
+    "default_language": "korean",
+    "default_summary_type": "concise",
+}
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """Prompt text and token count for one (language, summary type) pair"""
+
+    version: str
+    system_prompt: str
+    user_prefix: str
+    overhead_tokens: int  # every prompt token except the text itself
+
+
+class PromptRegistry:
+    """
+    Compile every (language, summary type) prompt once
+
+    The system prompt is the same string for every request with the same
+    pair, so it forms a byte-identical prefix that upstreams with prefix
+    (KV) caching can reuse. Token counts are computed at compile time
+    instead of on each request.
+
+    A templates file is JSON with the keys of ``DEFAULT_TEMPLATES``; its
+    ``system`` template uses ``{summary_style}`` and ``{language_instruction}``
+    placeholders. Bump ``version`` when the wording changes.
+    """
+
+    def __init__(self, prompt_budgeter: PromptBudgeter, templates_path: str | None = None):
+        """
+        Initialize prompt registry
+
+        Args:
+            prompt_budgeter: Counts prompt tokens, including chat template overhead
+            templates_path: JSON templates file; None for the built-in templates
+        """
+        self.prompt_budgeter = prompt_budgeter
+        self.templates_path = templates_path
+        self.version: str | None = None
+        self._default: tuple[str, str] = ("", "")
+        self._languages: frozenset[str] = frozenset()
+        self._summary_types: frozenset[str] = frozenset()
+        self._compiled: dict[tuple[str, str], CompiledPrompt] = {}
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def load(self) -> None:
+        """
+        Read the templates and compile every prompt (blocking)
+
+        Called at startup once the tokenizer is loaded, so counts use it.
+
+        Raises:
+            ValueError: If the templates file is invalid
+        """
+        templates = DEFAULT_TEMPLATES
+        if self.templates_path:
+            templates = json.loads(Path(self.templates_path).read_text(encoding="utf-8"))
+
+        try:
+            languages = templates["languages"]
+            summary_types = templates["summary_types"]
+            default = (templates["default_language"], templates["default_summary_type"])
+            compiled = {
+                (language, summary_type): self._compile(
+                    templates["version"],
+                    templates["system"].format(summary_style=style, language_instruction=instruction),
+                    templates["user_prefix"],
+                )
+                for language, instruction in languages.items()
+                for summary_type, style in summary_types.items()
+            }
+        except (KeyError, IndexError, AttributeError) as e:
+            raise ValueError(f"Invalid prompt templates: {e!r}") from e
+        if default not in compiled:
+            raise ValueError("Default language and summary type must be defined in the prompt templates")
+
+        self.version = templates["version"]
+        self._default = default
+        self._languages = frozenset(languages)
+        self._summary_types = frozenset(summary_types)
+        self._compiled = compiled
+
+    def get(self, language: str | None, summary_type: str | None) -> CompiledPrompt:
+        """
+        Get the compiled prompt for a request
+
+        Unknown languages and summary types fall back to the template defaults.
+
+        Args:
+            language: Requested output language
+            summary_type: Requested summary style
+
+        Returns:
+            Compiled prompt
+        """
+        if not self._compiled:
+            self.load()
+
+        prompt = self._compiled.get((language, summary_type))
+        if prompt is not None:
+            return prompt
+
+        default_language, default_summary_type = self._default
+        if language not in self._languages:
+            language = default_language
+        if summary_type not in self._summary_types:
+            summary_type = default_summary_type
+        return self._compiled[(language, summary_type)]
+
+    def _compile(self, version: str, system_prompt: str, user_prefix: str) -> CompiledPrompt:
+        return CompiledPrompt(
+            version=version,
+            system_prompt=system_prompt,
+            user_prefix=user_prefix,
+            overhead_tokens=self.prompt_budgeter.overhead(system_prompt, user_prefix),
+        )
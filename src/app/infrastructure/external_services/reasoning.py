@@ -0,0 +1,122 @@
+"""Reasoning ("thinking") control for models such as Qwen3"""
+
+from dataclasses import dataclass, field
+
+REASONING_DISABLE_METHODS = ("no_think", "chat_template_kwargs", "none")
+NO_THINK_DIRECTIVE = "\n/no_think"
+OPEN_TAG = "<think>"
+CLOSE_TAG = "</think>"
+
+
+@dataclass(frozen=True)
+class ReasoningPolicy:
+    """Whether a model may reason before answering, and how to switch it off"""
+
+    enabled: bool = False
+    models: dict[str, bool] = field(default_factory=dict)  # per-model overrides of enabled
+    # Name fragments of models that reason unless told not to
+    thinking_models: list[str] = field(default_factory=lambda: ["qwen3"])
+    disable_method: str = "no_think"  # no_think, chat_template_kwargs, none
+
+    def __post_init__(self):
+        """Validate policy values"""
+        if self.disable_method not in REASONING_DISABLE_METHODS:
+            raise ValueError(f"disable_method must be one of: {', '.join(REASONING_DISABLE_METHODS)}")
+
+    def is_enabled(self, model_name: str, requested: bool | None = None) -> bool:
+        """Reasoning setting for a call: the request's, else the model's, else the default"""
+        if requested is not None:
+            return requested
+        return self.models.get(model_name, self.enabled)
+
+    def suppression(self, model_name: str, requested: bool | None = None) -> str | None:
+        """The disable method to apply to a call, or None to leave the model alone"""
+        if self.disable_method == "none" or self.is_enabled(model_name, requested):
+            return None
+        name = model_name.lower()
+        if not any(fragment in name for fragment in self.thinking_models):
+            return None
+        return self.disable_method
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest tail of text that could be the start of tag"""
+    for length in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:length]):
+            return length
+    return 0
+
+
+class ReasoningFilter:
+    """
+    Split streamed model output into the answer and a leading ``<think>`` block
+
+    Thinking models open their output with the block, so ``<think>`` is only
+    recognised at the start, after any whitespace; a later ``<think>`` is
+    part of the answer, e.g. a summary of a text about HTML tags. Tags may
+    be split across chunks, so a possible partial tag is held back until the
+    next chunk decides it. Whitespace between the block and the answer is
+    dropped. Output from servers that already return reasoning in a separate
+    field passes through unchanged.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._at_start = True
+        self._in_reasoning = False
+        self._answer_started = False
+        self._reasoning: list[str] = []
+
+    @property
+    def reasoning(self) -> str:
+        """Text of the reasoning block seen so far"""
+        return "".join(self._reasoning)
+
+    def feed(self, text: str) -> str:
+        """Add a chunk of output and return the answer text it completes"""
+        self._buffer += text
+        if self._at_start:
+            self._buffer = self._buffer.lstrip()
+            if OPEN_TAG.startswith(self._buffer):
+                # Empty, a partial tag or the whole tag: wait for what follows it
+                if self._buffer != OPEN_TAG:
+                    return ""
+            self._at_start = False
+            if self._buffer.startswith(OPEN_TAG):
+                self._buffer = self._buffer[len(OPEN_TAG) :]
+                self._in_reasoning = True
+
+        if self._in_reasoning:
+            index = self._buffer.find(CLOSE_TAG)
+            if index < 0:
+                keep = _partial_tag_length(self._buffer, CLOSE_TAG)
+                self._reasoning.append(self._buffer[: len(self._buffer) - keep])
+                self._buffer = self._buffer[len(self._buffer) - keep :]
+                return ""
+            self._reasoning.append(self._buffer[:index])
+            self._buffer = self._buffer[index + len(CLOSE_TAG) :]
+            self._in_reasoning = False
+
+        answer, self._buffer = self._buffer, ""
+        return self._answer(answer)
+
+    def flush(self) -> str:
+        """Return any held-back answer text at the end of the output"""
+        text, self._buffer = self._buffer, ""
+        if self._in_reasoning:
+            self._reasoning.append(text)
+            return ""
+        return self._answer(text)
+
+    def _answer(self, text: str) -> str:
+        if not self._answer_started:
+            text = text.lstrip()
+            self._answer_started = bool(text)
+        return text
+
+
+def split_reasoning(text: str) -> tuple[str, str]:
+    """Split a complete output into (answer, reasoning)"""
+    reasoning_filter = ReasoningFilter()
+    answer = reasoning_filter.feed(text) + reasoning_filter.flush()
+    return answer, reasoning_filter.reasoning
@@ -0,0 +1,180 @@
+"""Prompt token counting and context window budgeting"""
+
+from dataclasses import dataclass
+
+from app.domain.services.text_chunker import estimate_tokens
+
+# Chat template tokens wrapped around every message, plus the assistant reply primer
+TOKENS_PER_MESSAGE = 5
+TOKENS_PER_REPLY = 3
+
+OVERFLOW_POLICIES = ("reject", "truncate")
+
+
+class TokenCounter:
+    """Count tokens with a cached tiktoken encoding, falling back to a character estimate"""
+
+    def __init__(self, encoding_name: str | None = None):
+        """
+        Initialize token counter
+
+        The encoding is loaded by ``load()`` (at startup), never on the request
+        path; until then, or if loading fails, counts use ``estimate_tokens``.
+
+        Args:
+            encoding_name: tiktoken encoding name; None to always use the estimate
+        """
+        self.encoding_name = encoding_name or None
+        self._encoding = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the tokenizer in use"""
+        return f"tiktoken:{self.encoding_name}" if self._encoding is not None else "estimate"
+
+    def load(self) -> bool:
+        """
+        Load the tiktoken encoding (idempotent, blocking)
+
+        Returns:
+            True if the encoding is in use, False if counts fall back to the estimate
+        """
+        if self._encoding is not None or self.encoding_name is None:
+            return self._encoding is not None
+
+        try:
+            import tiktoken
+
+            self._encoding = tiktoken.get_encoding(self.encoding_name)
+        except Exception:
+            # Missing package or no network to fetch the encoding file
+            self.encoding_name = None
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count the tokens of text"""
+        if self._encoding is None:
+            return estimate_tokens(text)
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    __call__ = count
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of text with at most max_tokens tokens"""
+        if max_tokens <= 0:
+            return ""
+
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            # A cut inside a multi-byte character decodes to a replacement character
+            return self._encoding.decode(tokens[:max_tokens]).rstrip("�")
+
+        # The estimate is monotonic in the prefix length, so binary search the cut
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count(text[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    """Prompt fitted to the context window"""
+
+    text: str
+    prompt_tokens: int
+    max_tokens: int  # completion tokens left in the context window
+    truncated: bool = False
+
+
+class PromptBudgeter:
+    """Fit prompts into the model context window and cap the completion length"""
+
+    def __init__(
+        self,
+        token_counter: TokenCounter,
+        context_window: int = 8192,
+        min_completion_tokens: int = 256,
+        overflow_policy: str = "reject",
+    ):
+        """
+        Initialize prompt budgeter
+
+        Args:
+            token_counter: Token counter
+            context_window: Context length the model is loaded with
+            min_completion_tokens: Completion tokens that must remain for a prompt to be accepted
+            overflow_policy: What to do with prompts that do not fit: reject or truncate
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of: {', '.join(OVERFLOW_POLICIES)}")
+        if not 0 < min_completion_tokens < context_window:
+            raise ValueError("min_completion_tokens must be between 0 and context_window")
+
+        self.token_counter = token_counter
+        self.context_window = context_window
+        self.min_completion_tokens = min_completion_tokens
+        self.overflow_policy = overflow_policy
+
+    def overhead(self, system_prompt: str, user_prefix: str) -> int:
+        """Tokens of a two-message prompt other than the text"""
+        return (
+            self.token_counter.count(system_prompt)
+            + self.token_counter.count(user_prefix)
+            + 2 * TOKENS_PER_MESSAGE
+            + TOKENS_PER_REPLY
+        )
+
+    def fit(
+        self,
+        system_prompt: str,
+        user_prefix: str,
+        text: str,
+        max_tokens: int,
+        overhead: int | None = None,
+    ) -> PromptBudget:
+        """
+        Fit a two-message prompt into the context window
+
+        Args:
+            system_prompt: System message content
+            user_prefix: User message content preceding the text
+            text: Text to summarize
+            max_tokens: Requested completion tokens
+            overhead: Precomputed ``overhead(system_prompt, user_prefix)``
+
+        Returns:
+            Prompt budget with the (possibly truncated) text and the capped completion length
+
+        Raises:
+            ValueError: If the prompt does not fit and the policy is reject
+        """
+        if overhead is None:
+            overhead = self.overhead(system_prompt, user_prefix)
+        text_tokens = self.token_counter.count(text)
+        reserve = min(max_tokens, self.min_completion_tokens)
+        available = self.context_window - overhead - reserve
+
+        truncated = False
+        if text_tokens > available:
+            if self.overflow_policy == "reject":
+                raise ValueError(
+                    f"Text is too long for the model context window "
+                    f"({text_tokens} tokens, maximum {max(available, 0)} tokens)"
+                )
+            text = self.token_counter.truncate(text, available)
+            text_tokens = self.token_counter.count(text)
+            truncated = True
+
+        prompt_tokens = overhead + text_tokens
+        return PromptBudget(
+            text=text,
+            prompt_tokens=prompt_tokens,
+            max_tokens=min(max_tokens, self.context_window - prompt_tokens),
+            truncated=truncated,
+        )
@@ -0,0 +1,188 @@
+"""Cached, tiered health probing of the LLM backend"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+
+
+@dataclass(frozen=True)
+class UpstreamHealth:
+    """Result of the latest upstream probe"""
+
+    live: bool  # /models answered
+    ready: bool | None  # a real generation succeeded; None until the first deep probe
+    checked_at: float
+    error: str | None = None
+
+    @property
+    def healthy(self) -> bool:
+        """
+        Live; readiness is reported separately
+
+        A generation probe competes with real requests for the GPU, so under
+        load it can time out while the backend is serving fine.
+        """
+        return self.live
+
+    def to_dict(self) -> dict:
+        """Serializable view for stats endpoints"""
+        return {"live": self.live, "ready": self.ready, "healthy": self.healthy, "error": self.error}
+
+
+class UpstreamHealthMonitor:
+    """
+    Probe the LLM backend off the request path and serve cached results
+
+    Liveness is a cheap ``GET /models`` and alone decides health; readiness
+    is a one-token chat completion run at most every ``deep_interval``
+    seconds (and on the next refresh after a failure), reported alongside.
+    Health checks return the cached result and only wait for a probe when
+    nothing has been probed yet.
+    """
+
+    def __init__(
+        self,
+        client_pool: LLMClientPool,
+        model_name: str,
+        ttl: float = 10.0,
+        deep_interval: float | None = 300.0,
+        probe_timeout: float = 5.0,
+        base_url: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize upstream health monitor
+
+        Args:
+            client_pool: Shared HTTP connection pool to the backend
+            model_name: Model used for the generation probe
+            ttl: Seconds a probe result is served before it is refreshed
+            deep_interval: Seconds between generation probes; None disables them
+            probe_timeout: Seconds each probe may take before it counts as failed
+            base_url: Endpoint to probe when it differs from the pool's base URL
+            clock: Monotonic clock, injectable for tests
+        """
+        self.client_pool = client_pool
+        self.model_name = model_name
+        self.ttl = ttl
+        self.deep_interval = deep_interval
+        self.probe_timeout = probe_timeout
+        self.base_url = base_url
+        self.clock = clock
+
+        self._status: UpstreamHealth | None = None
+        self._deep_checked_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._loop_task: asyncio.Task | None = None
+
+    @property
+    def status(self) -> UpstreamHealth | None:
+        """Latest probe result without triggering a probe"""
+        return self._status
+
+    def start(self) -> None:
+        """Refresh in the background every ``ttl`` seconds (idempotent)"""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop background refreshing"""
+        for task in (self._loop_task, self._refresh_task):
+            if task is not None:
+                task.cancel()
+        for task in (self._loop_task, self._refresh_task):
+            if task is not None:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._loop_task = self._refresh_task = None
+
+    async def check(self) -> UpstreamHealth:
+        """
+        Get upstream health, waiting only for the very first probe
+
+        Stale results are returned immediately while a refresh runs in the background.
+        """
+        if self._status is None:
+            return await self.refresh()
+
+        if self.clock() - self._status.checked_at >= self.ttl:
+            self._schedule_refresh()
+        return self._status
+
+    async def refresh(self) -> UpstreamHealth:
+        """Probe now, sharing one probe between concurrent callers"""
+        return await asyncio.shield(self._schedule_refresh())
+
+    def _schedule_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._probe())
+        return self._refresh_task
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.ttl)
+
+    async def _probe(self) -> UpstreamHealth:
+        """Run the liveness probe and, when due, the generation probe"""
+        now = self.clock()
+        ready = self._status.ready if self._status is not None else None
+        live, error = True, None
+
+        try:
+            await self._probe_models()
+        except Exception as e:
+            live, error = False, repr(e)
+
+        if live and self._deep_probe_due(now, ready):
+            self._deep_checked_at = now
+            try:
+                await self._probe_generation()
+                ready = True
+            except Exception as e:
+                ready, error = False, repr(e)
+
+        self._status = UpstreamHealth(live=live, ready=ready, checked_at=now, error=error)
+        return self._status
+
+    def _deep_probe_due(self, now: float, ready: bool | None) -> bool:
+        if self.deep_interval is None:
+            return False
+        if ready is not True or self._deep_checked_at is None:
+            return True
+        return now - self._deep_checked_at >= self.deep_interval
+
+    async def _probe_models(self) -> None:
+        """Liveness: list models without touching the GPU"""
+        async with asyncio.timeout(self.probe_timeout):
+            response = await self.client_pool.http_client.get(self._url("models"), headers=self._headers())
+        response.raise_for_status()
+
+    async def _probe_generation(self) -> None:
+        """Readiness: generate a single token"""
+        payload = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": "Hello"}],
+            "max_tokens": 1,
+            "temperature": 0,
+        }
+        async with asyncio.timeout(self.probe_timeout):
+            response = await self.client_pool.http_client.post(
+                self._url("chat/completions"), json=payload, headers=self._headers()
+            )
+        response.raise_for_status()
+        if not response.json().get("choices"):
+            raise RuntimeError("Generation probe returned no choices")
+
+    def _url(self, path: str) -> str:
+        """Absolute URL for another endpoint, relative to the pool's base URL otherwise"""
+        return f"{self.base_url.rstrip('/')}/{path}" if self.base_url else path
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.client_pool.config.api_key}"}
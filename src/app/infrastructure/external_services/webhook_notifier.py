@@ -0,0 +1,153 @@
+"""Delivery of job results to client webhooks"""
+
+import asyncio
+import ipaddress
+import socket
+from urllib.parse import urlsplit
+
+import httpx
+
+
+class WebhookNotifier:
+    """
+    POST JSON payloads to client-supplied callback URLs
+
+    Callback URLs come from clients, so the service must not become a proxy
+    into its own network: unless ``allow_private`` is set, hosts that are or
+    resolve to loopback, private, link-local or otherwise non-global
+    addresses are refused, both when the URL is submitted and, after DNS
+    resolution, before each delivery, which then connects to the checked
+    address. ``allowed_hosts`` narrows callbacks to known receivers.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        allowed_hosts: list[str] | None = None,
+        allow_private: bool = False,
+    ):
+        """
+        Initialize webhook notifier
+
+        Args:
+            timeout: Seconds each delivery attempt may take
+            max_attempts: Delivery attempts before giving up
+            backoff: Seconds before the second attempt, doubling afterwards
+            allowed_hosts: Hosts, with their subdomains, callbacks may go to; None or empty for any
+            allow_private: Allow callbacks to non-global addresses, e.g. in a private deployment
+        """
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.allowed_hosts = [host.lower().rstrip(".") for host in allowed_hosts or []]
+        self.allow_private = allow_private
+        self._client: httpx.AsyncClient | None = None
+
+        self.delivered = 0
+        self.undeliverable = 0
+        self.refused = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Delivery counters"""
+        return {"delivered": self.delivered, "undeliverable": self.undeliverable, "refused": self.refused}
+
+    def check_url(self, url: str) -> None:
+        """
+        Check a callback URL without resolving it
+
+        Raises:
+            ValueError: If the URL is not http(s), its host is not allowed, or it is a non-global address
+        """
+        parts = urlsplit(url)
+        host = (parts.hostname or "").rstrip(".")
+        if parts.scheme not in ("http", "https") or not host:
+            raise ValueError("callback_url must be an http or https URL with a host")
+        if self.allowed_hosts and not any(
+            host == allowed or host.endswith(f".{allowed}") for allowed in self.allowed_hosts
+        ):
+            raise ValueError("callback_url host is not allowed")
+        if self.allow_private:
+            return
+        if host == "localhost" or host.endswith(".localhost"):
+            raise ValueError("callback_url must not point to a private address")
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return
+        if not address.is_global:
+            raise ValueError("callback_url must not point to a private address")
+
+    async def _resolve(self, url: str) -> str | None:
+        """
+        Resolve the URL's host to the address deliveries connect to
+
+        Returns:
+            The first resolved address when every address may be called, the
+            host itself when private addresses are allowed, None when refused
+        """
+        try:
+            self.check_url(url)
+            parts = urlsplit(url)
+            if self.allow_private:
+                return parts.hostname
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), type=socket.SOCK_STREAM
+            )
+        except (ValueError, OSError):
+            return None
+        hosts = [address[4][0].split("%")[0] for address in addresses]
+        if not hosts or not all(ipaddress.ip_address(host).is_global for host in hosts):
+            return None
+        return hosts[0]
+
+    async def notify(self, url: str, payload: dict) -> bool:
+        """
+        Deliver a payload, retrying on connection errors and 5xx responses
+
+        The host is resolved and checked once, and every attempt connects to
+        that address with the original Host header and TLS server name, so a
+        second lookup cannot rebind the name into the private network.
+
+        Returns:
+            True once a 2xx response is received, False when every attempt failed or the URL is refused
+        """
+        address = await self._resolve(url)
+        if address is None:
+            self.refused += 1
+            return False
+
+        target = httpx.URL(url)
+        pinned = target.copy_with(host=address)
+        headers = {"Host": target.netloc.decode("ascii")}
+        extensions = {"sni_hostname": target.host} if target.scheme == "https" else {}
+
+        for attempt in range(self.max_attempts):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = await self._get_client().post(pinned, json=payload, headers=headers, extensions=extensions)
+            except httpx.HTTPError:
+                continue
+            if response.is_success:
+                self.delivered += 1
+                return True
+            if response.status_code < 500:
+                # The receiver rejected the payload; sending it again will not help
+                break
+
+        self.undeliverable += 1
+        return False
+
+    async def close(self) -> None:
+        """Close the HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(self.timeout))
+        return self._client
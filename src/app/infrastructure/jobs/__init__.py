@@ -0,0 +1 @@
+"""Summary job queue backends"""
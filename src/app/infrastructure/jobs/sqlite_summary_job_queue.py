@@ -0,0 +1,294 @@
+"""SQLite-backed durable summary job queue"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.domain.entities.summary_job import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, SummaryJob
+from app.domain.repositories.summary_job_queue import SummaryJobQueue
+
+_COLUMNS = (
+    "id, dedup_key, priority, status, attempts, max_attempts, request, callback_url, result, error, "
+    "created_at, updated_at"
+)
+
+
+def _dump(value: dict | None) -> str | None:
+    return json.dumps(value, ensure_ascii=False) if value is not None else None
+
+
+def _load(payload: str | None) -> dict | None:
+    return json.loads(payload) if payload is not None else None
+
+
+def _row_to_job(row: tuple, callback_urls: list[str]) -> SummaryJob:
+    """Build a job from a row selected with ``_COLUMNS`` and its attached callbacks"""
+    (
+        job_id,
+        dedup_key,
+        priority,
+        status,
+        attempts,
+        max_attempts,
+        request,
+        callback_url,
+        result,
+        error,
+        created_at,
+        updated_at,
+    ) = row
+    return SummaryJob(
+        id=job_id,
+        request=json.loads(request),
+        dedup_key=dedup_key,
+        priority=priority,
+        status=status,
+        attempts=attempts,
+        max_attempts=max_attempts,
+        # The callback_url column only holds the webhook of jobs stored before callbacks got their own table
+        callback_urls=[callback_url, *callback_urls] if callback_url else callback_urls,
+        result=_load(result),
+        error=_load(error),
+        created_at=datetime.fromtimestamp(created_at),
+        updated_at=datetime.fromtimestamp(updated_at),
+    )
+
+
+class SQLiteSummaryJobQueue(SummaryJobQueue):
+    """
+    Job queue stored in a local SQLite file that survives restarts
+
+    Claiming is a single ``UPDATE ... RETURNING`` statement, so several
+    worker processes can share one database file. A claimed job carries a
+    lease in ``available_at``; when it expires without an outcome the job is
+    claimed again.
+    """
+
+    # Purging scans the updated_at index, so it runs every N enqueues instead of on each one
+    PURGE_INTERVAL = 100
+
+    def __init__(self, path: str, retention: float | None = 604800):
+        """
+        Initialize SQLite summary job queue
+
+        Args:
+            path: Database file path
+            retention: Seconds finished jobs are kept; None keeps them forever
+        """
+        self.path = path
+        self.retention = retention
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+        self.enqueued = 0
+        self.deduplicated = 0
+        self.claimed = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Queue counters of this process"""
+        return {
+            "enqueued": self.enqueued,
+            "deduplicated": self.deduplicated,
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+    async def enqueue(self, job: SummaryJob) -> SummaryJob:
+        """Add a job unless an equivalent one is already queued, running or succeeded"""
+        return await asyncio.to_thread(self._enqueue, job)
+
+    async def claim(self, lease_seconds: float) -> SummaryJob | None:
+        """Take the next ready job and mark it running"""
+        job = await asyncio.to_thread(self._claim, lease_seconds)
+        if job is not None:
+            self.claimed += 1
+        return job
+
+    async def complete(self, job_id: str, result: dict) -> SummaryJob | None:
+        """Mark a job succeeded"""
+        job = await asyncio.to_thread(self._finish, job_id, JOB_SUCCEEDED, _dump(result), None)
+        self.succeeded += 1
+        return job
+
+    async def retry(self, job_id: str, error: dict, delay: float) -> None:
+        """Put a failed attempt back in the queue"""
+        now = time.time()
+        await asyncio.to_thread(
+            self._update,
+            "UPDATE summary_jobs SET status = ?, error = ?, updated_at = ?, available_at = ? WHERE id = ?",
+            (JOB_QUEUED, _dump(error), now, now + delay, job_id),
+        )
+        self.retried += 1
+
+    async def fail(self, job_id: str, error: dict) -> SummaryJob | None:
+        """Mark a job failed for good"""
+        job = await asyncio.to_thread(self._finish, job_id, JOB_FAILED, None, _dump(error))
+        self.failed += 1
+        return job
+
+    async def get(self, job_id: str) -> SummaryJob | None:
+        """Get a job"""
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use"""
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS summary_jobs (
+                    id TEXT PRIMARY KEY,
+                    dedup_key TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    max_attempts INTEGER NOT NULL,
+                    request TEXT NOT NULL,
+                    callback_url TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    available_at REAL NOT NULL
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summary_jobs_ready "
+                "ON summary_jobs (status, priority DESC, available_at, created_at)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_summary_jobs_dedup_key ON summary_jobs (dedup_key)")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_summary_jobs_updated_at ON summary_jobs (updated_at)")
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS summary_job_callbacks (
+                    job_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (job_id, url)
+                )"""
+            )
+            self._connection = connection
+        return self._connection
+
+    def _enqueue(self, job: SummaryJob) -> SummaryJob:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                # Take the write lock up front so concurrent processes cannot insert the same key twice
+                connection.execute("BEGIN IMMEDIATE")
+                row = connection.execute(
+                    f"SELECT {_COLUMNS} FROM summary_jobs WHERE dedup_key = ? AND status != ? "
+                    "ORDER BY created_at DESC LIMIT 1",
+                    (job.dedup_key, JOB_FAILED),
+                ).fetchone()
+                if row is not None:
+                    self.deduplicated += 1
+                    existing = self._with_callbacks(connection, row)
+                    if existing.is_finished:
+                        return existing
+                    self._attach(connection, existing.id, job.callback_urls)
+                    return self._with_callbacks(connection, row)
+
+                connection.execute(
+                    f"INSERT INTO summary_jobs ({_COLUMNS}, available_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job.id,
+                        job.dedup_key,
+                        job.priority,
+                        JOB_QUEUED,
+                        0,
+                        job.max_attempts,
+                        _dump(job.request),
+                        None,
+                        None,
+                        None,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                self.enqueued += 1
+                if self.retention is not None and self.enqueued % self.PURGE_INTERVAL == 0:
+                    connection.execute(
+                        "DELETE FROM summary_jobs WHERE status IN (?, ?) AND updated_at <= ?",
+                        (JOB_SUCCEEDED, JOB_FAILED, now - self.retention),
+                    )
+                    connection.execute(
+                        "DELETE FROM summary_job_callbacks WHERE job_id NOT IN (SELECT id FROM summary_jobs)"
+                    )
+                self._attach(connection, job.id, job.callback_urls)
+                row = connection.execute(f"SELECT {_COLUMNS} FROM summary_jobs WHERE id = ?", (job.id,)).fetchone()
+                return self._with_callbacks(connection, row)
+
+    def _claim(self, lease_seconds: float) -> SummaryJob | None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                row = connection.execute(
+                    f"""UPDATE summary_jobs
+                    SET status = ?, attempts = attempts + 1, updated_at = ?, available_at = ?
+                    WHERE id = (
+                        SELECT id FROM summary_jobs
+                        WHERE status IN (?, ?) AND available_at <= ?
+                        ORDER BY priority DESC, created_at
+                        LIMIT 1
+                    )
+                    RETURNING {_COLUMNS}""",
+                    (JOB_RUNNING, now, now + lease_seconds, JOB_QUEUED, JOB_RUNNING, now),
+                ).fetchone()
+                return self._with_callbacks(connection, row) if row is not None else None
+
+    def _finish(self, job_id: str, status: str, result: str | None, error: str | None) -> SummaryJob | None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                row = connection.execute(
+                    "UPDATE summary_jobs SET status = ?, result = ?, error = COALESCE(?, error), updated_at = ? "
+                    f"WHERE id = ? RETURNING {_COLUMNS}",
+                    (status, result, error, time.time(), job_id),
+                ).fetchone()
+                return self._with_callbacks(connection, row) if row is not None else None
+
+    def _update(self, statement: str, parameters: tuple) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(statement, parameters)
+
+    def _get(self, job_id: str) -> SummaryJob | None:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(f"SELECT {_COLUMNS} FROM summary_jobs WHERE id = ?", (job_id,)).fetchone()
+            return self._with_callbacks(connection, row) if row is not None else None
+
+    @staticmethod
+    def _attach(connection: sqlite3.Connection, job_id: str, callback_urls: list[str]) -> None:
+        connection.executemany(
+            "INSERT OR IGNORE INTO summary_job_callbacks (job_id, url) VALUES (?, ?)",
+            [(job_id, url) for url in callback_urls],
+        )
+
+    @staticmethod
+    def _with_callbacks(connection: sqlite3.Connection, row: tuple) -> SummaryJob:
+        callback_urls = connection.execute(
+            "SELECT url FROM summary_job_callbacks WHERE job_id = ? ORDER BY rowid", (row[0],)
+        ).fetchall()
+        return _row_to_job(row, [url for (url,) in callback_urls])
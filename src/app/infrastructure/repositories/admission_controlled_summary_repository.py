@@ -0,0 +1,102 @@
+"""Admission-controlling decorator for summary repositories"""
+
+import time
+from collections.abc import AsyncIterator, Callable
+
+from app.domain.entities.summary import Summary, SummaryChunk
+from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.services.text_chunker import estimate_tokens
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.shared.admission_controller import AdmissionController
+from app.shared.service_time import ServiceTimeEstimator
+
+
+class AdmissionControlledSummaryRepository(SummaryRepository):
+    """
+    Run upstream calls only within the admission controller's concurrency limit
+
+    With a service time estimator, each call waits with its expected duration
+    as its cost, and the observed duration of finished calls trains the
+    estimator.
+
+    Finished calls report their size in output tokens, prefill included, as
+    the permit's work, so the adaptive limit compares latencies of calls with
+    very different inputs. Without an estimator the default coefficients
+    weigh input against output tokens.
+    """
+
+    def __init__(
+        self,
+        summary_repository: SummaryRepository,
+        admission_controller: AdmissionController,
+        service_time_estimator: ServiceTimeEstimator | None = None,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Initialize admission-controlled summary repository
+
+        Args:
+            summary_repository: Repository calling the model
+            admission_controller: Limits concurrent calls and sheds excess load
+            service_time_estimator: Predicts call durations for shortest-first admission; None for unit costs
+            count_tokens: Token counting function for the estimator's input size
+        """
+        self.summary_repository = summary_repository
+        self.admission_controller = admission_controller
+        self.service_time_estimator = service_time_estimator
+        self.count_tokens = count_tokens
+        self._size_model = service_time_estimator or ServiceTimeEstimator()
+
+    async def summarize_text(self, text: str, config: SummaryConfig) -> Summary:
+        """
+        Summarize text once a slot is available
+
+        Raises:
+            ServiceOverloadedError: If the request is shed
+        """
+        input_tokens, cost = self._estimate(text, config)
+        async with self.admission_controller.slot(cost=cost) as permit:
+            start = time.perf_counter()
+            summary = await self.summary_repository.summarize_text(text, config)
+            permit.work = self._work(input_tokens, summary)
+            self._observe(input_tokens, config, summary, time.perf_counter() - start)
+            return summary
+
+    async def summarize_text_stream(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """
+        Stream a summary, holding a slot until the stream ends
+
+        Raises:
+            ServiceOverloadedError: If the request is shed
+        """
+        input_tokens, cost = self._estimate(text, config)
+        async with self.admission_controller.slot(cost=cost) as permit:
+            start = time.perf_counter()
+            async for chunk in self.summary_repository.summarize_text_stream(text, config):
+                if chunk.summary is not None:
+                    permit.work = self._work(input_tokens, chunk.summary)
+                    self._observe(input_tokens, config, chunk.summary, time.perf_counter() - start)
+                yield chunk
+
+    def _estimate(self, text: str, config: SummaryConfig) -> tuple[int, float]:
+        """Input tokens and expected seconds of a call; unit cost without an estimator"""
+        input_tokens = self.count_tokens(text)
+        if self.service_time_estimator is None:
+            return input_tokens, 1.0
+        return input_tokens, self.service_time_estimator.estimate(input_tokens, config.summary_type, config.max_tokens)
+
+    def _work(self, input_tokens: int, summary: Summary) -> float | None:
+        """Size of a finished call for the adaptive limit; None when its completion tokens are unknown"""
+        if summary.completion_tokens is None:
+            return None
+        return self._size_model.work(input_tokens, summary.completion_tokens)
+
+    def _observe(self, input_tokens: int, config: SummaryConfig, summary: Summary, seconds: float) -> None:
+        if self.service_time_estimator is not None:
+            self.service_time_estimator.observe(
+                input_tokens, config.summary_type, config.max_tokens, summary.completion_tokens, seconds
+            )
+
+    async def health_check(self) -> bool:
+        """Delegate health check to the wrapped repository without taking a slot"""
+        return await self.summary_repository.health_check()
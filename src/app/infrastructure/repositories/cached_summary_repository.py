@@ -0,0 +1,131 @@
+"""Result-caching decorator for summary repositories"""
+
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import datetime
+
+from app.domain.entities.summary import Summary, SummaryChunk
+from app.domain.repositories.summary_cache import SummaryCache
+from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.value_objects.content_key import summary_key
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.external_services.prompt_registry import PromptRegistry
+from app.shared.metrics import record_cache
+
+
+class CachedSummaryRepository(SummaryRepository):
+    """
+    Serve repeated (text, config) requests from a content-addressed cache
+
+    With a prompt registry, the version of the prompt a request would use is
+    part of its key, so results generated with older templates are not served
+    once the wording changes.
+    """
+
+    def __init__(
+        self,
+        summary_repository: SummaryRepository,
+        cache: SummaryCache,
+        enabled: bool = True,
+        cache_nondeterministic: bool = False,
+        prompt_registry: PromptRegistry | None = None,
+    ):
+        """
+        Initialize cached summary repository
+
+        Args:
+            summary_repository: Repository that generates summaries on a miss
+            cache: Summary result cache
+            enabled: Whether caching is active
+            cache_nondeterministic: Also cache results generated with temperature > 0
+            prompt_registry: Prompt templates whose version keys the results; None to leave it out
+        """
+        self.summary_repository = summary_repository
+        self.cache = cache
+        self.enabled = enabled
+        self.cache_nondeterministic = cache_nondeterministic
+        self.prompt_registry = prompt_registry
+
+    def is_cacheable(self, config: SummaryConfig) -> bool:
+        """Only deterministic generations are cached unless explicitly allowed"""
+        return self.enabled and (config.temperature == 0.0 or self.cache_nondeterministic)
+
+    async def summarize_text(self, text: str, config: SummaryConfig) -> Summary:
+        """
+        Summarize text, reusing a cached result when available
+
+        Args:
+            text: Text to summarize
+            config: Summary configuration
+
+        Returns:
+            Summary entity with ``cache_status`` set to hit, miss or bypass
+        """
+        if not self.is_cacheable(config):
+            record_cache("bypass")
+            summary = await self.summary_repository.summarize_text(text, config)
+            return replace(summary, cache_status="bypass")
+
+        key = self.key(text, config)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return self._from_cache(cached, text)
+
+        summary = await self.summary_repository.summarize_text(text, config)
+        return await self._store(key, summary)
+
+    async def summarize_text_stream(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """
+        Stream a summary, replaying a cached result when available
+
+        Args:
+            text: Text to summarize
+            config: Summary configuration
+
+        Yields:
+            Text chunks, then a final chunk whose Summary has ``cache_status`` set
+        """
+        cacheable = self.is_cacheable(config)
+        key = self.key(text, config) if cacheable else None
+        if not cacheable:
+            record_cache("bypass")
+
+        if cacheable:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                summary = self._from_cache(cached, text)
+                yield SummaryChunk(text=summary.summary_text)
+                yield SummaryChunk(summary=summary)
+                return
+
+        async for chunk in self.summary_repository.summarize_text_stream(text, config):
+            if chunk.summary is None:
+                yield chunk
+            elif cacheable:
+                yield SummaryChunk(summary=await self._store(key, chunk.summary))
+            else:
+                yield SummaryChunk(summary=replace(chunk.summary, cache_status="bypass"))
+
+    def key(self, text: str, config: SummaryConfig) -> str:
+        """Cache key of a request: its text, config and prompt version"""
+        if self.prompt_registry is None:
+            return summary_key(text, config)
+        prompt = self.prompt_registry.get(config.language, config.summary_type)
+        return summary_key(text, config, {"prompt_version": prompt.version})
+
+    def _from_cache(self, cached: Summary, text: str) -> Summary:
+        """Build the response entity for a cache hit"""
+        record_cache("hit")
+        return replace(cached, id=str(uuid.uuid4()), original_text=text, created_at=datetime.now(), cache_status="hit")
+
+    async def _store(self, key: str, summary: Summary) -> Summary:
+        """Cache a freshly generated summary and mark it as a miss"""
+        record_cache("miss")
+        # The caller's text is restored on a hit, so it is not kept in the cache
+        await self.cache.set(key, replace(summary, original_text="", cache_status=None))
+        return replace(summary, cache_status="miss")
+
+    async def health_check(self) -> bool:
+        """Delegate health check to the wrapped repository"""
+        return await self.summary_repository.health_check()
@@ -1,66 +1,176 @@
 """LMStudio implementation of summary repository"""
 
+import time
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from langchain.schema import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-
-from app.domain.entities.summary import Summary
+from app.domain.entities.summary import Summary, SummaryChunk
 from app.domain.repositories.summary_repository import SummaryRepository
 from app.domain.value_objects.summary_config import LMStudioConfig, SummaryConfig
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.external_services.openai_chat_client import OpenAIChatClient
+from app.infrastructure.external_services.prompt_registry import PromptRegistry
+from app.infrastructure.external_services.reasoning import (
+    NO_THINK_DIRECTIVE,
+    ReasoningFilter,
+    ReasoningPolicy,
+    split_reasoning,
+)
+from app.infrastructure.external_services.token_budget import PromptBudget, PromptBudgeter, TokenCounter
+from app.infrastructure.external_services.upstream_health_monitor import UpstreamHealthMonitor
+from app.shared.lru_cache import LRUCache
+from app.shared.metrics import observe_stage, record_tokens, time_stage
+from app.shared.usage import record_call_started, record_usage
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+else:
+    # LangChain (with openai and langsmith) takes about a second to import, so it is
+    # loaded on first use or by the lifespan warmup rather than with this module
+    ChatOpenAI = None
+
+CLIENT_BACKENDS = ("langchain", "raw")
+
+
+def load_langchain() -> None:
+    """Import the LangChain chat model if it is not loaded yet"""
+    global ChatOpenAI
+    if ChatOpenAI is None:
+        from langchain_openai import ChatOpenAI as chat_openai
+
+        ChatOpenAI = chat_openai
 
 
 class LMStudioSummaryRepository(SummaryRepository):
     """LMStudio-based implementation of summary repository"""
 
-    def __init__(self, lmstudio_config: LMStudioConfig):
+    def __init__(
+        self,
+        lmstudio_config: LMStudioConfig,
+        client_pool: LLMClientPool | None = None,
+        max_cached_clients: int = 16,
+        prompt_budgeter: PromptBudgeter | None = None,
+        health_monitor: UpstreamHealthMonitor | None = None,
+        prompt_registry: PromptRegistry | None = None,
+        client_backend: str = "langchain",
+        reasoning_policy: ReasoningPolicy | None = None,
+    ):
         """
         Initialize LMStudio summary repository
 
         Args:
             lmstudio_config: LMStudio configuration
+            client_pool: Shared HTTP connection pool; a private one is created if omitted
+            max_cached_clients: Maximum number of configured LLM handles kept
+            prompt_budgeter: Fits prompts into the context window; defaults to the character estimate
+            health_monitor: Cached upstream probe; without one every health check runs a generation
+            prompt_registry: Compiled system prompts; defaults to the built-in templates
+            client_backend: ``langchain`` (ChatOpenAI) or ``raw`` (OpenAI-compatible HTTP without LangChain)
+            reasoning_policy: Which models may reason and how it is switched off; defaults to off for Qwen3
         """
+        if client_backend not in CLIENT_BACKENDS:
+            raise ValueError(f"client_backend must be one of: {', '.join(CLIENT_BACKENDS)}")
+
         self.config = lmstudio_config
-        self._llm: ChatOpenAI | None = None
-
-    def _get_llm(self, summary_config: SummaryConfig) -> ChatOpenAI:
-        """Get or create LLM instance"""
-        if self._llm is None:
-            self._llm = ChatOpenAI(
-                base_url=self.config.base_url,
-                api_key=self.config.api_key,
-                model=summary_config.model_name,
-                temperature=summary_config.temperature,
-                max_tokens=summary_config.max_tokens,
-                timeout=self.config.timeout,
-                max_retries=self.config.max_retries,
-            )
-        return self._llm
-
-    def _get_system_prompt(self, config: SummaryConfig) -> str:
-        """Generate system prompt based on configuration"""
-        language_instruction = {
-            "korean": "한국어로 답변해주세요.",
-            "english": "Please respond in English.",
-            "japanese": "日本語で答えてください。",
-        }.get(config.language, "한국어로 답변해주세요.")
-
-        summary_style = {
-            "concise": "간결하고 핵심적인 내용으로 요약해주세요.",
-            "detailed": "상세하고 포괄적인 내용으로 요약해주세요.",
-            "bullet_points": "주요 내용을 불릿 포인트 형태로 정리해주세요.",
-        }.get(config.summary_type, "간결하고 핵심적인 내용으로 요약해주세요.")
-
-        return f"""당신은 전문적인 텍스트 요약 어시스턴트입니다.
-주어진 텍스트를 분석하여 핵심 내용을 추출하고 요약해주세요.
-
-요약 지침:
-- {summary_style}
-- {language_instruction}
-- 원본 텍스트의 주요 정보와 맥락을 유지해주세요.
-- 불필요한 세부사항은 제거하되, 중요한 내용은 누락하지 마세요.
-- 명확하고 이해하기 쉬운 문장으로 작성해주세요."""
+        self.client_pool = client_pool or LLMClientPool(lmstudio_config)
+        self.prompt_budgeter = prompt_budgeter or PromptBudgeter(TokenCounter())
+        self.health_monitor = health_monitor
+        self.prompt_registry = prompt_registry or PromptRegistry(self.prompt_budgeter)
+        self.client_backend = client_backend
+        self.reasoning_policy = reasoning_policy or ReasoningPolicy()
+        self._no_think_tokens = self.prompt_budgeter.token_counter.count(NO_THINK_DIRECTIVE)
+        self._llm_cache = LRUCache(max_size=max_cached_clients)
+
+    @property
+    def llm_cache_stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters of the LLM handle cache"""
+        return {"size": len(self._llm_cache), **self._llm_cache.stats.to_dict()}
+
+    def _get_llm(self, summary_config: SummaryConfig) -> "ChatOpenAI | OpenAIChatClient":
+        """Get or create the LLM handle for the given generation parameters"""
+        key = (summary_config.model_name, summary_config.temperature, summary_config.max_tokens)
+        return self._llm_cache.get_or_create(key, lambda: self._create_llm(summary_config))
+
+    def _create_llm(self, summary_config: SummaryConfig) -> "ChatOpenAI | OpenAIChatClient":
+        """Create an LLM handle on the shared HTTP client"""
+        if self.client_backend == "raw":
+            chat_model = OpenAIChatClient
+        else:
+            load_langchain()
+            chat_model = ChatOpenAI
+        return chat_model(
+            base_url=self.config.base_url,
+            api_key=self.config.api_key,
+            model=summary_config.model_name,
+            temperature=summary_config.temperature,
+            max_tokens=summary_config.max_tokens,
+            timeout=self.config.timeout,
+            max_retries=self.config.max_retries,
+            http_async_client=self.client_pool.http_client,
+        )
+
+    def _build_messages(self, text: str, config: SummaryConfig) -> tuple[list[dict], PromptBudget]:
+        """
+        Build the chat messages for a summarization request
+
+        Raises:
+            ValueError: If the text does not fit the context window and the policy is reject
+        """
+        prompt = self.prompt_registry.get(config.language, config.summary_type)
+        system_prompt, overhead = prompt.system_prompt, prompt.overhead_tokens
+        if self.reasoning_policy.suppression(config.model_name, config.reasoning) == "no_think":
+            # Appended to the system prompt so the cacheable prefix stays identical across requests
+            system_prompt += NO_THINK_DIRECTIVE
+            overhead += self._no_think_tokens
+        budget = self.prompt_budgeter.fit(system_prompt, prompt.user_prefix, text, config.max_tokens, overhead=overhead)
+
+        # OpenAI-format dicts, accepted by ChatOpenAI and the raw client alike
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt.user_prefix + budget.text},
+        ]
+        return messages, budget
+
+    def _generation_kwargs(self, budget: PromptBudget, config: SummaryConfig) -> dict:
+        """Per-call overrides; max_tokens is capped to the context left after the prompt"""
+        kwargs = {"max_tokens": budget.max_tokens} if budget.max_tokens < config.max_tokens else {}
+        if self.reasoning_policy.suppression(config.model_name, config.reasoning) == "chat_template_kwargs":
+            kwargs["extra_body"] = {"chat_template_kwargs": {"enable_thinking": False}}
+        return kwargs
+
+    def _build_summary(
+        self,
+        text: str,
+        summary_text: str,
+        config: SummaryConfig,
+        budget: PromptBudget,
+        usage: dict | None = None,
+        generated_text: str | None = None,
+    ) -> Summary:
+        """
+        Build the summary entity for a completed generation, preferring server-reported usage
+
+        Completion tokens are counted over ``generated_text`` (the answer and any
+        reasoning) when given, since reasoning tokens are generated and paid for too.
+        The summary is marked truncated when the text was cut to fit the context window.
+        """
+        if not isinstance(usage, dict):
+            usage = {}
+
+        return Summary(
+            id=str(uuid.uuid4()),
+            original_text=text,
+            summary_text=summary_text,
+            created_at=datetime.now(),
+            model_name=config.model_name,
+            summary_length=len(summary_text),
+            prompt_tokens=usage.get("input_tokens") or budget.prompt_tokens,
+            completion_tokens=usage.get("output_tokens")
+            or self.prompt_budgeter.token_counter.count(generated_text or summary_text),
+            truncated=budget.truncated,
+        )
 
     async def summarize_text(self, text: str, config: SummaryConfig) -> Summary:
         """
@@ -72,33 +182,102 @@ class LMStudioSummaryRepository(SummaryRepository):
 
         Returns:
             Summary entity
+
+        Raises:
+            ValueError: If the text does not fit the context window and the policy is reject
+            RuntimeError: If the upstream call fails
         """
+        with time_stage("prompt_build"):
+            messages, budget = self._build_messages(text, config)
+
         try:
             llm = self._get_llm(config)
 
-            system_prompt = self._get_system_prompt(config)
-            user_prompt = f"다음 텍스트를 요약해주세요:\n\n{text}"
-
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt),
-            ]
-
-            response = await llm.ainvoke(messages)
-            summary_text = response.content.strip()
+            record_call_started()
+            with time_stage("upstream_total"):
+                response = await llm.ainvoke(messages, **self._generation_kwargs(budget, config))
+            summary_text, reasoning = split_reasoning(response.content)
 
-            return Summary(
-                id=str(uuid.uuid4()),
-                original_text=text,
-                summary_text=summary_text,
-                created_at=datetime.now(),
-                model_name=config.model_name,
-                summary_length=len(summary_text),
+            summary = self._build_summary(
+                text,
+                summary_text.strip(),
+                config,
+                budget,
+                getattr(response, "usage_metadata", None),
+                generated_text=response.content,
             )
+            record_tokens(summary.prompt_tokens, summary.completion_tokens, self._count_reasoning(reasoning))
+            record_usage(summary.prompt_tokens, summary.completion_tokens)
+            return summary
 
         except Exception as e:
             raise RuntimeError("Failed to summarize text") from e
 
+    async def summarize_text_stream(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """
+        Summarize text using LMStudio, yielding tokens as they arrive
+
+        Args:
+            text: Text to summarize
+            config: Summary configuration
+
+        Yields:
+            Text chunks, then a final chunk carrying the Summary entity
+
+        Raises:
+            ValueError: If the text does not fit the context window and the policy is reject
+            RuntimeError: If the upstream call fails
+        """
+        with time_stage("prompt_build"):
+            messages, budget = self._build_messages(text, config)
+
+        generated, parts = [], []
+        reasoning_filter = ReasoningFilter()
+        record_call_started()
+        reported = False
+        try:
+            try:
+                llm = self._get_llm(config)
+
+                start = time.perf_counter()
+                async for chunk in llm.astream(messages, **self._generation_kwargs(budget, config)):
+                    if chunk.content:
+                        generated.append(chunk.content)
+                        answer = reasoning_filter.feed(chunk.content)
+                        if answer:
+                            # First answer token; reasoning is not output
+                            if not parts:
+                                observe_stage("upstream_first_token", time.perf_counter() - start)
+                            parts.append(answer)
+                            yield SummaryChunk(text=answer)
+                observe_stage("upstream_total", time.perf_counter() - start)
+
+            except Exception as e:
+                raise RuntimeError("Failed to summarize text") from e
+
+            tail = reasoning_filter.flush()
+            if tail:
+                parts.append(tail)
+                yield SummaryChunk(text=tail)
+
+            summary = self._build_summary(
+                text, "".join(parts).strip(), config, budget, generated_text="".join(generated)
+            )
+            record_tokens(
+                summary.prompt_tokens, summary.completion_tokens, self._count_reasoning(reasoning_filter.reasoning)
+            )
+            record_usage(summary.prompt_tokens, summary.completion_tokens)
+            reported = True
+            yield SummaryChunk(summary=summary)
+
+        finally:
+            if not reported:
+                # Failed or abandoned mid-stream: the prompt and the tokens generated so far were still computed
+                record_usage(budget.prompt_tokens, self.prompt_budgeter.token_counter.count("".join(generated)))
+
+    def _count_reasoning(self, reasoning: str) -> int:
+        return self.prompt_budgeter.token_counter.count(reasoning) if reasoning.strip() else 0
+
     async def health_check(self) -> bool:
         """
         Check if LMStudio service is healthy
@@ -106,13 +285,16 @@ class LMStudioSummaryRepository(SummaryRepository):
         Returns:
             True if healthy, False otherwise
         """
+        if self.health_monitor is not None:
+            return (await self.health_monitor.check()).healthy
+
         try:
             # Create a minimal configuration for health check
             config = SummaryConfig(max_tokens=50, temperature=0.1)
             llm = self._get_llm(config)
 
             # Send a simple test message
-            test_message = [HumanMessage(content="Hello")]
+            test_message = [{"role": "user", "content": "Hello"}]
             response = await llm.ainvoke(test_message)
 
             return bool(response.content.strip())
@@ -0,0 +1,302 @@
+"""Load-balancing summary repository over a pool of upstream endpoints"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+
+from app.domain.entities.summary import Summary, SummaryChunk
+from app.domain.exceptions import CircuitOpenError
+from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.shared.circuit_breaker import OPEN, CircuitBreaker
+from app.shared.metrics import ENDPOINT_OUTSTANDING, HEDGED_REQUESTS
+
+ROUTING_STRATEGIES = ("least_outstanding", "ewma")
+
+
+@dataclass
+class Endpoint:
+    """One upstream in the pool with its load and health state"""
+
+    name: str
+    repository: SummaryRepository
+    max_concurrency: int | None = None  # None for no per-endpoint cap
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    outstanding: int = 0
+    latency: float | None = None  # moving average of call duration in seconds
+    requests: int = 0
+
+    @property
+    def has_capacity(self) -> bool:
+        """Whether another call fits under the concurrency cap"""
+        return self.max_concurrency is None or self.outstanding < self.max_concurrency
+
+    def to_dict(self) -> dict:
+        """Serializable view for stats endpoints"""
+        return {
+            "name": self.name,
+            "outstanding": self.outstanding,
+            "max_concurrency": self.max_concurrency,
+            "latency_seconds": round(self.latency, 6) if self.latency is not None else None,
+            "requests": self.requests,
+            "circuit_breaker": self.breaker.stats,
+        }
+
+
+class RoutingSummaryRepository(SummaryRepository):
+    """
+    Spread calls over several OpenAI-compatible endpoints
+
+    Each call goes to the endpoint with the fewest calls in flight
+    (``least_outstanding``) or the lowest expected wait, i.e. moving-average
+    latency times calls in flight (``ewma``); ties rotate. Every endpoint has
+    a circuit breaker: endpoints that keep failing leave rotation until a
+    trial call succeeds, and calls fail fast while every breaker is open.
+    Callers wait when every endpoint in rotation is at its concurrency cap.
+
+    With hedging on, a call still running after the ``hedge_quantile``
+    latency of recent calls is sent once more, to another endpoint when one
+    has spare capacity, and the first success wins.
+    """
+
+    # Weight of the latest call in the latency moving average
+    LATENCY_ALPHA = 0.3
+    # Recent call durations kept for the hedging delay
+    LATENCY_WINDOW = 256
+
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        strategy: str = "least_outstanding",
+        hedging: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_delay: float = 1.0,
+        hedge_min_samples: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize routing summary repository
+
+        Args:
+            endpoints: Upstream endpoints to balance over
+            strategy: Endpoint selection, one of ``ROUTING_STRATEGIES``
+            hedging: Send a second attempt for calls slower than the hedge quantile
+            hedge_quantile: Latency quantile after which a call is hedged
+            hedge_min_delay: Lower bound of the hedging delay in seconds
+            hedge_min_samples: Calls observed before hedging starts
+            clock: Monotonic clock, injectable for tests
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"strategy must be one of {ROUTING_STRATEGIES}")
+        if not 0 < hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+
+        self.endpoints = endpoints
+        self.strategy = strategy
+        self.hedging = hedging
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.clock = clock
+
+        self._cursor = 0
+        self._capacity_freed = asyncio.Event()
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+    @property
+    def stats(self) -> list[dict]:
+        """Load, latency and circuit breaker counters per endpoint"""
+        return [endpoint.to_dict() for endpoint in self.endpoints]
+
+    def circuit_states(self) -> dict[str, str]:
+        """Circuit breaker state per endpoint"""
+        return {endpoint.name: endpoint.breaker.state for endpoint in self.endpoints}
+
+    def readiness(self) -> dict[str, bool | None]:
+        """Outcome of the latest generation probe per endpoint; None until one has run"""
+        states = {}
+        for endpoint in self.endpoints:
+            monitor = getattr(endpoint.repository, "health_monitor", None)
+            status = monitor.status if monitor is not None else None
+            states[endpoint.name] = status.ready if status is not None else None
+        return states
+
+    async def summarize_text(self, text: str, config: SummaryConfig) -> Summary:
+        """
+        Summarize text on the selected endpoint, hedging slow calls when enabled
+
+        Raises:
+            ValueError: If the text does not fit the context window and the policy is reject
+            CircuitOpenError: If every endpoint's circuit breaker is open
+            RuntimeError: If the upstream call fails
+        """
+        endpoint = await self._acquire()
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None:
+            return await self._call(endpoint, text, config)
+
+        attempts = [asyncio.create_task(self._call(endpoint, text, config))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_delay)
+            if not done and (hedge_endpoint := self._reserve_hedge(endpoint)) is not None:
+                HEDGED_REQUESTS.labels("sent").inc()
+                attempts.append(asyncio.create_task(self._call(hedge_endpoint, text, config)))
+
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is not attempts[0]:
+                            HEDGED_REQUESTS.labels("won").inc()
+                        return attempt.result()
+            # Every attempt failed; report the original one
+            return attempts[0].result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def summarize_text_stream(self, text: str, config: SummaryConfig) -> AsyncIterator[SummaryChunk]:
+        """
+        Stream a summary from the selected endpoint, which counts as busy until the stream ends
+
+        Streams are not hedged: tokens already sent to the client cannot be taken back.
+
+        Raises:
+            ValueError: If the text does not fit the context window and the policy is reject
+            CircuitOpenError: If every endpoint's circuit breaker is open
+            RuntimeError: If the upstream call fails
+        """
+        endpoint = await self._acquire()
+        start = self.clock()
+        outcome_recorded = False
+        try:
+            async for chunk in endpoint.repository.summarize_text_stream(text, config):
+                yield chunk
+        except RuntimeError:
+            endpoint.breaker.record_failure()
+            outcome_recorded = True
+            raise
+        else:
+            self._record_success(endpoint, self.clock() - start)
+            outcome_recorded = True
+        finally:
+            if not outcome_recorded:
+                endpoint.breaker.record_abandoned()
+            self._release(endpoint)
+
+    async def health_check(self) -> bool:
+        """Healthy while at least one endpoint is live and not cut off by its circuit breaker"""
+        endpoints = [endpoint for endpoint in self.endpoints if endpoint.breaker.state != OPEN]
+        results = await asyncio.gather(
+            *(endpoint.repository.health_check() for endpoint in endpoints), return_exceptions=True
+        )
+        return any(result is True for result in results)
+
+    async def _call(self, endpoint: Endpoint, text: str, config: SummaryConfig) -> Summary:
+        """Run one call on an endpoint reserved by ``_acquire`` and record its outcome"""
+        start = self.clock()
+        try:
+            summary = await endpoint.repository.summarize_text(text, config)
+        except RuntimeError:
+            endpoint.breaker.record_failure()
+            raise
+        except BaseException:
+            endpoint.breaker.record_abandoned()
+            raise
+        else:
+            self._record_success(endpoint, self.clock() - start)
+            return summary
+        finally:
+            self._release(endpoint)
+
+    async def _acquire(self) -> Endpoint:
+        """
+        Reserve a call on the best endpoint, waiting while all of them are at capacity
+
+        Raises:
+            CircuitOpenError: If every endpoint's circuit breaker is open
+        """
+        while (endpoint := self._select()) is None:
+            self._capacity_freed.clear()
+            await self._capacity_freed.wait()
+
+        self._reserve(endpoint)
+        return endpoint
+
+    def _reserve_hedge(self, primary: Endpoint) -> Endpoint | None:
+        """Reserve a hedged call without waiting, preferring an endpoint other than ``primary``"""
+        try:
+            endpoint = self._select(avoid=primary)
+        except CircuitOpenError:
+            return None
+        if endpoint is not None:
+            self._reserve(endpoint)
+        return endpoint
+
+    def _reserve(self, endpoint: Endpoint) -> None:
+        endpoint.breaker.before_call()
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        ENDPOINT_OUTSTANDING.labels(endpoint.name).set(endpoint.outstanding)
+
+    def _release(self, endpoint: Endpoint) -> None:
+        endpoint.outstanding -= 1
+        ENDPOINT_OUTSTANDING.labels(endpoint.name).set(endpoint.outstanding)
+        self._capacity_freed.set()
+
+    def _select(self, avoid: Endpoint | None = None) -> Endpoint | None:
+        """
+        Pick an endpoint with spare capacity, or None when all are full
+
+        Raises:
+            CircuitOpenError: If every endpoint's circuit breaker is open
+        """
+        in_rotation = [endpoint for endpoint in self.endpoints if endpoint.breaker.allows_request]
+        if not in_rotation:
+            retry_after = min(endpoint.breaker.retry_after for endpoint in self.endpoints)
+            raise CircuitOpenError("No upstream endpoint is available, please retry later", max(1.0, retry_after))
+
+        candidates = [endpoint for endpoint in in_rotation if endpoint.has_capacity]
+        if avoid is not None:
+            candidates = [endpoint for endpoint in candidates if endpoint is not avoid] or candidates
+        if not candidates:
+            return None
+
+        # Start the scan at a rotating offset so ties do not always go to the first endpoint
+        offset = self._cursor % len(candidates)
+        self._cursor += 1
+        candidates = candidates[offset:] + candidates[:offset]
+
+        if self.strategy == "ewma":
+            default_latency = self._mean_latency()
+            return min(
+                candidates,
+                key=lambda endpoint: (endpoint.latency or default_latency) * (endpoint.outstanding + 1),
+            )
+        return min(candidates, key=lambda endpoint: endpoint.outstanding)
+
+    def _mean_latency(self) -> float:
+        """Latency assumed for endpoints without samples yet"""
+        latencies = [endpoint.latency for endpoint in self.endpoints if endpoint.latency is not None]
+        return sum(latencies) / len(latencies) if latencies else 1.0
+
+    def _hedge_delay(self) -> float | None:
+        """Seconds after which a call is hedged, or None when hedging is off or still warming up"""
+        if not self.hedging or len(self._latencies) < self.hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        quantile = ordered[min(len(ordered) - 1, int(len(ordered) * self.hedge_quantile))]
+        return max(self.hedge_min_delay, quantile)
+
+    def _record_success(self, endpoint: Endpoint, seconds: float) -> None:
+        endpoint.breaker.record_success()
+        self._latencies.append(seconds)
+        if endpoint.latency is None:
+            endpoint.latency = seconds
+        else:
+            endpoint.latency += self.LATENCY_ALPHA * (seconds - endpoint.latency)
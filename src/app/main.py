@@ -2,24 +2,45 @@
 FastAPI Application Entry Point
 """
 
+import importlib.util
+import math
+import os
+from pathlib import Path
+
+import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config.container import Container
 from app.config.lifespan import lifespan
+from app.presentation.middleware.gzip import StreamingAwareGZipMiddleware
+from app.presentation.middleware.metrics import MetricsMiddleware
+from app.presentation.middleware.priority import PriorityMiddleware
+from app.presentation.middleware.rate_limit import RateLimitMiddleware
 from app.presentation.routers import summary
 from app.presentation.routers.health import health_router
-
-container = Container()
+from app.presentation.routers.metrics import metrics_router
+from app.presentation.routers.stats import stats_router
+from app.shared.metrics import prepare_multiprocess_dir
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
+    container = Container()
     settings = container.settings.provided()
 
     middleware = [
+        Middleware(MetricsMiddleware),
+        Middleware(
+            PriorityMiddleware,
+            lane_weights=settings.PRIORITY_LANE_WEIGHTS,
+            default_lane=settings.PRIORITY_DEFAULT_LANE,
+            lane_header=settings.PRIORITY_LANE_HEADER,
+            tenant_header=settings.PRIORITY_TENANT_HEADER,
+            api_key_lanes=settings.PRIORITY_API_KEY_LANES,
+            trusted_tenant_keys=settings.PRIORITY_TRUSTED_TENANT_KEYS,
+        ),
         Middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -27,8 +48,22 @@ def create_app() -> FastAPI:
             allow_methods=["*"],
             allow_headers=["*"],
         ),
-        Middleware(GZipMiddleware),
+        Middleware(
+            StreamingAwareGZipMiddleware,
+            minimum_size=settings.GZIP_MINIMUM_SIZE,
+            compresslevel=settings.GZIP_COMPRESS_LEVEL,
+        ),
     ]
+    if settings.RATE_LIMIT_ENABLED:
+        # Inside CORS so rejections carry its headers
+        middleware.insert(
+            3,
+            Middleware(
+                RateLimitMiddleware,
+                rate_limiter=container.rate_limiter(),
+                api_keys=[*settings.RATE_LIMIT_API_KEYS, *settings.RATE_LIMIT_API_KEY_TOKENS_PER_MINUTE],
+            ),
+        )
 
     app = FastAPI(
         title="llmplan",
@@ -41,10 +76,57 @@ def create_app() -> FastAPI:
     app.state.container = container
     app.state.settings = settings
 
+    app.include_router(metrics_router)
     app.include_router(health_router, prefix="/api/v1")
+    app.include_router(stats_router, prefix="/api/v1")
     app.include_router(summary.router, prefix="/api/v1")
 
     return app
 
 
+def available_cpus() -> int:
+    """CPUs this process may use, honouring the affinity mask and a cgroup v2 CPU quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(cpus, 1)
+
+
+def run() -> None:
+    """Production entry point: serve the app with uvicorn workers sized from the available CPUs"""
+    settings = app.state.settings
+    workers = settings.SERVER_WORKERS or available_cpus()
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    print(f"Serving llmplan: {workers} worker(s), loop={loop}, http={http}")
+    if workers > 1:
+        # Set before the workers import prometheus_client so /metrics covers all of them
+        print(f"Metrics directory: {prepare_multiprocess_dir()}")
+
+    uvicorn.run(
+        # The app is already imported here, so configuration errors surface before any worker starts;
+        # a single worker serves this instance, several re-import it in their own processes
+        app if workers == 1 else "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        # The client address of requests relayed by these peers is the one they forward
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_TRUSTED_PROXIES,
+    )
+
+
 app = create_app()
@@ -0,0 +1,37 @@
+"""GZip middleware that leaves streamed responses uncompressed"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+STREAMING_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+class StreamingAwareGZipMiddleware:
+    """
+    Compress responses unless the client asked for a streaming media type
+
+    A gzip stream only emits output once the compressor has buffered enough
+    input, which would hold back individual events or NDJSON lines.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        streaming_media_types: tuple[str, ...] = STREAMING_MEDIA_TYPES,
+    ):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.streaming_media_types = streaming_media_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self._accepts_stream(scope):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+    def _accepts_stream(self, scope: Scope) -> bool:
+        accept = Headers(scope=scope).get("accept", "")
+        return any(media_type in accept for media_type in self.streaming_media_types)
@@ -0,0 +1,44 @@
+"""Request metrics middleware"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.metrics import REQUEST_DURATION, observe_stage, start_request_timer
+
+
+class MetricsMiddleware:
+    """
+    Time every HTTP request and the serialization of its response
+
+    Requests are labelled with the route template rather than the raw path to
+    keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        timer = start_request_timer()
+        status_code = 500
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if timer.handler_finished is not None:
+                    observe_stage("serialization", time.perf_counter() - timer.handler_finished)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - timer.started
+            )
@@ -0,0 +1,76 @@
+"""Request priority middleware"""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.shared.priority import Priority, priority_scope
+
+
+def api_key_from_headers(headers: Headers) -> str | None:
+    """API key of a request, from ``X-API-Key`` or an ``Authorization: Bearer`` header"""
+    api_key = headers.get("x-api-key")
+    if api_key:
+        return api_key
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return token.strip()
+    return None
+
+
+class PriorityMiddleware:
+    """
+    Classify every HTTP request into a priority lane and tenant for admission control
+
+    The caller's lane is the one assigned to its API key, else the default
+    lane. It is a ceiling: the lane header may only move a request to a lane
+    of lower weight, e.g. a UI key sending its prefetches as bulk.
+
+    A configured key, one with a lane or trusted with tenants, is its own
+    tenant, so tenants of one lane get equal shares; only trusted keys, such
+    as a gateway serving many end users, may name tenants with the tenant
+    header. Anonymous callers and unknown keys share one tenant, so sending a
+    new key per request does not open a new flow. Headers alone therefore
+    cannot raise a caller's priority or multiply its share. The priority
+    holds for the whole request, including the batch items and streams it
+    starts.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        lane_weights: dict[str, float] | None = None,
+        default_lane: str = "default",
+        lane_header: str = "X-Priority",
+        tenant_header: str = "X-Tenant-ID",
+        api_key_lanes: dict[str, str] | None = None,
+        trusted_tenant_keys: list[str] | None = None,
+    ):
+        self.app = app
+        self.lane_weights = lane_weights or {default_lane: 1.0}
+        self.default_lane = default_lane
+        self.lane_header = lane_header
+        self.tenant_header = tenant_header
+        self.api_key_lanes = api_key_lanes or {}
+        self.trusted_tenant_keys = set(trusted_tenant_keys or [])
+
+    def classify(self, headers: Headers) -> Priority:
+        """Priority of a request from its headers"""
+        api_key = api_key_from_headers(headers)
+        lane = self.api_key_lanes.get(api_key, self.default_lane) if api_key else self.default_lane
+        requested = headers.get(self.lane_header, "").strip().lower()
+        if requested in self.lane_weights and self.lane_weights[requested] < self.lane_weights.get(lane, 0.0):
+            lane = requested
+
+        known = api_key in self.api_key_lanes or api_key in self.trusted_tenant_keys
+        tenant = api_key if known else ""
+        if api_key in self.trusted_tenant_keys and headers.get(self.tenant_header):
+            tenant = f"{api_key}/{headers[self.tenant_header]}"
+        return Priority(lane, tenant)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with priority_scope(self.classify(Headers(scope=scope))):
+            await self.app(scope, receive, send)
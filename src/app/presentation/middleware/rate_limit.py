@@ -0,0 +1,163 @@
+"""Per-caller token quota middleware"""
+
+import json
+import math
+from collections.abc import Callable, Hashable
+
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.dtos.responses.summary_response import ErrorResponse
+from app.domain.services.text_chunker import estimate_tokens
+from app.presentation.middleware.priority import api_key_from_headers
+from app.shared.metrics import record_error
+from app.shared.rate_limiter import TokenBucketRateLimiter
+from app.shared.usage import Usage, usage_scope
+
+
+class RateLimitMiddleware:
+    """
+    Enforce per-caller quotas of model tokens on summary requests
+
+    Callers with a known API key, one given a bucket in the settings, are
+    identified by it; all other callers by client address, which the server
+    takes from X-Forwarded-For when a trusted proxy relays the request.
+    Unknown keys are not trusted: a caller sending a new key on every request
+    would otherwise get a full bucket each time. A request to a
+    metered path is charged before it runs for its estimated cost: the tokens
+    of each text plus its ``max_tokens``, the most the model may generate. A
+    caller whose bucket cannot cover that gets 429 with ``Retry-After``.
+
+    Once the response is sent the estimate is settled against the upstream
+    calls. Requests that never reached the model (cache hits, shed or invalid
+    requests) are refunded. When every call reported its tokens, including
+    streams cut short, which report the prompt and the tokens generated so
+    far, the caller pays exactly those, so every pass of a hierarchical
+    summary is charged. A call that failed without reporting may have used
+    the GPU for its whole timeout, so the estimate is kept. Deferred paths
+    (job submissions) keep the estimate, since their calls run later,
+    outside the request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limiter: TokenBucketRateLimiter,
+        api_keys: list[str] | None = None,
+        metered_paths: tuple[str, ...] = ("/api/v1/summary/", "/api/v1/summary/stream", "/api/v1/summary/batch"),
+        deferred_paths: tuple[str, ...] = ("/api/v1/summary/jobs",),
+        default_max_tokens: int = 1000,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.api_keys = set(api_keys or [])
+        self.metered_paths = metered_paths
+        self.deferred_paths = deferred_paths
+        self.default_max_tokens = default_max_tokens
+        self.count_tokens = count_tokens
+
+    def caller(self, scope: Scope) -> Hashable:
+        """Bucket key of a request: its API key if known, else its client address"""
+        api_key = api_key_from_headers(Headers(scope=scope))
+        if api_key in self.api_keys:
+            return api_key
+        client = scope.get("client")
+        return ("client", client[0] if client else "")
+
+    def estimate(self, body: bytes) -> int:
+        """Prompt plus maximum completion tokens of a single or batch summary request; 0 if it is not one"""
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 0
+        if not isinstance(payload, dict):
+            return 0
+        items = payload.get("items", [payload])
+        if not isinstance(items, list):
+            return 0
+
+        cost = 0
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("text"), str):
+                max_tokens = item.get("max_tokens")
+                cost += self.count_tokens(item["text"])
+                cost += max_tokens if isinstance(max_tokens, int) else self.default_max_tokens
+        return cost
+
+    @staticmethod
+    def settle(cost: int, usage: Usage) -> int:
+        """Tokens to return (positive) or charge (negative) after a charge of ``cost``"""
+        if usage.started == 0:
+            return cost
+        if usage.unreported:
+            return min(0, cost - usage.tokens)
+        return cost - usage.tokens
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope["path"] if scope["type"] == "http" and scope["method"] == "POST" else None
+        if path not in self.metered_paths and path not in self.deferred_paths:
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        cost = self.estimate(body)
+        caller = self.caller(scope)
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        if cost == 0:
+            # Not a summary request; validation rejects it without calling the model
+            await self.app(scope, replay, send)
+            return
+
+        retry_after = self.rate_limiter.try_acquire(caller, cost)
+        if retry_after:
+            await _quota_exceeded(retry_after)(scope, replay, send)
+            return
+
+        if path in self.deferred_paths:
+            await self.app(scope, replay, send)
+            return
+
+        with usage_scope() as usage:
+            try:
+                await self.app(scope, replay, send)
+            finally:
+                self.rate_limiter.adjust(caller, self.settle(cost, usage))
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _quota_exceeded(retry_after: float) -> JSONResponse:
+    """429 in the shape of the routers' errors, with Retry-After"""
+    seconds = math.ceil(retry_after)
+    error = ErrorResponse(
+        error="Token quota exceeded, please retry later",
+        error_code="RATE_LIMITED",
+        details=f"Retry after {seconds} seconds",
+    )
+    record_error(error.error_code)
+    return JSONResponse(
+        {"detail": error.model_dump(mode="json")},
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(seconds)},
+    )
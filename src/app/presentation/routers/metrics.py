@@ -0,0 +1,14 @@
+"""Prometheus metrics router"""
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from app.shared.metrics import render_metrics
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Metrics in the Prometheus text exposition format"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,52 @@
+"""Runtime statistics router"""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.config.container import Container
+from app.domain.repositories.summary_cache import SummaryCache
+from app.domain.repositories.summary_job_queue import SummaryJobQueue
+from app.domain.repositories.summary_store import SummaryStore
+from app.infrastructure.external_services.webhook_notifier import WebhookNotifier
+from app.infrastructure.repositories.routing_summary_repository import Endpoint
+from app.shared.admission_controller import AdmissionController
+from app.shared.rate_limiter import TokenBucketRateLimiter
+from app.shared.service_time import ServiceTimeEstimator
+from app.shared.single_flight import SingleFlight
+
+stats_router = APIRouter(tags=["Stats"])
+
+
+@stats_router.get("/stats")
+@inject
+async def get_stats(
+    single_flight: SingleFlight = Depends(Provide[Container.single_flight]),
+    summary_cache: SummaryCache = Depends(Provide[Container.summary_cache]),
+    endpoints: list[Endpoint] = Depends(Provide[Container.lmstudio_endpoints]),
+    admission_controller: AdmissionController = Depends(Provide[Container.admission_controller]),
+    service_time_estimator: ServiceTimeEstimator = Depends(Provide[Container.service_time_estimator]),
+    rate_limiter: TokenBucketRateLimiter = Depends(Provide[Container.rate_limiter]),
+    job_queue: SummaryJobQueue = Depends(Provide[Container.summary_job_queue]),
+    webhook_notifier: WebhookNotifier = Depends(Provide[Container.webhook_notifier]),
+    summary_store: SummaryStore = Depends(Provide[Container.summary_store]),
+) -> dict:
+    """Counters of the request coalescing, result cache, rate limiting, admission control, routing, job queue and store layers"""
+    return {
+        "single_flight": single_flight.stats,
+        "summary_cache": summary_cache.stats,
+        "rate_limit": rate_limiter.stats,
+        "admission": {**admission_controller.stats, "service_time": service_time_estimator.stats},
+        "endpoints": [_endpoint_stats(endpoint) for endpoint in endpoints],
+        "jobs": {**job_queue.stats, "webhooks": webhook_notifier.stats},
+        "summary_store": summary_store.stats,
+    }
+
+
+def _endpoint_stats(endpoint: Endpoint) -> dict:
+    """Routing counters, latest health probe and LLM handle cache of one endpoint"""
+    upstream = endpoint.repository.health_monitor.status
+    return {
+        **endpoint.to_dict(),
+        "upstream": upstream.to_dict() if upstream is not None else None,
+        "llm_clients": endpoint.repository.llm_cache_stats,
+    }
@@ -1,25 +1,86 @@
 """Summary API router"""
 
+import math
+from collections.abc import AsyncIterator
+from typing import Literal
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from app.application.dtos.requests.summary_request import (
     HealthCheckRequest,
+    SummaryBatchRequest,
+    SummaryJobRequest,
+    SummaryListRequest,
     SummaryRequest,
 )
 from app.application.dtos.responses.summary_response import (
     ErrorResponse,
     HealthCheckResponse,
+    SummaryBatchItemResponse,
+    SummaryBatchResponse,
+    SummaryDeltaResponse,
+    SummaryJobResponse,
+    SummaryListResponse,
     SummaryResponse,
 )
 from app.application.use_cases.summary_use_cases import (
+    GetSummaryJobUseCase,
+    GetSummaryUseCase,
     HealthCheckUseCase,
+    ListSummariesUseCase,
+    SubmitSummaryJobUseCase,
+    SummarizeBatchUseCase,
+    SummarizeTextStreamUseCase,
     SummarizeTextUseCase,
 )
 from app.config.container import Container
+from app.domain.exceptions import ServiceOverloadedError
+from app.shared.metrics import mark_handler_finished, observe_validation, record_error
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Fields left out of the slim projection, per response shape
+SLIM_SUMMARY_EXCLUDE = {"original_text"}
+SLIM_BATCH_ITEM_EXCLUDE = {"result": SLIM_SUMMARY_EXCLUDE}
+SLIM_BATCH_EXCLUDE = {"items": {"__all__": SLIM_BATCH_ITEM_EXCLUDE}}
+SLIM_LIST_EXCLUDE = {"items": {"__all__": SLIM_SUMMARY_EXCLUDE}}
+
+
+def slim_view(
+    view: Literal["full", "slim"] = Query(
+        default="full", description="`slim` omits the original text and returns only the summary and its stats"
+    ),
+    prefer: str = Header(default="", description="`return=minimal` selects the slim view"),
+) -> bool:
+    """Whether the caller asked for the slim projection, by query parameter or ``Prefer: return=minimal``"""
+    return view == "slim" or "return=minimal" in prefer
+
+
+def _json_response(model: BaseModel, exclude: dict | set | None = None, headers: dict | None = None) -> Response:
+    """Serialize a DTO straight to JSON bytes with pydantic-core, skipping jsonable_encoder and re-validation"""
+    return Response(content=model.model_dump_json(exclude=exclude), media_type="application/json", headers=headers)
+
+
+def _error_response(error: Exception) -> ErrorResponse:
+    """Build the error DTO for an exception and count it by error code"""
+    error_response = ErrorResponse.from_exception(error)
+    record_error(error_response.error_code)
+    return error_response
+
+
+def _overloaded_exception(error: ServiceOverloadedError) -> HTTPException:
+    """429 when the wait queue is full, 503 when the wait expired or the upstream circuit is open; with Retry-After"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS if error.queue_full else status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=_error_response(error).model_dump(mode="json"),
+        headers={"Retry-After": str(math.ceil(error.retry_after))},
+    )
+
 
 @router.post(
     "/",
@@ -31,55 +92,251 @@ router = APIRouter(prefix="/summary", tags=["summary"])
 @inject
 async def summarize_text(
     request: SummaryRequest,
+    slim: bool = Depends(slim_view),
     use_case: SummarizeTextUseCase = Depends(Provide[Container.summarize_text_use_case]),
-) -> SummaryResponse:
+) -> Response:
     """
     Summarize text endpoint
 
     Args:
         request: Summary request containing text and configuration
+        slim: Omit the original text from the response
         use_case: Injected summarize text use case
 
     Returns:
-        Summary response with original text and generated summary
+        Summary response with generated summary, with an ``X-Cache`` header when the cache was consulted
 
     Raises:
         HTTPException: If summarization fails
     """
+    observe_validation()
     try:
-        return await use_case.execute(request)
+        summary_response = await use_case.execute(request)
+        headers = {"X-Cache": summary_response.cache_status.upper()} if summary_response.cache_status else None
+        mark_handler_finished()
+        return _json_response(summary_response, exclude=SLIM_SUMMARY_EXCLUDE if slim else None, headers=headers)
+
+    except ServiceOverloadedError as e:
+        raise _overloaded_exception(e) from e
 
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ErrorResponse(
-                error=str(e),
-                error_code="VALIDATION_ERROR",
-                details="Request validation failed",
-            ).model_dump(mode="json"),
+            detail=_error_response(e).model_dump(mode="json"),
         ) from e
 
-    except RuntimeError as e:
+    except Exception as e:
+        # RuntimeError maps to SUMMARIZATION_ERROR, anything else to INTERNAL_ERROR
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                error=str(e),
-                error_code="SUMMARIZATION_ERROR",
-                details="Failed to generate summary",
-            ).model_dump(mode="json"),
+            detail=_error_response(e).model_dump(mode="json"),
         ) from e
 
+
+def _sse_event(event: str, data: str) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _sse_stream(responses: AsyncIterator[SummaryDeltaResponse | SummaryResponse]) -> AsyncIterator[str]:
+    """Encode summary stream responses as server-sent events"""
+    try:
+        async for item in responses:
+            if isinstance(item, SummaryResponse):
+                # The client already holds the original text, so only metadata is sent back
+                yield _sse_event("summary", item.model_dump_json(exclude={"original_text"}))
+            else:
+                yield _sse_event("delta", item.model_dump_json())
+
     except Exception as e:
+        yield _sse_event("error", _error_response(e).model_dump_json())
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Summarize text as a stream",
+    description="Stream summary tokens as server-sent events, ending with a summary metadata event",
+)
+@inject
+async def summarize_text_stream(
+    request: SummaryRequest,
+    use_case: SummarizeTextStreamUseCase = Depends(Provide[Container.summarize_text_stream_use_case]),
+) -> StreamingResponse:
+    """
+    Streaming summarize text endpoint
+
+    Emits ``delta`` events with generated text, then one ``summary`` event
+    with the SummaryResponse metadata, or an ``error`` event on failure.
+
+    Args:
+        request: Summary request containing text and configuration
+        use_case: Injected summarize text stream use case
+
+    Returns:
+        Server-sent event stream
+
+    Raises:
+        HTTPException: If request validation fails
+    """
+    observe_validation()
+    try:
+        responses = await use_case.execute(request)
+
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                error="Internal server error",
-                error_code="INTERNAL_ERROR",
-                details=str(e),
-            ).model_dump(mode="json"),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_error_response(e).model_dump(mode="json"),
+        ) from e
+
+    return StreamingResponse(
+        _sse_stream(responses),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _ndjson_stream(
+    items: AsyncIterator[SummaryBatchItemResponse], exclude: dict | None = None
+) -> AsyncIterator[str]:
+    """Encode batch items as newline-delimited JSON"""
+    async for item in items:
+        if item.error is not None:
+            record_error(item.error.error_code)
+        yield item.model_dump_json(exclude=exclude) + "\n"
+
+
+@router.post(
+    "/batch",
+    response_model=SummaryBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Summarize a batch of texts",
+    description=(
+        "Summarize several texts with bounded concurrency. Send `Accept: application/x-ndjson` "
+        "to receive each item as a JSON line as soon as it finishes."
+    ),
+)
+@inject
+async def summarize_batch(
+    request: SummaryBatchRequest,
+    accept: str = Header(default=""),
+    slim: bool = Depends(slim_view),
+    use_case: SummarizeBatchUseCase = Depends(Provide[Container.summarize_batch_use_case]),
+) -> Response:
+    """
+    Batch summarize endpoint
+
+    Failed items are reported in place and do not abort the batch.
+
+    Args:
+        request: Batch of summary requests
+        accept: Accept header selecting JSON or NDJSON streaming output
+        slim: Omit the original texts from the results
+        use_case: Injected summarize batch use case
+
+    Returns:
+        Batch response in request order, or an NDJSON stream in completion order
+
+    Raises:
+        HTTPException: If the batch is invalid
+    """
+    observe_validation()
+    try:
+        if NDJSON_MEDIA_TYPE in accept:
+            return StreamingResponse(
+                _ndjson_stream(use_case.execute_stream(request), SLIM_BATCH_ITEM_EXCLUDE if slim else None),
+                media_type=NDJSON_MEDIA_TYPE,
+            )
+
+        batch_response = await use_case.execute(request)
+        for item in batch_response.items:
+            if item.error is not None:
+                record_error(item.error.error_code)
+        mark_handler_finished()
+        return _json_response(batch_response, exclude=SLIM_BATCH_EXCLUDE if slim else None)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_error_response(e).model_dump(mode="json"),
+        ) from e
+
+
+@router.post(
+    "/jobs",
+    response_model=SummaryJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a background summarization job",
+    description=(
+        "Queue a summarization and return its job id at once. Poll `GET /jobs/{job_id}` or pass "
+        "`callback_url` to receive the finished job. Identical requests share one job."
+    ),
+)
+@inject
+async def submit_summary_job(
+    request: SummaryJobRequest,
+    use_case: SubmitSummaryJobUseCase = Depends(Provide[Container.submit_summary_job_use_case]),
+) -> SummaryJobResponse:
+    """
+    Submit summary job endpoint
+
+    Args:
+        request: Summary request with queue priority and optional callback URL
+        use_case: Injected submit summary job use case
+
+    Returns:
+        Queued job, or the existing job for an identical request
+
+    Raises:
+        HTTPException: If request validation fails
+    """
+    observe_validation()
+    try:
+        job_response = await use_case.execute(request)
+        mark_handler_finished()
+        return job_response
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_error_response(e).model_dump(mode="json"),
         ) from e
 
 
+@router.get(
+    "/jobs/{job_id}",
+    response_model=SummaryJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a background summarization job",
+    description="Get the status of a job and, once it succeeded, its summary",
+)
+@inject
+async def get_summary_job(
+    job_id: str,
+    use_case: GetSummaryJobUseCase = Depends(Provide[Container.get_summary_job_use_case]),
+) -> SummaryJobResponse:
+    """
+    Get summary job endpoint
+
+    Args:
+        job_id: Job identifier
+        use_case: Injected get summary job use case
+
+    Returns:
+        Job status with its result or error
+
+    Raises:
+        HTTPException: If the job is unknown
+    """
+    job_response = await use_case.execute(job_id)
+    if job_response is None:
+        error_response = ErrorResponse(error=f"Job {job_id} not found", error_code="NOT_FOUND")
+        record_error(error_response.error_code)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_response.model_dump(mode="json"))
+    return job_response
+
+
 @router.get(
     "/health",
     response_model=HealthCheckResponse,
@@ -124,3 +381,67 @@ async def health_check(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=error_response.model_dump(mode="json"),
         ) from e
+
+
+@router.get(
+    "/",
+    response_model=SummaryListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List stored summaries",
+    description="Page through previously generated summaries, newest first, optionally filtered by model or text hash",
+)
+@inject
+async def list_summaries(
+    request: SummaryListRequest = Depends(),
+    slim: bool = Depends(slim_view),
+    use_case: ListSummariesUseCase = Depends(Provide[Container.list_summaries_use_case]),
+) -> Response:
+    """
+    List summaries endpoint
+
+    Args:
+        request: Page and filters from the query string
+        slim: Omit the original texts from the summaries
+        use_case: Injected list summaries use case
+
+    Returns:
+        Page of summaries with the total number matching the filters
+    """
+    list_response = await use_case.execute(request)
+    return _json_response(list_response, exclude=SLIM_LIST_EXCLUDE if slim else None)
+
+
+# Declared last so that the fixed paths above are not captured as summary ids
+@router.get(
+    "/{summary_id}",
+    response_model=SummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a stored summary",
+    description="Get a previously generated summary by its id without generating it again",
+)
+@inject
+async def get_summary(
+    summary_id: str,
+    slim: bool = Depends(slim_view),
+    use_case: GetSummaryUseCase = Depends(Provide[Container.get_summary_use_case]),
+) -> Response:
+    """
+    Get summary endpoint
+
+    Args:
+        summary_id: Summary identifier
+        slim: Omit the original text from the response
+        use_case: Injected get summary use case
+
+    Returns:
+        Stored summary
+
+    Raises:
+        HTTPException: If the summary is unknown
+    """
+    summary_response = await use_case.execute(summary_id)
+    if summary_response is None:
+        error_response = ErrorResponse(error=f"Summary {summary_id} not found", error_code="NOT_FOUND")
+        record_error(error_response.error_code)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_response.model_dump(mode="json"))
+    return _json_response(summary_response, exclude=SLIM_SUMMARY_EXCLUDE if slim else None)
@@ -0,0 +1,176 @@
+"""Concurrency limit that adapts to observed upstream latency"""
+
+from app.shared.metrics import ADMISSION_LATENCY_ESTIMATE, ADMISSION_LIMIT_CHANGES
+
+
+class AIMDLimit:
+    """
+    Additive-increase, multiplicative-decrease concurrency limit
+
+    Each completed call reports its latency, normalized by the size of the
+    call (input and output tokens) when known so long and short summaries
+    compare. A moving average tracks
+    the current latency; the baseline is the latency of the backend when it
+    is not congested.
+
+    When the current latency exceeds ``tolerance`` times the baseline, or a
+    call fails, the limit is multiplied by ``backoff_ratio``, at most once
+    per round of ``limit`` calls. Otherwise, while at least half the limit is
+    in use, it grows by one per round.
+
+    A busy backend never shows its uncongested latency, so every
+    ``probe_interval`` samples the limit is halved for a moment: the calls
+    started under the old limit drain, the next round sets the baseline and
+    the limit is restored. The baseline is replaced rather than lowered, so a
+    slower model or GPU settles at a lower limit instead of pinning it at the
+    minimum.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        tolerance: float = 1.5,
+        backoff_ratio: float = 0.9,
+        smoothing: float = 0.2,
+        probe_interval: int = 500,
+    ):
+        """
+        Initialize AIMD limit
+
+        Args:
+            initial_limit: Limit before any samples
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            tolerance: Ratio of current to baseline latency treated as congestion
+            backoff_ratio: Factor applied to the limit on congestion or failure
+            smoothing: Weight of the latest sample in the current latency
+            probe_interval: Samples between baseline probes
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if tolerance <= 1.0:
+            raise ValueError("tolerance must be greater than 1")
+        if not 0.0 < backoff_ratio < 1.0:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff_ratio = backoff_ratio
+        self.smoothing = smoothing
+        self.probe_interval = probe_interval
+
+        self._limit = float(initial_limit)
+        self._current: float | None = None
+        self._baseline: float | None = None
+        self._since_decrease = 0
+        self._since_probe = 0
+
+        # Probe state: limit to restore, samples to skip while draining, minimum latency seen
+        self._probe_restore: float | None = None
+        self._probe_skip = 0
+        self._probe_left = 0
+        self._probe_min: float | None = None
+
+        self.increases = 0
+        self.decreases = 0
+        self.probes = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return int(self._limit)
+
+    @property
+    def probing(self) -> bool:
+        """Whether a baseline probe is in progress"""
+        return self._probe_restore is not None
+
+    @property
+    def stats(self) -> dict[str, float | None]:
+        """Latency estimates and limit changes"""
+        return {
+            "latency_current": None if self._current is None else round(self._current, 6),
+            "latency_baseline": None if self._baseline is None else round(self._baseline, 6),
+            "limit_increases": self.increases,
+            "limit_decreases": self.decreases,
+            "baseline_probes": self.probes,
+        }
+
+    def on_sample(self, latency: float | None, in_flight: int, dropped: bool = False) -> int:
+        """
+        Record a completed call and return the new limit
+
+        Args:
+            latency: Seconds, per unit of call size when known; None when not comparable
+            in_flight: Calls holding a slot when this one finished, itself included
+            dropped: Whether the call failed in a way that suggests overload
+        """
+        if self.probing:
+            self._probe(latency)
+            return self.limit
+
+        if latency is not None:
+            self._since_probe += 1
+            self._current = (
+                latency if self._current is None else self._current + self.smoothing * (latency - self._current)
+            )
+            # Until the first probe the lowest latency seen is the best baseline available
+            self._baseline = latency if self._baseline is None else min(self._baseline, latency)
+            self._publish()
+
+        self._since_decrease += 1
+        congested = latency is not None and self._current > self._baseline * self.tolerance
+        if dropped or congested:
+            # One decrease per round of calls; the rest of the round finished under the old limit
+            if self._since_decrease >= self._limit:
+                self._set_limit(max(float(self.min_limit), self._limit * self.backoff_ratio))
+                self._since_decrease = 0
+        elif latency is not None and in_flight * 2 >= self._limit:
+            self._set_limit(min(float(self.max_limit), self._limit + 1.0 / self._limit))
+
+        if self._since_probe >= self.probe_interval:
+            self._start_probe()
+        return self.limit
+
+    def _start_probe(self) -> None:
+        self.probes += 1
+        self._probe_restore = self._limit
+        self._probe_skip = int(self._limit)
+        self._limit = float(max(self.min_limit, int(self._limit) // 2))
+        self._probe_left = int(self._limit)
+        self._probe_min = None
+
+    def _probe(self, latency: float | None) -> None:
+        if self._probe_skip > 0:
+            self._probe_skip -= 1
+            return
+        if latency is not None:
+            self._probe_min = latency if self._probe_min is None else min(self._probe_min, latency)
+        self._probe_left -= 1
+        if self._probe_left > 0:
+            return
+
+        if self._probe_min is not None:
+            self._baseline = self._probe_min
+        self._limit = self._probe_restore
+        self._probe_restore = None
+        self._since_probe = 0
+        self._publish()
+
+    def _set_limit(self, value: float) -> None:
+        previous = self.limit
+        self._limit = value
+        if self.limit > previous:
+            self.increases += 1
+            ADMISSION_LIMIT_CHANGES.labels("increase").inc()
+        elif self.limit < previous:
+            self.decreases += 1
+            ADMISSION_LIMIT_CHANGES.labels("decrease").inc()
+
+    def _publish(self) -> None:
+        if self._current is not None:
+            ADMISSION_LATENCY_ESTIMATE.labels("current").set(self._current)
+            ADMISSION_LATENCY_ESTIMATE.labels("baseline").set(self._baseline)
@@ -0,0 +1,270 @@
+"""Concurrency limiting with a bounded, deadline-aware wait queue"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.shared.adaptive_limit import AIMDLimit
+from app.shared.fair_queue import WeightedFairQueue
+from app.shared.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_LIMIT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_SHED,
+    ADMISSION_WAIT,
+)
+from app.shared.priority import Priority, current_priority
+
+
+@dataclass
+class Permit:
+    """A held slot; the holder may report the work done (e.g. the call's size in tokens) to normalize its latency"""
+
+    work: float | None = None
+
+
+class AdmissionController:
+    """
+    Cap concurrent upstream calls and shed load instead of queueing without bound
+
+    Callers beyond ``limit`` wait in a queue. Arrivals are rejected at once
+    when ``max_queue`` callers of their lane are already waiting, and waiters
+    give up after ``queue_timeout`` seconds, so overload surfaces as fast
+    errors rather than as every request timing out together.
+
+    Each caller belongs to a priority lane and a tenant, taken from the
+    request's ``Priority``. Freed slots are shared between lanes by
+    ``lane_weights`` and between the tenants of a lane equally (weighted fair
+    queueing); within one tenant and lane, waiters keep arrival order, or with
+    ``shortest_first`` go in order of their expected service time (the
+    ``cost`` they pass), so short requests do not wait behind long ones.
+    Waiters older than ``aging_seconds`` go first, so a bulk burst cannot hold
+    interactive calls behind it and neither bulk work nor long requests
+    starve. With a single lane and tenant and no ordering this is plain FIFO.
+
+    With an ``adaptive_limit``, every finished call is reported to it and
+    ``limit`` follows its decision. Rejected input and shed calls say nothing
+    about upstream capacity and are not reported.
+    """
+
+    # Weight of the latest call in the moving average of service time
+    SERVICE_TIME_ALPHA = 0.2
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        max_queue: int = 64,
+        queue_timeout: float = 10.0,
+        adaptive_limit: AIMDLimit | None = None,
+        lane_weights: dict[str, float] | None = None,
+        default_lane: str = "default",
+        aging_seconds: float | None = None,
+        shortest_first: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize admission controller
+
+        Args:
+            max_in_flight: Maximum number of concurrent calls
+            max_queue: Maximum number of callers of one lane waiting for a slot
+            queue_timeout: Seconds a caller may wait for a slot
+            adaptive_limit: Adjusts the limit from observed latency; None for a fixed limit
+            lane_weights: Share of freed slots per lane; unknown lanes are treated as the default lane
+            default_lane: Lane of callers without a priority
+            aging_seconds: Wait after which a caller goes ahead of the weighted order; None to disable
+            shortest_first: Admit the waiters of a lane and tenant in order of cost instead of arrival
+            clock: Monotonic clock, injectable for tests
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        lane_weights = lane_weights or {default_lane: 1.0}
+        if default_lane not in lane_weights:
+            raise ValueError(f"default lane {default_lane!r} has no weight")
+        if any(weight <= 0 for weight in lane_weights.values()):
+            raise ValueError("lane weights must be positive")
+
+        self._limit = adaptive_limit.limit if adaptive_limit is not None else max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.adaptive_limit = adaptive_limit
+        self.lane_weights = lane_weights
+        self.default_lane = default_lane
+        self.clock = clock
+        ADMISSION_LIMIT.set(self._limit)
+
+        self._in_flight = 0
+        self._waiters = WeightedFairQueue(aging_seconds, shortest_first, clock)
+        self._service_time: float | None = None
+
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of concurrent calls"""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        self._limit = max(1, value)
+        ADMISSION_LIMIT.set(self._limit)
+        self._wake()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls holding a slot"""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot"""
+        return len(self._waiters)
+
+    def lane_depth(self, lane: str) -> int:
+        """Number of callers of a lane waiting for a slot"""
+        return self._waiters.depth(lambda flow: flow[0] == lane)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the current queue is likely drained"""
+        service_time = self._service_time or 1.0
+        return max(1.0, service_time * (self.queue_depth + 1) / self._limit)
+
+    @property
+    def stats(self) -> dict:
+        """Occupancy, queueing and shedding counters, and the adaptive limit's estimates"""
+        return {
+            "limit": self._limit,
+            "adaptive": self.adaptive_limit is not None,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "lane_queue_depth": {lane: self.lane_depth(lane) for lane in self.lane_weights},
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            **(self.adaptive_limit.stats if self.adaptive_limit is not None else {}),
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None, cost: float = 1.0) -> AsyncIterator[Permit]:
+        """Hold a slot for the duration of the block"""
+        await self.acquire(priority, cost)
+        permit = Permit()
+        start = self.clock()
+        outcome = "success"
+        try:
+            yield permit
+        except (ValueError, ServiceOverloadedError):
+            outcome = "ignored"
+            raise
+        except Exception:
+            outcome = "dropped"
+            raise
+        except BaseException:
+            # Cancelled or abandoned stream
+            outcome = "ignored"
+            raise
+        finally:
+            elapsed = self.clock() - start
+            self._record_service_time(elapsed)
+            if self.adaptive_limit is not None and outcome != "ignored":
+                latency = elapsed / permit.work if permit.work else None
+                self.limit = self.adaptive_limit.on_sample(latency, self._in_flight, dropped=outcome == "dropped")
+            self.release()
+
+    async def acquire(self, priority: Priority | None = None, cost: float = 1.0) -> None:
+        """
+        Wait for a slot
+
+        Args:
+            priority: Lane and tenant of the caller; defaults to the current request's
+            cost: Expected service time, in any unit shared by all callers
+
+        Raises:
+            ServiceOverloadedError: If the lane's queue is full or the wait deadline expires
+        """
+        priority = priority or current_priority() or Priority(self.default_lane)
+        lane = priority.lane if priority.lane in self.lane_weights else self.default_lane
+
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            self.admitted += 1
+            self._record_wait(lane, 0.0)
+            self._update_gauges()
+            return
+
+        if self.lane_depth(lane) >= self.max_queue:
+            self.rejected += 1
+            ADMISSION_SHED.labels("queue_full").inc()
+            raise ServiceOverloadedError("Service is overloaded, please retry later", self.retry_after)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.push(future, (lane, priority.tenant), self.lane_weights[lane], cost)
+        self._update_gauges()
+        start = self.clock()
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await future
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the wait ended; give it back
+                self.release()
+            else:
+                future.cancel()
+                self._waiters.remove(future)
+
+            if isinstance(e, TimeoutError):
+                self.timed_out += 1
+                ADMISSION_SHED.labels("queue_timeout").inc()
+                raise ServiceOverloadedError(
+                    "Timed out waiting for model capacity", self.retry_after, queue_full=False
+                ) from e
+            raise
+        finally:
+            self._record_wait(lane, self.clock() - start)
+            self._update_gauges()
+
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiter"""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Transfer free slots to waiters in weighted fair order"""
+        while self._waiters and self._in_flight < self._limit:
+            future = self._waiters.pop()
+            if future.done():
+                # Cancelled waiter that has not yet removed itself
+                continue
+            self._in_flight += 1
+            future.set_result(None)
+        self._update_gauges()
+
+    def _record_wait(self, lane: str, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        ADMISSION_WAIT.labels(lane).observe(seconds)
+
+    def _update_gauges(self) -> None:
+        ADMISSION_IN_FLIGHT.set(self._in_flight)
+        ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+
+    def _record_service_time(self, seconds: float) -> None:
+        if self._service_time is None:
+            self._service_time = seconds
+        else:
+            self._service_time += self.SERVICE_TIME_ALPHA * (seconds - self._service_time)
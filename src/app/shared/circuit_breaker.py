@@ -0,0 +1,141 @@
+"""Circuit breaker for calls to an unreliable dependency"""
+
+import time
+from collections.abc import Callable
+
+from app.domain.exceptions import CircuitOpenError
+from app.shared.metrics import CIRCUIT_BREAKER_OPENED, CIRCUIT_BREAKER_STATE
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge values, ordered by severity
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is known to be failing
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects calls for ``recovery_timeout`` seconds. It then lets up to
+    ``half_open_max_calls`` trial calls through: a success closes it, a
+    failure opens it again. Callers register each call with ``before_call``
+    and report how it ended with ``record_success``, ``record_failure`` or,
+    for rejected input and cancellation, ``record_abandoned``.
+    """
+
+    def __init__(
+        self,
+        name: str = "upstream",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Label of the protected dependency in metrics
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds the breaker stays open before trial calls
+            half_open_max_calls: Concurrent trial calls while half-open
+            clock: Monotonic clock, injectable for tests
+        """
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if half_open_max_calls <= 0:
+            raise ValueError("half_open_max_calls must be positive")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self._set_state(CLOSED)
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the recovery timeout has passed"""
+        if self._state == OPEN and self.clock() - self._opened_at >= self.recovery_timeout:
+            self._set_state(HALF_OPEN)
+        return self._state
+
+    @property
+    def allows_request(self) -> bool:
+        """Whether a call would be let through now"""
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and self._trial_calls < self.half_open_max_calls)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets trial calls through"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - self.clock())
+
+    @property
+    def stats(self) -> dict:
+        """State and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
+
+    def before_call(self) -> None:
+        """
+        Register a call about to start
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+        """
+        if not self.allows_request:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Upstream {self.name} is unavailable, please retry later", max(1.0, self.retry_after)
+            )
+        if self._state == HALF_OPEN:
+            self._trial_calls += 1
+
+    def record_success(self) -> None:
+        """Register a successful call"""
+        self._consecutive_failures = 0
+        if self._state != CLOSED:
+            self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        """Register a failed call"""
+        self.failures += 1
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or (self._state == CLOSED and self._consecutive_failures >= self.failure_threshold):
+            self._open()
+
+    def record_abandoned(self) -> None:
+        """Register a call that ended without telling whether the dependency works, e.g. cancelled"""
+        if self._state == HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def _open(self) -> None:
+        self._opened_at = self.clock()
+        self.opened += 1
+        CIRCUIT_BREAKER_OPENED.labels(self.name).inc()
+        self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self._trial_calls = 0
+        CIRCUIT_BREAKER_STATE.labels(self.name).set(_STATE_VALUES[state])
@@ -0,0 +1,162 @@
+"""Weighted fair queue over flows, with shortest-first ordering and aging"""
+
+import heapq
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _Entry:
+    item: Any
+    flow: Hashable
+    cost: float
+    enqueued: float
+    sequence: int
+    queued: bool = True
+
+
+class WeightedFairQueue:
+    """
+    Queue that shares dequeues between flows in proportion to their weights
+
+    Each flow (e.g. a priority lane and tenant) is FIFO, or ordered by cost
+    with ``shortest_first``. Across flows, the head of each flow is tagged
+    with a virtual finish time, ``cost / weight`` after the flow's virtual
+    start: the finish of its previous item, or the current virtual time when
+    the flow was idle. The smallest tag is served first. A flow with twice the weight gets twice the service
+    while both are backlogged, and an idle flow does not bank credit.
+
+    Weights never starve a flow, but a heavily outweighed flow or a costly
+    item behind a stream of cheap ones can still wait long. Items older than
+    ``aging_seconds`` are therefore served first, oldest first.
+    """
+
+    def __init__(
+        self,
+        aging_seconds: float | None = None,
+        shortest_first: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize weighted fair queue
+
+        Args:
+            aging_seconds: Wait after which an item goes ahead of the weighted order; None to disable
+            shortest_first: Order each flow by cost instead of arrival
+            clock: Monotonic clock, injectable for tests
+        """
+        self.aging_seconds = aging_seconds
+        self.shortest_first = shortest_first
+        self.clock = clock
+
+        # Per flow: heap of (sort key, sequence, entry), weight, virtual start of the head,
+        # and virtual finish of the last item served
+        self._flows: dict[Hashable, list[tuple[float, int, _Entry]]] = {}
+        self._weights: dict[Hashable, float] = {}
+        self._start: dict[Hashable, float] = {}
+        self._finish: dict[Hashable, float] = {}
+        self._arrivals: deque[_Entry] = deque()
+        self._entries: dict[Any, _Entry] = {}
+        self._virtual_time = 0.0
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def depth(self, flow_filter: Callable[[Hashable], bool]) -> int:
+        """Number of queued items in the flows matching a filter"""
+        return sum(len(entries) for flow, entries in self._flows.items() if flow_filter(flow))
+
+    def push(self, item: Any, flow: Hashable, weight: float = 1.0, cost: float = 1.0) -> None:
+        """
+        Queue an item
+
+        Args:
+            item: Item to queue; hashable and not already queued
+            flow: Key of the flow the item belongs to
+            weight: Share of the flow relative to the others
+            cost: Work the item represents; a flow's share is of total cost, not of items
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._sequence += 1
+        entry = _Entry(item, flow, max(cost, 0.0), self.clock(), self._sequence)
+        sort_key = entry.cost if self.shortest_first else 0.0
+        if flow not in self._flows:
+            self._flows[flow] = []
+            self._start[flow] = max(self._virtual_time, self._finish.get(flow, 0.0))
+        heapq.heappush(self._flows[flow], (sort_key, entry.sequence, entry))
+        self._weights[flow] = weight
+        self._arrivals.append(entry)
+        self._entries[item] = entry
+
+    def pop(self) -> Any:
+        """
+        Remove and return the next item
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        if not self._entries:
+            raise IndexError("pop from an empty WeightedFairQueue")
+
+        entry = self._aged()
+        if entry is None:
+            heads = (entries[0][2] for entries in self._flows.values())
+            entry = min(heads, key=lambda head: (self._finish_tag(head), head.sequence))
+
+        self._virtual_time = max(self._virtual_time, self._start[entry.flow])
+        self._finish[entry.flow] = self._start[entry.flow] = self._finish_tag(entry)
+        self._discard(entry)
+        return entry.item
+
+    def remove(self, item: Any) -> bool:
+        """Remove a queued item, e.g. a waiter that gave up; returns whether it was queued"""
+        entry = self._entries.get(item)
+        if entry is None:
+            return False
+        self._discard(entry)
+        return True
+
+    def _finish_tag(self, entry: _Entry) -> float:
+        return self._start[entry.flow] + entry.cost / self._weights[entry.flow]
+
+    def _aged(self) -> _Entry | None:
+        """Oldest queued item if it has waited at least aging_seconds"""
+        while self._arrivals and not self._arrivals[0].queued:
+            self._arrivals.popleft()
+        if self.aging_seconds is None or not self._arrivals:
+            return None
+        oldest = self._arrivals[0]
+        return oldest if self.clock() - oldest.enqueued >= self.aging_seconds else None
+
+    def _discard(self, entry: _Entry) -> None:
+        entry.queued = False
+        del self._entries[entry.item]
+        entries = self._flows[entry.flow]
+        if entries[0][2] is entry:
+            heapq.heappop(entries)
+        else:
+            # Aged or abandoned item from the middle of its flow
+            entries[:] = [queued for queued in entries if queued[2] is not entry]
+            heapq.heapify(entries)
+        if not entries:
+            self._drop_flow(entry.flow)
+
+    def _drop_flow(self, flow: Hashable) -> None:
+        del self._flows[flow]
+        del self._weights[flow]
+        del self._start[flow]
+        # Finish tags at or behind the virtual time no longer matter; forget them so idle tenants cost nothing
+        if self._finish.get(flow, 0.0) <= self._virtual_time:
+            self._finish.pop(flow, None)
+        if len(self._finish) > 2 * len(self._flows) + 64:
+            self._finish = {
+                key: finish for key, finish in self._finish.items() if key in self._flows or finish > self._virtual_time
+            }
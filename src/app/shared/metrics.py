@@ -0,0 +1,192 @@
+"""
+Prometheus metrics
+
+With several server workers each process keeps its own values, so they are
+written to files under ``PROMETHEUS_MULTIPROC_DIR`` and summed when
+scraped. Gauges state how their per-process values combine.
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Upstream generations take seconds, so the default buckets stop far too early
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+REQUEST_DURATION = Histogram(
+    "llmplan_request_duration_seconds",
+    "HTTP request handling time",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+STAGE_DURATION = Histogram(
+    "llmplan_stage_duration_seconds",
+    "Time spent per request stage: validation, prompt_build, upstream_first_token, upstream_total, serialization",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+
+TOKENS = Counter("llmplan_tokens", "Tokens sent to and generated by the model", ["kind"])
+
+ERRORS = Counter("llmplan_errors", "Failed requests by error code", ["error_code"])
+
+CACHE_REQUESTS = Counter("llmplan_summary_cache_requests", "Summary result cache lookups by outcome", ["status"])
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "llmplan_admission_in_flight", "Upstream calls holding an admission slot", multiprocess_mode="livesum"
+)
+
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "llmplan_admission_queue_depth", "Calls waiting for an admission slot", multiprocess_mode="livesum"
+)
+
+ADMISSION_WAIT = Histogram(
+    "llmplan_admission_wait_seconds",
+    "Time spent waiting for an admission slot by lane",
+    ["lane"],
+    buckets=LATENCY_BUCKETS,
+)
+
+ADMISSION_SHED = Counter("llmplan_admission_shed", "Calls shed by admission control", ["reason"])
+
+ADMISSION_LIMIT = Gauge(
+    "llmplan_admission_limit", "Concurrent upstream calls admission control allows", multiprocess_mode="livesum"
+)
+
+ADMISSION_LIMIT_CHANGES = Counter(
+    "llmplan_admission_limit_changes", "Adaptive concurrency limit changes by direction", ["direction"]
+)
+
+ADMISSION_LATENCY_ESTIMATE = Gauge(
+    "llmplan_admission_latency_estimate_seconds",
+    "Upstream latency (per unit of call size when known) seen by the adaptive limit: current, baseline",
+    ["window"],
+    multiprocess_mode="liveall",  # one series per worker, each has its own limit
+)
+
+ENDPOINT_OUTSTANDING = Gauge(
+    "llmplan_endpoint_outstanding", "Calls in flight per upstream endpoint", ["endpoint"], multiprocess_mode="livesum"
+)
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "llmplan_circuit_breaker_state",
+    "Circuit breaker state: 0 closed, 1 half-open, 2 open",
+    ["endpoint"],
+    multiprocess_mode="livemax",  # the most open breaker of any worker
+)
+
+CIRCUIT_BREAKER_OPENED = Counter("llmplan_circuit_breaker_opened", "Times a circuit breaker opened", ["endpoint"])
+
+HEDGED_REQUESTS = Counter("llmplan_hedged_requests", "Hedged upstream calls by outcome: sent, won", ["outcome"])
+
+
+def prepare_multiprocess_dir() -> str:
+    """
+    Point worker processes at an empty metrics directory before they start
+
+    Uses ``PROMETHEUS_MULTIPROC_DIR`` when set, clearing the files a previous
+    run left there, else a new temporary directory.
+    """
+    directory = os.environ.get(MULTIPROC_DIR_ENV)
+    if directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        for stale in Path(directory).glob("*.db"):
+            stale.unlink(missing_ok=True)
+    else:
+        directory = tempfile.mkdtemp(prefix="llmplan-metrics-")
+        os.environ[MULTIPROC_DIR_ENV] = directory
+    return directory
+
+
+def render_metrics() -> bytes:
+    """Metrics in the text exposition format, aggregated over all workers in multiprocess mode"""
+    if not os.environ.get(MULTIPROC_DIR_ENV):
+        return generate_latest()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the aggregate; call when it shuts down"""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+@dataclass
+class RequestTimer:
+    """Timestamps of one HTTP request, shared between the middleware and the handler"""
+
+    started: float
+    handler_finished: float | None = None
+
+
+_request_timer: ContextVar[RequestTimer | None] = ContextVar("request_timer", default=None)
+
+
+def start_request_timer() -> RequestTimer:
+    """Start timing the current request"""
+    timer = RequestTimer(started=time.perf_counter())
+    _request_timer.set(timer)
+    return timer
+
+
+def observe_validation() -> None:
+    """Record body parsing and DTO validation; call first thing in a handler"""
+    timer = _request_timer.get()
+    if timer is not None:
+        STAGE_DURATION.labels("validation").observe(time.perf_counter() - timer.started)
+
+
+def mark_handler_finished() -> None:
+    """Mark the end of handler logic so the middleware can time response serialization"""
+    timer = _request_timer.get()
+    if timer is not None:
+        timer.handler_finished = time.perf_counter()
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Record the duration of a block as a request stage"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_DURATION.labels(stage).observe(time.perf_counter() - start)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record a stage duration measured by the caller"""
+    STAGE_DURATION.labels(stage).observe(seconds)
+
+
+def record_tokens(
+    prompt_tokens: int | None, completion_tokens: int | None, reasoning_tokens: int | None = None
+) -> None:
+    """Count tokens of one upstream call; reasoning tokens are the part of the completion spent thinking"""
+    if prompt_tokens:
+        TOKENS.labels("prompt").inc(prompt_tokens)
+    if completion_tokens:
+        TOKENS.labels("completion").inc(completion_tokens)
+    if reasoning_tokens:
+        TOKENS.labels("reasoning").inc(reasoning_tokens)
+
+
+def record_error(error_code: str) -> None:
+    """Count a failed request"""
+    ERRORS.labels(error_code).inc()
+
+
+def record_cache(status: str) -> None:
+    """Count a result cache lookup: hit, miss or bypass"""
+    CACHE_REQUESTS.labels(status).inc()
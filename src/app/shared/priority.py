@@ -0,0 +1,32 @@
+"""Priority lane of the current request, carried from the HTTP layer to admission control"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Priority:
+    """Scheduling class of upstream calls: a weighted lane, shared fairly between tenants"""
+
+    lane: str
+    tenant: str = ""
+
+
+_priority: ContextVar[Priority | None] = ContextVar("priority", default=None)
+
+
+def current_priority() -> Priority | None:
+    """Priority of the running request or task, if one was set"""
+    return _priority.get()
+
+
+@contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Run a block, and the tasks it creates, under a priority"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
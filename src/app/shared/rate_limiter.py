@@ -0,0 +1,126 @@
+"""Per-caller token bucket rate limiter"""
+
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated: float
+    rate: float
+    capacity: float
+
+
+class TokenBucketRateLimiter:
+    """
+    Token buckets keyed by caller, spent in model tokens rather than requests
+
+    Each bucket holds up to ``capacity`` tokens and refills continuously at
+    ``tokens_per_minute``; refilling is computed on access, so every call is
+    O(1) with no background task. A call costing more than the capacity is
+    allowed once the bucket is full and leaves it in debt. ``adjust`` settles
+    an estimate against the actual cost afterwards and may also leave a debt,
+    which later calls wait out.
+
+    The methods never await, so they are atomic under asyncio without a lock.
+    State is per process: with several workers each enforces its own quota.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: float = 60000.0,
+        capacity: float = 30000.0,
+        key_tokens_per_minute: dict[str, float] | None = None,
+        max_buckets: int = 100000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize token bucket rate limiter
+
+        Args:
+            tokens_per_minute: Refill rate of each bucket
+            capacity: Bucket size, the tokens a caller may spend at once after idling
+            key_tokens_per_minute: Refill rate overrides by key; their capacity scales with the rate
+            max_buckets: Buckets kept; beyond it full ones, which equal new ones, then the least recent are dropped
+            clock: Monotonic clock, injectable for tests
+        """
+        if tokens_per_minute <= 0 or capacity <= 0:
+            raise ValueError("tokens_per_minute and capacity must be positive")
+        self.tokens_per_minute = tokens_per_minute
+        self.capacity = capacity
+        self.key_tokens_per_minute = key_tokens_per_minute or {}
+        self.max_buckets = max_buckets
+        self.clock = clock
+
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self.allowed = 0
+        self.rejected = 0
+        self.reconciled_tokens = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """Bucket count, decisions and the net tokens settled after estimates"""
+        return {
+            "buckets": len(self._buckets),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "reconciled_tokens": round(self.reconciled_tokens),
+        }
+
+    def available(self, key: Hashable) -> float:
+        """Tokens in a caller's bucket, negative when in debt"""
+        return self._bucket(key).tokens
+
+    def try_acquire(self, key: Hashable, cost: float) -> float:
+        """
+        Spend tokens from a caller's bucket if it holds enough
+
+        Args:
+            key: Caller identity
+            cost: Estimated tokens of the call
+
+        Returns:
+            0 when the tokens were spent, else the seconds until they would be available
+        """
+        bucket = self._bucket(key)
+        needed = min(cost, bucket.capacity)
+        if bucket.tokens >= needed:
+            bucket.tokens -= cost
+            self.allowed += 1
+            return 0.0
+        self.rejected += 1
+        return (needed - bucket.tokens) / bucket.rate
+
+    def adjust(self, key: Hashable, tokens: float) -> None:
+        """Return (positive) or charge (negative) tokens once the actual cost of a call is known"""
+        bucket = self._bucket(key)
+        bucket.tokens = min(bucket.capacity, bucket.tokens + tokens)
+        self.reconciled_tokens += tokens
+
+    def _bucket(self, key: Hashable) -> _Bucket:
+        """Bucket of a key, refilled up to now"""
+        now = self.clock()
+        # Reinserting keeps the dict in least-recently-used order for pruning
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._prune(now)
+            per_minute = self.key_tokens_per_minute.get(key, self.tokens_per_minute)
+            capacity = self.capacity * per_minute / self.tokens_per_minute
+            bucket = _Bucket(capacity, now, per_minute / 60.0, capacity)
+        else:
+            bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+        self._buckets[key] = bucket
+        return bucket
+
+    def _prune(self, now: float) -> None:
+        """Shrink to at most half of max_buckets, so the cost is amortized over the insertions between prunes"""
+        buckets = [
+            (key, bucket)
+            for key, bucket in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated) * bucket.rate < bucket.capacity
+        ]
+        self._buckets = dict(buckets[max(0, len(buckets) - self.max_buckets // 2) :])
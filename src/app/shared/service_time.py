@@ -0,0 +1,154 @@
+"""Online estimate of upstream service time"""
+
+# Completion tokens before any sample, by summary type: (fixed, per input token)
+DEFAULT_OUTPUT_MODELS = {"concise": (30.0, 0.1), "bullet_points": (40.0, 0.15), "detailed": (60.0, 0.3)}
+
+
+class _OnlineLinear:
+    """Linear model fitted online by normalized least mean squares, with non-negative coefficients"""
+
+    def __init__(self, weights: list[float], scales: list[float], learning_rate: float):
+        # Features are divided by their scale so the coefficients have similar magnitudes
+        self.scales = scales
+        self.weights = [weight * scale for weight, scale in zip(weights, scales, strict=True)]
+        self.learning_rate = learning_rate
+
+    @property
+    def coefficients(self) -> list[float]:
+        """Weights in unscaled units"""
+        return [weight / scale for weight, scale in zip(self.weights, self.scales, strict=True)]
+
+    def predict(self, features: list[float]) -> float:
+        return sum(weight * feature for weight, feature in zip(self.weights, self._scaled(features), strict=True))
+
+    def update(self, features: list[float], target: float) -> float:
+        """Move toward the target and return the error of the prediction before the update"""
+        scaled = self._scaled(features)
+        error = target - self.predict(features)
+        step = self.learning_rate * error / sum(feature * feature for feature in scaled)
+        self.weights = [max(0.0, weight + step * feature) for weight, feature in zip(self.weights, scaled, strict=True)]
+        return error
+
+    def _scaled(self, features: list[float]) -> list[float]:
+        return [feature / scale for feature, scale in zip(features, self.scales, strict=True)]
+
+
+class ServiceTimeEstimator:
+    """
+    Predict the duration of an upstream call from its request, learning from finished calls
+
+    The duration is modelled as ``overhead + prefill * input_tokens +
+    decode * output_tokens``, and the output length, per summary type, as
+    ``fixed + ratio * input_tokens`` capped by ``max_tokens``. Both are
+    fitted online by normalized least mean squares on the calls that finish,
+    so the estimate follows the model and hardware actually serving them.
+
+    Only the ordering of estimates matters for scheduling; the defaults are
+    rough but already rank a 50,000-character detailed summary behind a
+    short concise one.
+    """
+
+    def __init__(
+        self,
+        overhead: float = 0.2,
+        prefill_per_token: float = 0.0005,
+        decode_per_token: float = 0.03,
+        output_models: dict[str, tuple[float, float]] | None = None,
+        learning_rate: float = 0.2,
+        smoothing: float = 0.1,
+    ):
+        """
+        Initialize service time estimator
+
+        Args:
+            overhead: Seconds per call before any sample
+            prefill_per_token: Seconds per input token before any sample
+            decode_per_token: Seconds per output token before any sample
+            output_models: Completion tokens before any sample, by summary type: (fixed, per input token)
+            learning_rate: Step size of the updates, between 0 and 2
+            smoothing: Weight of the latest call in the reported relative error
+        """
+        if not 0.0 < learning_rate < 2.0:
+            raise ValueError("learning_rate must be between 0 and 2")
+        self.learning_rate = learning_rate
+        self.smoothing = smoothing
+        self._time = _OnlineLinear([overhead, prefill_per_token, decode_per_token], [1.0, 1000.0, 100.0], learning_rate)
+        self._output = {
+            summary_type: _OnlineLinear(list(model), [1.0, 1000.0], learning_rate)
+            for summary_type, model in (DEFAULT_OUTPUT_MODELS if output_models is None else output_models).items()
+        }
+
+        self.samples = 0
+        self._relative_error: float | None = None
+
+    @property
+    def stats(self) -> dict:
+        """Fitted coefficients and the recent relative error of the estimates"""
+        overhead, prefill, decode = self._time.coefficients
+        return {
+            "samples": self.samples,
+            "overhead_seconds": round(overhead, 6),
+            "prefill_seconds_per_token": round(prefill, 9),
+            "decode_seconds_per_token": round(decode, 9),
+            "output_tokens": {
+                summary_type: [round(coefficient, 4) for coefficient in model.coefficients]
+                for summary_type, model in self._output.items()
+            },
+            "relative_error": None if self._relative_error is None else round(self._relative_error, 4),
+        }
+
+    def output_tokens(self, input_tokens: int, summary_type: str, max_tokens: int) -> float:
+        """Predicted completion tokens"""
+        return min(float(max_tokens), self._output_model(summary_type).predict([1.0, input_tokens]))
+
+    def estimate(self, input_tokens: int, summary_type: str, max_tokens: int) -> float:
+        """Predicted seconds for a call"""
+        output_tokens = self.output_tokens(input_tokens, summary_type, max_tokens)
+        return self._time.predict([1.0, input_tokens, output_tokens])
+
+    def work(self, input_tokens: int, output_tokens: int) -> float | None:
+        """
+        Size of a call in output tokens: its predicted seconds over the seconds per output token
+
+        A backend that slows down uniformly, e.g. because it is congested,
+        scales every coefficient alike, so unlike the predicted seconds the
+        size does not change with it. None while decoding is modelled as free.
+        """
+        overhead, prefill, decode = self._time.coefficients
+        if decode <= 0:
+            return None
+        return (overhead + prefill * input_tokens) / decode + output_tokens
+
+    def observe(
+        self, input_tokens: int, summary_type: str, max_tokens: int, output_tokens: int | None, seconds: float
+    ) -> None:
+        """
+        Learn from a finished call
+
+        Args:
+            input_tokens: Tokens of the input text
+            summary_type: Summary type of the call
+            max_tokens: Completion cap of the call
+            output_tokens: Completion tokens, None when unknown (the call is then ignored)
+            seconds: Observed duration
+        """
+        if output_tokens is None or seconds <= 0:
+            return
+        self.samples += 1
+        if output_tokens < max_tokens:
+            # A capped completion says only that the model wanted at least max_tokens
+            self._output_model(summary_type).update([1.0, input_tokens], output_tokens)
+        error = self._time.update([1.0, input_tokens, output_tokens], seconds)
+
+        relative_error = abs(error) / seconds
+        if self._relative_error is None:
+            self._relative_error = relative_error
+        else:
+            self._relative_error += self.smoothing * (relative_error - self._relative_error)
+
+    def _output_model(self, summary_type: str) -> _OnlineLinear:
+        if summary_type not in self._output:
+            self._output[summary_type] = _OnlineLinear(
+                list(DEFAULT_OUTPUT_MODELS["detailed"]), [1.0, 1000.0], self.learning_rate
+            )
+        return self._output[summary_type]
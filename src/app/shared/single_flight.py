@@ -0,0 +1,59 @@
+"""In-flight call coalescing"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result with concurrent callers"""
+
+    def __init__(self):
+        """Initialize single-flight group"""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys with a call in progress"""
+        return len(self._calls)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Executed/coalesced counters"""
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": self.in_flight}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight
+
+        The call runs in its own task, so a cancelled caller does not cancel
+        the work other callers are waiting on.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller's call
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+
+        if shared:
+            self.coalesced += 1
+        else:
+            self.executed += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished call and mark its exception as retrieved"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
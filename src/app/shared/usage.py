@@ -0,0 +1,55 @@
+"""Model tokens used by the current request, metered from the upstream calls it makes"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class Usage:
+    """Prompt and completion tokens of the upstream calls made for one request"""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    calls: int = 0  # calls that reported their tokens
+    started: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def unreported(self) -> int:
+        """Calls that reached the model but ended, e.g. by an error or timeout, without reporting tokens"""
+        return self.started - self.calls
+
+
+_usage: ContextVar[Usage | None] = ContextVar("usage", default=None)
+
+
+@contextmanager
+def usage_scope() -> Iterator[Usage]:
+    """Meter a block, and the tasks it creates, into a new Usage"""
+    usage = Usage()
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def record_call_started() -> None:
+    """Count an upstream call of the current request as sent, before its outcome is known"""
+    usage = _usage.get()
+    if usage is not None:
+        usage.started += 1
+
+
+def record_usage(prompt_tokens: int | None, completion_tokens: int | None) -> None:
+    """Add the tokens of one upstream call, finished or abandoned, to the current request's usage"""
+    usage = _usage.get()
+    if usage is not None:
+        usage.prompt_tokens += prompt_tokens or 0
+        usage.completion_tokens += completion_tokens or 0
+        usage.calls += 1
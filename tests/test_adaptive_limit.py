@@ -0,0 +1,171 @@
+"""Test the adaptive concurrency limit"""
+
+import random
+import statistics
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.domain.entities.summary import Summary
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.shared.adaptive_limit import AIMDLimit
+from app.shared.admission_controller import AdmissionController
+from app.shared.service_time import ServiceTimeEstimator
+
+
+def _run(limit: AIMDLimit, base: float, capacity: int, rounds: int) -> list[int]:
+    """Saturate the limit with rounds of calls on a backend sharing its capacity between them"""
+    history = []
+    for _ in range(rounds):
+        in_flight = limit.limit
+        for _ in range(in_flight):
+            limit.on_sample(base * max(1.0, in_flight / capacity), in_flight)
+        history.append(limit.limit)
+    return history
+
+
+def _run_mixed(limit: AIMDLimit, estimator: ServiceTimeEstimator, capacity: int, rounds: int) -> list[int]:
+    """Like _run, with inputs from a short note to a long report and completion lengths independent of them"""
+    rng = random.Random(0)
+    history = []
+    for _ in range(rounds):
+        in_flight = limit.limit
+        for _ in range(in_flight):
+            input_tokens = rng.choice((50, 500, 4000, 16000))
+            output_tokens = rng.choice((30, 100, 300))
+            seconds = (0.4 + 0.001 * input_tokens + 0.05 * output_tokens) * max(1.0, in_flight / capacity)
+            work = estimator.work(input_tokens, output_tokens)
+            estimator.observe(input_tokens, "concise", 1000, output_tokens, seconds)
+            limit.on_sample(seconds / work, in_flight)
+        history.append(limit.limit)
+    return history
+
+
+class TestAIMDLimit:
+    """Test AIMDLimit"""
+
+    def test_tracks_capacity_changes(self):
+        """Test the limit grows to the backend capacity and backs off when it shrinks"""
+        limit = AIMDLimit(initial_limit=4, max_limit=32)
+
+        grown = _run(limit, base=0.01, capacity=8, rounds=300)
+        shrunk = _run(limit, base=0.01, capacity=2, rounds=300)
+
+        # Medians, since a baseline probe halves the limit for a round
+        assert 8 <= statistics.median(grown[-100:]) <= 14
+        assert statistics.median(shrunk[-100:]) <= 4
+        assert limit.stats["limit_increases"] > 0
+        assert limit.stats["limit_decreases"] > 0
+
+    def test_tracks_capacity_with_mixed_input_sizes(self):
+        """Test latency per unit of call size, not per generated token, keeps prefill-heavy calls comparable"""
+        limit = AIMDLimit(initial_limit=4, max_limit=32)
+        estimator = ServiceTimeEstimator()
+
+        grown = _run_mixed(limit, estimator, capacity=8, rounds=300)
+        shrunk = _run_mixed(limit, estimator, capacity=2, rounds=300)
+
+        assert 8 <= statistics.median(grown[-100:]) <= 14
+        assert statistics.median(shrunk[-100:]) <= 4
+
+    def test_probe_resets_baseline_for_slower_backend(self):
+        """Test a slower model settles near its capacity instead of pinning the limit at the minimum"""
+        limit = AIMDLimit(initial_limit=4, max_limit=32, probe_interval=200)
+        _run(limit, base=0.01, capacity=8, rounds=100)
+
+        history = _run(limit, base=0.03, capacity=6, rounds=400)
+
+        assert limit.stats["baseline_probes"] > 0
+        assert limit.stats["latency_baseline"] == pytest.approx(0.03)
+        assert statistics.median(history[-100:]) >= 4
+
+    def test_drop_decreases_once_per_round(self):
+        """Test failures back off by the ratio, at most once per round of calls"""
+        limit = AIMDLimit(initial_limit=10, max_limit=32, backoff_ratio=0.5)
+
+        for _ in range(10):
+            limit.on_sample(None, 10, dropped=True)
+
+        assert limit.limit == 5
+
+    def test_no_increase_while_underused(self):
+        """Test the limit only grows while at least half of it is in use"""
+        limit = AIMDLimit(initial_limit=10, max_limit=32)
+
+        for _ in range(100):
+            limit.on_sample(0.01, 2)
+
+        assert limit.limit == 10
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"initial_limit": 0}, {"min_limit": 8, "initial_limit": 4}, {"tolerance": 1.0}, {"backoff_ratio": 1.0}],
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test inconsistent limits and ratios are rejected"""
+        with pytest.raises(ValueError):
+            AIMDLimit(**kwargs)
+
+
+class TestAdaptiveAdmission:
+    """Test AdmissionController driven by an adaptive limit"""
+
+    @pytest.mark.asyncio
+    async def test_slot_reports_latency_per_unit_of_work(self):
+        """Test completed calls report latency divided by the permit's work"""
+        now = 0.0
+        adaptive_limit = AIMDLimit(initial_limit=2, max_limit=8)
+        controller = AdmissionController(max_in_flight=1, adaptive_limit=adaptive_limit, clock=lambda: now)
+
+        async with controller.slot() as permit:
+            now += 2.0
+            permit.work = 100
+
+        assert controller.limit == 2
+        assert controller.stats["adaptive"]
+        assert controller.stats["latency_current"] == pytest.approx(0.02)
+
+    @pytest.mark.asyncio
+    async def test_repository_normalizes_by_input_and_output(self):
+        """Test a long input taking longer for the same completion is not mistaken for congestion"""
+        now = 0.0
+
+        async def summarize(text: str, config: SummaryConfig) -> Summary:
+            nonlocal now
+            now += 0.2 + 0.0005 * len(text) + 0.03 * 50
+            return Summary(original_text=text, summary_text="요약", completion_tokens=50)
+
+        upstream = AsyncMock()
+        upstream.summarize_text = summarize
+        adaptive_limit = AIMDLimit(initial_limit=2, max_limit=8)
+        adaptive_limit.on_sample = Mock(side_effect=adaptive_limit.on_sample)
+        controller = AdmissionController(adaptive_limit=adaptive_limit, clock=lambda: now)
+        repository = AdmissionControlledSummaryRepository(upstream, controller, count_tokens=len)
+
+        await repository.summarize_text("가" * 20, SummaryConfig())
+        await repository.summarize_text("가" * 20000, SummaryConfig())
+
+        short, long = (call.args[0] for call in adaptive_limit.on_sample.call_args_list)
+        assert long == pytest.approx(short)
+
+    @pytest.mark.asyncio
+    async def test_failures_reduce_limit_and_client_errors_are_ignored(self):
+        """Test upstream failures count as drops while invalid input leaves the limit alone"""
+        controller = AdmissionController(adaptive_limit=AIMDLimit(initial_limit=4, max_limit=8, backoff_ratio=0.5))
+
+        for _ in range(4):
+            with pytest.raises(ValueError):
+                async with controller.slot():
+                    raise ValueError("invalid")
+        assert controller.limit == 4
+
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                async with controller.slot():
+                    raise RuntimeError("upstream failed")
+
+        assert controller.limit == 2
+        assert controller.in_flight == 0
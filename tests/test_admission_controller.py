@@ -0,0 +1,179 @@
+"""Test admission control"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.main import create_app
+from app.shared.admission_controller import AdmissionController
+
+
+async def _hold(controller: AdmissionController, release: asyncio.Event) -> None:
+    async with controller.slot():
+        await release.wait()
+
+
+class TestAdmissionController:
+    """Test AdmissionController"""
+
+    @pytest.mark.asyncio
+    async def test_limits_in_flight(self):
+        """Test callers beyond the limit wait in the queue"""
+        controller = AdmissionController(max_in_flight=2, max_queue=10)
+        release = asyncio.Event()
+
+        tasks = [asyncio.create_task(_hold(controller, release)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        assert controller.in_flight == 2
+        assert controller.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert controller.in_flight == 0
+        assert controller.stats["admitted"] == 5
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        """Test waiters are admitted in arrival order"""
+        controller = AdmissionController(max_in_flight=1, max_queue=10)
+        order = []
+
+        async def call(index):
+            async with controller.slot():
+                order.append(index)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(call(index) for index in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test arrivals beyond the queue bound fail fast with a retry hint"""
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(controller, release)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloadedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.queue_full
+        assert exc_info.value.retry_after >= 1
+        assert controller.stats["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline(self):
+        """Test waiters give up after queue_timeout and leave the queue"""
+        controller = AdmissionController(max_in_flight=1, max_queue=5, queue_timeout=0.01)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, release))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloadedError) as exc_info:
+            await controller.acquire()
+
+        assert not exc_info.value.queue_full
+        assert controller.queue_depth == 0
+        assert controller.stats["timed_out"] == 1
+        assert controller.stats["wait_seconds_max"] >= 0.01
+
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Test a cancelled waiter neither keeps a queue entry nor a slot"""
+        controller = AdmissionController(max_in_flight=1, max_queue=5)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, release))
+        await asyncio.sleep(0)
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.queue_depth == 0
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_wakes_waiters(self):
+        """Test increasing the limit admits queued callers"""
+        controller = AdmissionController(max_in_flight=1, max_queue=5)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(controller, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        controller.limit = 3
+
+        assert controller.in_flight == 3
+        assert controller.queue_depth == 0
+        release.set()
+        await asyncio.gather(*tasks)
+
+
+class TestAdmissionControlledRepository:
+    """Test AdmissionControlledSummaryRepository"""
+
+    @pytest.mark.asyncio
+    async def test_bounds_upstream_concurrency(self, mock_summary_repository, sample_summary):
+        """Test no more than max_in_flight calls reach the wrapped repository"""
+        in_flight = peak = 0
+
+        async def summarize(text, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return sample_summary
+
+        mock_summary_repository.summarize_text.side_effect = summarize
+        repository = AdmissionControlledSummaryRepository(
+            mock_summary_repository, AdmissionController(max_in_flight=2, max_queue=10)
+        )
+
+        await asyncio.gather(*(repository.summarize_text(f"텍스트 {i}", SummaryConfig()) for i in range(6)))
+
+        assert peak == 2
+
+
+class TestOverloadResponses:
+    """Test overload errors map to 429/503 with Retry-After"""
+
+    @pytest.fixture
+    def client(self):
+        """Application with a mocked LLM"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="요약"))
+            app = create_app()
+            yield app, TestClient(app)
+
+    @pytest.mark.parametrize(("queue_full", "status_code"), [(True, 429), (False, 503)])
+    def test_overloaded(self, client, queue_full, status_code):
+        """Test a full queue returns 429 and an expired wait returns 503"""
+        app, test_client = client
+        controller = app.state.container.admission_controller()
+        controller.acquire = AsyncMock(side_effect=ServiceOverloadedError("busy", 2.4, queue_full=queue_full))
+
+        response = test_client.post("/api/v1/summary/", json={"text": "과부하 테스트용 텍스트입니다. 충분히 깁니다."})
+
+        assert response.status_code == status_code
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["detail"]["error_code"] == "SERVICE_OVERLOADED"
@@ -0,0 +1,148 @@
+"""Test batch summarization"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.dtos.requests.summary_request import SummaryBatchRequest, SummaryRequest
+from app.application.dtos.responses.summary_response import SummaryResponse
+from app.application.use_cases.summary_use_cases import SummarizeBatchUseCase
+from app.domain.entities.summary import Summary
+from app.main import create_app
+
+TEXTS = [f"배치 테스트용 텍스트 {index}번입니다. 충분히 긴 텍스트입니다." for index in range(6)]
+
+
+def _batch(texts=TEXTS) -> SummaryBatchRequest:
+    return SummaryBatchRequest(items=[SummaryRequest(text=text) for text in texts])
+
+
+class TestSummarizeBatchUseCase:
+    """Test SummarizeBatchUseCase"""
+
+    @pytest.fixture
+    def single_use_case(self):
+        """Mock single-item use case tracking concurrency"""
+        use_case = Mock()
+        use_case.in_flight = 0
+        use_case.peak = 0
+
+        async def execute(request):
+            use_case.in_flight += 1
+            use_case.peak = max(use_case.peak, use_case.in_flight)
+            # Later items finish first
+            await asyncio.sleep(0.01 * (len(TEXTS) - TEXTS.index(request.text)))
+            use_case.in_flight -= 1
+            if "3번" in request.text:
+                raise RuntimeError("Failed to summarize text")
+            return SummaryResponse.from_domain_entity(
+                Summary(id="item-id", original_text=request.text, summary_text="요약")
+            )
+
+        use_case.execute = AsyncMock(side_effect=execute)
+        return use_case
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_isolated_failures(self, single_use_case):
+        """Test items come back in order and one failure does not abort the batch"""
+        use_case = SummarizeBatchUseCase(single_use_case, max_concurrency=2)
+
+        response = await use_case.execute(_batch())
+
+        assert [item.index for item in response.items] == list(range(len(TEXTS)))
+        assert response.total == 6
+        assert response.succeeded == 5
+        assert response.failed == 1
+        assert response.items[3].error.error_code == "SUMMARIZATION_ERROR"
+        assert response.items[0].result.original_text == TEXTS[0]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, single_use_case):
+        """Test no more than max_concurrency items run at once"""
+        use_case = SummarizeBatchUseCase(single_use_case, max_concurrency=2)
+
+        await use_case.execute(_batch())
+
+        assert single_use_case.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self, single_use_case):
+        """Test streamed items arrive as they finish"""
+        use_case = SummarizeBatchUseCase(single_use_case, max_concurrency=len(TEXTS))
+
+        items = [item async for item in use_case.execute_stream(_batch())]
+
+        assert [item.index for item in items] == list(reversed(range(len(TEXTS))))
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_fail_alone(self, single_use_case):
+        """Test items that are not valid requests are reported in place while the others are summarized"""
+        use_case = SummarizeBatchUseCase(single_use_case)
+        items = [{"text": TEXTS[0]}, {"text": "짧음"}, {"text": TEXTS[1], "summary_type": "poem"}, "not an object"]
+
+        response = await use_case.execute(SummaryBatchRequest(items=items))
+
+        assert [item.status for item in response.items] == ["success", "error", "error", "error"]
+        assert {item.error.error_code for item in response.items[1:]} == {"VALIDATION_ERROR"}
+        assert response.items[1].error.error.startswith("text:")
+        assert "summary_type must be one of" in response.items[2].error.error
+        assert single_use_case.execute.await_count == 1
+
+    def test_rejects_oversized_batch(self, single_use_case):
+        """Test batches above max_items are rejected"""
+        use_case = SummarizeBatchUseCase(single_use_case, max_items=2)
+
+        with pytest.raises(ValueError, match="Batch is too large"):
+            use_case.execute_stream(_batch())
+
+
+class TestBatchEndpoint:
+    """Test POST /summary/batch"""
+
+    @pytest.fixture
+    def client(self):
+        """Test client with a mocked LLM"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="모킹된 요약 결과입니다."))
+            yield TestClient(create_app())
+
+    def test_json_response(self, client):
+        """Test the batch returns per-item results"""
+        response = client.post("/api/v1/summary/batch", json={"items": [{"text": text} for text in TEXTS[:3]]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert [item["result"]["original_text"] for item in data["items"]] == TEXTS[:3]
+
+    def test_ndjson_response(self, client):
+        """Test NDJSON streaming is negotiated by Accept and not gzipped"""
+        response = client.post(
+            "/api/v1/summary/batch",
+            json={"items": [{"text": text} for text in TEXTS[:3]]},
+            headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "content-encoding" not in response.headers
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1, 2]
+
+    def test_invalid_item_does_not_reject_batch(self, client):
+        """Test an invalid item gets its own error while the batch succeeds"""
+        response = client.post("/api/v1/summary/batch", json={"items": [{"text": TEXTS[0]}, {"text": ""}]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["succeeded"], data["failed"]) == (1, 1)
+        assert data["items"][1]["error"]["error_code"] == "VALIDATION_ERROR"
+
+    def test_empty_batch_rejected(self, client):
+        """Test an empty batch fails validation"""
+        response = client.post("/api/v1/summary/batch", json={"items": []})
+
+        assert response.status_code == 422
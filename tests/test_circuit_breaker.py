@@ -0,0 +1,139 @@
+"""Test circuit breaking"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.domain.exceptions import CircuitOpenError
+from app.infrastructure.external_services.upstream_health_monitor import UpstreamHealth
+from app.main import create_app
+from app.shared.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker"""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the breaker opens at the threshold and successes reset the count"""
+        breaker = CircuitBreaker(name="test-open", failure_threshold=3, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert REGISTRY.get_sample_value("llmplan_circuit_breaker_state", {"endpoint": "test-open"}) == 2
+
+    def test_rejects_while_open(self):
+        """Test calls fail fast with the time left until the trial call"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 10.0
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+
+        assert exc_info.value.retry_after == 20.0
+        assert not exc_info.value.queue_full
+        assert breaker.stats["rejected"] == 1
+
+    def test_half_open_allows_one_trial(self):
+        """Test only one trial call runs after the recovery timeout and its outcome decides the state"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+
+        breaker.before_call()
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        clock.now = 60.0
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_abandoned_trial_frees_the_slot(self):
+        """Test a cancelled trial call lets the next one through"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+
+        breaker.before_call()
+        breaker.record_abandoned()
+
+        assert breaker.allows_request
+
+
+class TestCircuitBreakerResponses:
+    """Test breaker state in API responses"""
+
+    @pytest.fixture
+    def client(self):
+        """Application whose LLM always fails"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(side_effect=ConnectionError("upstream down"))
+            app = create_app()
+            yield app, TestClient(app)
+
+    def test_open_circuit_returns_503(self, client):
+        """Test requests fail fast with 503 and Retry-After once the breaker opens"""
+        app, test_client = client
+        threshold = app.state.container.settings().CIRCUIT_BREAKER_FAILURE_THRESHOLD
+
+        for i in range(threshold):
+            response = test_client.post("/api/v1/summary/", json={"text": f"서킷 브레이커 테스트용 텍스트입니다. {i}"})
+            assert response.status_code == 500
+
+        response = test_client.post("/api/v1/summary/", json={"text": "서킷 브레이커 테스트용 텍스트입니다. 마지막"})
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["error_code"] == "UPSTREAM_UNAVAILABLE"
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_health_reports_circuit_state(self, client):
+        """Test the health response lists the breaker state per endpoint"""
+        app, test_client = client
+        endpoint = app.state.container.lmstudio_endpoints()[0]
+        endpoint.repository.health_check = AsyncMock(return_value=True)
+
+        response = test_client.get("/api/v1/summary/health")
+
+        assert response.status_code == 200
+        assert response.json()["circuit_breakers"] == {endpoint.name: "closed"}
+
+    def test_health_reports_readiness_separately(self, client):
+        """Test a failed generation probe is reported as readiness without failing the health check"""
+        app, test_client = client
+        endpoint = app.state.container.lmstudio_endpoints()[0]
+        monitor = endpoint.repository.health_monitor
+        monitor.check = AsyncMock(return_value=UpstreamHealth(live=True, ready=False, checked_at=0.0))
+        monitor._status = monitor.check.return_value
+
+        response = test_client.get("/api/v1/summary/health")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert response.json()["ready"] == {endpoint.name: False}
@@ -0,0 +1,235 @@
+"""Test chunking and hierarchical summarization"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dtos.requests.summary_request import SummaryRequest
+from app.application.use_cases.summary_use_cases import SummarizeTextUseCase
+from app.domain.entities.summary import Summary
+from app.domain.services.hierarchical_summary_service import HierarchicalSummaryService
+from app.domain.services.summary_service import SummaryService
+from app.domain.services.text_chunker import TextChunker, estimate_tokens
+from app.domain.value_objects.summary_config import SummaryBudget, SummaryConfig
+
+SENTENCE = "이 문장은 긴 문서를 구성하는 테스트용 문장입니다. "
+LONG_TEXT = "".join(f"이 문장은 긴 문서를 구성하는 {index}번째 문장입니다. " for index in range(4000))
+
+
+class TestTextChunker:
+    """Test TextChunker"""
+
+    def test_estimate_tokens(self):
+        """Test CJK text counts about one token per character"""
+        assert estimate_tokens("가나다라") == 4
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("") == 0
+
+    def test_chunks_fit_budget(self):
+        """Test every chunk fits the token budget and no text is lost"""
+        chunker = TextChunker(max_chunk_tokens=100, overlap_tokens=0)
+
+        chunks = chunker.split(SENTENCE * 50)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+        assert "".join(chunks).replace(" ", "") == (SENTENCE * 50).replace(" ", "")
+
+    def test_overlap_repeats_trailing_context(self):
+        """Test consecutive chunks share trailing sentences"""
+        text = " ".join(f"문장 번호 {index}번입니다." for index in range(40))
+        chunker = TextChunker(max_chunk_tokens=60, overlap_tokens=15)
+
+        chunks = chunker.split(text)
+
+        for previous, current in zip(chunks, chunks[1:], strict=False):
+            assert current.split(".")[0] + "." in previous
+
+    def test_oversized_sentence_is_cut(self):
+        """Test a single sentence longer than a chunk is split by length"""
+        chunker = TextChunker(max_chunk_tokens=50, overlap_tokens=0)
+
+        chunks = chunker.split("가" * 175)
+
+        assert [len(chunk) for chunk in chunks] == [50, 50, 50, 25]
+
+    def test_paragraph_breaks_are_kept(self):
+        """Test chunks join sentences with a space and paragraphs with a blank line"""
+        chunker = TextChunker(max_chunk_tokens=30, overlap_tokens=0)
+
+        chunks = chunker.split(
+            "첫 문단의 문장. 같은 문단.\n\n둘째 문단입니다.\n \n셋째 문단은 길어서 다음 조각으로 넘어갑니다."
+        )
+
+        assert chunks == [
+            "첫 문단의 문장. 같은 문단.\n\n둘째 문단입니다.",
+            "셋째 문단은 길어서 다음 조각으로 넘어갑니다.",
+        ]
+
+    def test_invalid_overlap(self):
+        """Test overlap must be smaller than a chunk"""
+        with pytest.raises(ValueError):
+            TextChunker(max_chunk_tokens=10, overlap_tokens=10)
+
+
+class TestHierarchicalSummaryService:
+    """Test HierarchicalSummaryService"""
+
+    @pytest.fixture
+    def summary_repository(self, mock_summary_repository):
+        """Repository returning a short summary and tracking concurrency"""
+        mock_summary_repository.in_flight = 0
+        mock_summary_repository.peak = 0
+
+        async def summarize(text, config):
+            mock_summary_repository.in_flight += 1
+            mock_summary_repository.peak = max(mock_summary_repository.peak, mock_summary_repository.in_flight)
+            await asyncio.sleep(0.001)
+            mock_summary_repository.in_flight -= 1
+            return Summary(id="partial", original_text=text, summary_text=f"부분 요약 {len(text)}자입니다.")
+
+        mock_summary_repository.summarize_text.side_effect = summarize
+        return mock_summary_repository
+
+    def _service(self, repository, **kwargs) -> HierarchicalSummaryService:
+        return HierarchicalSummaryService(
+            SummaryService(repository),
+            TextChunker(max_chunk_tokens=kwargs.pop("chunk_tokens", 2000), overlap_tokens=100),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_map_reduce_long_text(self, summary_repository):
+        """Test text beyond the single-pass cap is chunked, mapped concurrently and reduced"""
+        service = self._service(summary_repository, max_concurrency=3)
+
+        summary = await service.summarize_text(LONG_TEXT, SummaryConfig())
+
+        assert summary.original_text == LONG_TEXT
+        assert summary.summary_text.startswith("부분 요약")
+        assert not summary.truncated
+        assert summary_repository.summarize_text.call_count > 2
+        assert summary_repository.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_short_text_is_single_call(self, summary_repository, sample_text):
+        """Test text within the single-pass limit is summarized once"""
+        service = self._service(summary_repository)
+
+        assert not service.needs_chunking(sample_text)
+        await service.summarize_text(sample_text)
+
+        summary_repository.summarize_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_recursive_reduce(self, summary_repository):
+        """Test partial summaries too large for one call are reduced again"""
+        service = self._service(summary_repository, chunk_tokens=200, single_pass_max_tokens=300)
+
+        await service.summarize_text(SENTENCE * 600)
+
+        inputs = [call.args[0] for call in summary_repository.summarize_text.call_args_list]
+        assert any(text.startswith("부분 요약") for text in inputs)
+
+    @pytest.mark.asyncio
+    async def test_clipped_final_reduce_is_reported(self, summary_repository):
+        """Test text still too long at the maximum depth is clipped and the summary says so"""
+        service = self._service(summary_repository, max_depth=0)
+
+        summary = await service.summarize_text(LONG_TEXT)
+
+        assert summary.truncated
+        assert len(summary_repository.summarize_text.call_args.args[0]) == SummaryService.MAX_TEXT_LENGTH
+
+    @pytest.mark.asyncio
+    async def test_truncated_chunk_is_reported(self, mock_summary_repository):
+        """Test a chunk cut to fit the model marks the whole summary truncated"""
+
+        async def summarize(text, config):
+            return Summary(
+                original_text=text, summary_text=f"부분 요약 {len(text)}자입니다.", truncated="0번째" in text
+            )
+
+        mock_summary_repository.summarize_text.side_effect = summarize
+        service = self._service(mock_summary_repository)
+
+        summary = await service.summarize_text(LONG_TEXT)
+
+        assert summary.truncated
+
+    @pytest.mark.asyncio
+    async def test_text_beyond_token_budget_rejected(self, summary_repository):
+        """Test input that cannot fit the token budget fails fast"""
+        service = self._service(summary_repository)
+
+        with pytest.raises(ValueError, match="token budget"):
+            await service.summarize_text(LONG_TEXT, budget=SummaryBudget(max_tokens=1000))
+
+        summary_repository.summarize_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_token_budget_exhausted(self, summary_repository):
+        """Test spending beyond the token budget stops the map phase"""
+        service = self._service(summary_repository, max_concurrency=1)
+
+        with pytest.raises(RuntimeError, match="token budget exceeded"):
+            await service.summarize_text(LONG_TEXT, budget=SummaryBudget(max_tokens=estimate_tokens(LONG_TEXT) + 10))
+
+    @pytest.mark.asyncio
+    async def test_time_budget(self, mock_summary_repository):
+        """Test the time budget bounds the whole request"""
+
+        async def slow(text, config):
+            await asyncio.sleep(1)
+
+        mock_summary_repository.summarize_text.side_effect = slow
+        service = self._service(mock_summary_repository)
+
+        with pytest.raises(RuntimeError, match="time budget exceeded"):
+            await service.summarize_text(LONG_TEXT, budget=SummaryBudget(max_seconds=0.05))
+
+    @pytest.mark.asyncio
+    async def test_max_text_length(self, summary_repository):
+        """Test the hierarchical length cap"""
+        service = self._service(summary_repository, max_text_length=1000)
+
+        with pytest.raises(ValueError, match="Text is too long"):
+            await service.summarize_text("가" * 1001)
+
+
+class TestUseCaseStrategy:
+    """Test strategy selection in SummarizeTextUseCase"""
+
+    @pytest.fixture
+    def use_case(self, mock_summary_repository, sample_summary):
+        mock_summary_repository.summarize_text.return_value = sample_summary
+        service = SummaryService(mock_summary_repository)
+        hierarchical = HierarchicalSummaryService(service, TextChunker())
+        hierarchical.summarize_text = AsyncMock(return_value=sample_summary)
+        return SummarizeTextUseCase(service, hierarchical)
+
+    @pytest.mark.asyncio
+    async def test_auto_uses_hierarchical_for_long_text(self, use_case):
+        """Test long text is routed to map-reduce"""
+        await use_case.execute(SummaryRequest(text=LONG_TEXT))
+
+        use_case.hierarchical_summary_service.summarize_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_auto_uses_single_pass_for_short_text(self, use_case, sample_text):
+        """Test short text keeps the single-pass path"""
+        await use_case.execute(SummaryRequest(text=sample_text))
+
+        use_case.hierarchical_summary_service.summarize_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_single_strategy_keeps_length_cap(self, use_case):
+        """Test strategy=single still rejects text over 50,000 characters"""
+        with pytest.raises(ValueError, match="Text is too long"):
+            await use_case.execute(SummaryRequest(text=LONG_TEXT, strategy="single"))
+
+    def test_invalid_strategy(self, sample_text):
+        """Test unknown strategies are rejected"""
+        with pytest.raises(ValueError):
+            SummaryRequest(text=sample_text, strategy="unknown")
@@ -0,0 +1,67 @@
+"""Test shared LLM client pool"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.domain.value_objects.summary_config import LMStudioConfig, SummaryConfig
+from app.infrastructure.external_services.llm_client_pool import LLMClientPool
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+
+class TestLLMClientPool:
+    """Test LLMClientPool"""
+
+    @pytest.mark.asyncio
+    async def test_open_and_close(self, lmstudio_config):
+        """Test pool lifecycle"""
+        pool = LLMClientPool(lmstudio_config, max_connections=10, max_keepalive_connections=5)
+
+        await pool.open()
+        client = pool.http_client
+        assert pool.is_open
+        assert str(client.base_url).rstrip("/") == lmstudio_config.base_url
+
+        await pool.open()
+        assert pool.http_client is client
+
+        await pool.close()
+        assert not pool.is_open
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_http_client_opens_lazily(self, lmstudio_config):
+        """Test client is created on first use without an explicit open"""
+        pool = LLMClientPool(lmstudio_config)
+
+        assert not pool.is_open
+        assert pool.http_client is pool.http_client
+
+        await pool.close()
+
+    def test_http2_requires_h2(self, lmstudio_config):
+        """Test HTTP/2 is only enabled when h2 is installed"""
+        with patch("app.infrastructure.external_services.llm_client_pool._http2_available", return_value=False):
+            assert LLMClientPool(lmstudio_config, http2=True).http2 is False
+
+        assert LLMClientPool(lmstudio_config, http2=False).http2 is False
+
+    @pytest.mark.asyncio
+    async def test_repositories_share_pool(self, sample_text):
+        """Test every repository instance uses the same HTTP client"""
+        lmstudio_config = LMStudioConfig()
+        pool = LLMClientPool(lmstudio_config)
+
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_instance = Mock()
+            mock_llm_instance.ainvoke = AsyncMock(return_value=Mock(content="요약 결과입니다."))
+            mock_llm_class.return_value = mock_llm_instance
+
+            for _ in range(2):
+                repository = LMStudioSummaryRepository(lmstudio_config, client_pool=pool)
+                await repository.summarize_text(sample_text, SummaryConfig())
+
+            clients = {call.kwargs["http_async_client"] for call in mock_llm_class.call_args_list}
+            assert clients == {pool.http_client}
+
+        await pool.close()
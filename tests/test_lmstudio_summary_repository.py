@@ -0,0 +1,63 @@
+"""Test LMStudio summary repository"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+
+@pytest.fixture
+def mock_llm_class():
+    """Patch ChatOpenAI so every construction returns a new mock handle"""
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_class:
+
+        def create_handle(**kwargs):
+            handle = Mock()
+            handle.kwargs = kwargs
+            handle.ainvoke = AsyncMock(return_value=Mock(content="요약 결과입니다."))
+            return handle
+
+        mock_class.side_effect = create_handle
+        yield mock_class
+
+
+class TestLLMHandleCache:
+    """Test per-config LLM handle caching"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_handle_for_same_config(self, lmstudio_config, mock_llm_class, sample_text):
+        """Test identical configs share one handle"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        await repository.summarize_text(sample_text, SummaryConfig())
+        await repository.summarize_text(sample_text, SummaryConfig())
+
+        assert mock_llm_class.call_count == 1
+        assert repository.llm_cache_stats["hits"] == 1
+        assert repository.llm_cache_stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_respects_generation_parameters(self, lmstudio_config, mock_llm_class, sample_text):
+        """Test later configs are not served by the first handle"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        await repository.summarize_text(sample_text, SummaryConfig(max_tokens=100, temperature=0.0))
+        await repository.summarize_text(sample_text, SummaryConfig(max_tokens=800, temperature=0.7))
+
+        kwargs = [call.kwargs for call in mock_llm_class.call_args_list]
+        assert [(k["max_tokens"], k["temperature"]) for k in kwargs] == [(100, 0.0), (800, 0.7)]
+        assert kwargs[0]["http_async_client"] is kwargs[1]["http_async_client"]
+
+    @pytest.mark.asyncio
+    async def test_evicts_beyond_capacity(self, lmstudio_config, mock_llm_class, sample_text):
+        """Test the handle cache stays bounded"""
+        repository = LMStudioSummaryRepository(lmstudio_config, max_cached_clients=2)
+
+        for max_tokens in (100, 200, 300):
+            await repository.summarize_text(sample_text, SummaryConfig(max_tokens=max_tokens))
+
+        stats = repository.llm_cache_stats
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
@@ -0,0 +1,135 @@
+"""Test Prometheus metrics"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app import main
+from app.main import create_app
+from app.shared.metrics import MULTIPROC_DIR_ENV
+
+TEXT = "메트릭 테스트용 텍스트입니다. 충분히 긴 텍스트입니다."
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _summary_requests() -> float:
+    """Count of successful POST /summary/ requests, whatever prefix the route label carries"""
+    return sum(
+        sample.value
+        for metric in REGISTRY.collect()
+        if metric.name == "llmplan_request_duration_seconds"
+        for sample in metric.samples
+        if sample.name.endswith("_count")
+        and sample.labels["route"].endswith("/summary/")
+        and sample.labels["method"] == "POST"
+        and sample.labels["status"] == "200"
+    )
+
+
+@pytest.fixture
+def client():
+    """Test client with a mocked LLM reporting token usage"""
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        response = Mock(content="모킹된 요약입니다.", usage_metadata={"input_tokens": 120, "output_tokens": 30})
+        mock_llm_class.return_value.ainvoke = AsyncMock(return_value=response)
+        yield TestClient(create_app())
+
+
+class TestMetrics:
+    """Test /metrics and request instrumentation"""
+
+    def test_summary_request_is_instrumented(self, client):
+        """Test each stage, tokens and cache outcome are recorded"""
+        stages = ("validation", "prompt_build", "upstream_total", "serialization")
+        before = {stage: _sample("llmplan_stage_duration_seconds_count", stage=stage) for stage in stages}
+        prompt_tokens = _sample("llmplan_tokens_total", kind="prompt")
+        misses = _sample("llmplan_summary_cache_requests_total", status="miss")
+        requests = _summary_requests()
+
+        response = client.post("/api/v1/summary/", json={"text": TEXT, "temperature": 0.0})
+
+        assert response.status_code == 200
+        for stage in stages:
+            assert _sample("llmplan_stage_duration_seconds_count", stage=stage) == before[stage] + 1
+        assert _sample("llmplan_tokens_total", kind="prompt") == prompt_tokens + 120
+        assert _sample("llmplan_summary_cache_requests_total", status="miss") == misses + 1
+        assert _summary_requests() == requests + 1
+
+    def test_errors_counted_by_code(self, client):
+        """Test failed requests are counted by error code"""
+        before = _sample("llmplan_errors_total", error_code="VALIDATION_ERROR")
+
+        response = client.post("/api/v1/summary/", json={"text": "          짧음"})
+
+        assert response.status_code == 400
+        assert _sample("llmplan_errors_total", error_code="VALIDATION_ERROR") == before + 1
+
+    def test_unmatched_routes_share_a_label(self, client):
+        """Test unknown paths do not create one series per path"""
+        before = _sample("llmplan_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+
+        client.get("/does-not-exist-1")
+        client.get("/does-not-exist-2")
+
+        assert (
+            _sample("llmplan_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+            == before + 2
+        )
+
+    def test_metrics_endpoint(self, client):
+        """Test the exposition format is served"""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "llmplan_stage_duration_seconds_bucket" in response.text
+        assert "llmplan_admission_queue_depth" in response.text
+
+
+class TestMultiprocessMetrics:
+    """Test metrics aggregated over several worker processes"""
+
+    def test_workers_share_a_fresh_directory(self, tmp_path, monkeypatch):
+        """Test several workers get the configured directory, cleared of a previous run's files"""
+        monkeypatch.setattr(main.app.state.settings, "SERVER_WORKERS", 2)
+        monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+        (tmp_path / "counter_1234.db").write_bytes(b"stale")
+
+        with patch.object(main.uvicorn, "run"):
+            main.run()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_workers_get_a_temporary_directory(self, monkeypatch):
+        """Test a directory is created when none is configured"""
+        monkeypatch.setattr(main.app.state.settings, "SERVER_WORKERS", 2)
+        monkeypatch.delenv(MULTIPROC_DIR_ENV, raising=False)
+
+        with patch.object(main.uvicorn, "run"):
+            main.run()
+
+        directory = os.environ[MULTIPROC_DIR_ENV]
+        assert os.path.isdir(directory)
+        shutil.rmtree(directory)
+
+    def test_scrape_sums_all_workers(self, client, tmp_path, monkeypatch):
+        """Test /metrics of one worker reports the counts of every worker"""
+        monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+        worker = "from app.shared.metrics import record_error; record_error('WORKER_ERROR')"
+        env = {**os.environ, "PYTHONPATH": str(Path(main.__file__).parents[1])}
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", worker], check=True, env=env)
+
+        response = client.get("/metrics")
+
+        assert 'llmplan_errors_total{error_code="WORKER_ERROR"} 2.0' in response.text
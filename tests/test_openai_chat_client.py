@@ -0,0 +1,145 @@
+"""Test the OpenAI-compatible chat client used without LangChain"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.external_services.openai_chat_client import OpenAIChatClient
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+MESSAGES = [{"role": "user", "content": "안녕하세요"}]
+
+
+class _Backend:
+    """Fake /chat/completions answering from a list of statuses, then with a completion"""
+
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.payloads = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0), json={"error": "busy"})
+        if payload["stream"]:
+            events = [{"choices": [{"delta": {"content": token}}]} for token in ("요약", " 결과")]
+            body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+            return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"role": "assistant", "content": "요약 결과"}}],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 3},
+            },
+        )
+
+
+def _client(backend: _Backend, max_retries: int = 2) -> OpenAIChatClient:
+    return OpenAIChatClient(
+        base_url="http://lmstudio.test/v1",
+        api_key="lm-studio",
+        model="qwen/qwen3-4b",
+        temperature=0.3,
+        max_tokens=500,
+        timeout=5,
+        max_retries=max_retries,
+        http_async_client=httpx.AsyncClient(transport=httpx.MockTransport(backend.handle)),
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Skip the retry delays"""
+    with patch("app.infrastructure.external_services.openai_chat_client.asyncio.sleep", AsyncMock()):
+        yield
+
+
+class TestOpenAIChatClient:
+    """Test OpenAIChatClient"""
+
+    @pytest.mark.asyncio
+    async def test_invoke(self):
+        """Test the completion and its usage are returned in the LangChain shape"""
+        backend = _Backend()
+
+        response = await _client(backend).ainvoke(MESSAGES)
+
+        assert response.content == "요약 결과"
+        assert response.usage_metadata == {"input_tokens": 12, "output_tokens": 3}
+        assert backend.payloads[0]["max_tokens"] == 500
+        assert backend.payloads[0]["messages"] == MESSAGES
+
+    @pytest.mark.asyncio
+    async def test_max_tokens_override(self):
+        """Test a per-call max_tokens replaces the default"""
+        backend = _Backend()
+
+        await _client(backend).ainvoke(MESSAGES, max_tokens=64)
+
+        assert backend.payloads[0]["max_tokens"] == 64
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status(self):
+        """Test overload responses are retried until one succeeds"""
+        backend = _Backend(statuses=[503, 429])
+
+        response = await _client(backend).ainvoke(MESSAGES)
+
+        assert response.content == "요약 결과"
+        assert len(backend.payloads) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self):
+        """Test the last retryable error is raised"""
+        backend = _Backend(statuses=[503, 503, 503])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _client(backend).ainvoke(MESSAGES)
+
+        assert len(backend.payloads) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """Test a 400 fails at once"""
+        backend = _Backend(statuses=[400])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _client(backend).ainvoke(MESSAGES)
+
+        assert len(backend.payloads) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream(self):
+        """Test server-sent deltas are yielded until [DONE]"""
+        backend = _Backend()
+
+        chunks = [chunk.content async for chunk in _client(backend).astream(MESSAGES)]
+
+        assert chunks == ["요약", " 결과"]
+        assert backend.payloads[0]["stream"] is True
+
+
+class TestRawBackend:
+    """Test the summary repository on the raw client"""
+
+    @pytest.mark.asyncio
+    async def test_summarize_without_langchain(self, lmstudio_config, sample_text):
+        """Test summaries are produced through the raw client with server-reported usage"""
+        backend = _Backend()
+        client_pool = Mock(http_client=httpx.AsyncClient(transport=httpx.MockTransport(backend.handle)))
+        repository = LMStudioSummaryRepository(lmstudio_config, client_pool=client_pool, client_backend="raw")
+
+        summary = await repository.summarize_text(sample_text, SummaryConfig())
+
+        assert summary.summary_text == "요약 결과"
+        assert summary.prompt_tokens == 12
+        assert [message["role"] for message in backend.payloads[0]["messages"]] == ["system", "user"]
+
+    def test_unknown_backend(self, lmstudio_config):
+        """Test an unknown client backend is rejected"""
+        with pytest.raises(ValueError, match="client_backend"):
+            LMStudioSummaryRepository(lmstudio_config, client_backend="grpc")
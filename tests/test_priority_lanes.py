@@ -0,0 +1,248 @@
+"""Test priority lanes and weighted fair admission"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from app.domain.exceptions import ServiceOverloadedError
+from app.main import create_app
+from app.presentation.middleware.priority import PriorityMiddleware
+from app.shared.admission_controller import AdmissionController
+from app.shared.fair_queue import WeightedFairQueue
+from app.shared.priority import Priority, current_priority, priority_scope
+
+LANES = {"interactive": 8.0, "default": 4.0, "bulk": 1.0}
+
+
+class TestWeightedFairQueue:
+    """Test WeightedFairQueue"""
+
+    def test_shares_follow_weights(self):
+        """Test backlogged flows are served in proportion to their weights"""
+        queue = WeightedFairQueue()
+        for index in range(20):
+            queue.push(f"a{index}", "a", weight=3.0)
+            queue.push(f"b{index}", "b", weight=1.0)
+
+        served = [queue.pop() for _ in range(12)]
+
+        assert sum(item.startswith("a") for item in served) == 9
+
+    def test_idle_flow_does_not_bank_credit(self):
+        """Test a flow arriving late is interleaved rather than served all at once"""
+        queue = WeightedFairQueue()
+        for index in range(10):
+            queue.push(f"a{index}", "a")
+        for _ in range(5):
+            queue.pop()
+        for index in range(5):
+            queue.push(f"b{index}", "b")
+
+        served = [queue.pop() for _ in range(4)]
+
+        assert sorted(item[0] for item in served) == ["a", "a", "b", "b"]
+
+    def test_aging_serves_old_items_first(self):
+        """Test an outweighed item goes first once it has waited aging_seconds"""
+        now = 0.0
+        queue = WeightedFairQueue(aging_seconds=5.0, clock=lambda: now)
+        queue.push("bulk", "bulk", weight=1.0)
+        now = 6.0
+        for index in range(3):
+            queue.push(f"interactive{index}", "interactive", weight=100.0)
+
+        assert queue.pop() == "bulk"
+
+    def test_remove(self):
+        """Test removed items are skipped and the length follows"""
+        queue = WeightedFairQueue()
+        first, second = object(), object()
+        queue.push(first, "a")
+        queue.push(second, "a")
+
+        assert queue.remove(first)
+        assert not queue.remove(first)
+        assert len(queue) == 1
+        assert queue.pop() is second
+        with pytest.raises(IndexError):
+            queue.pop()
+
+
+async def _hold(controller: AdmissionController, release: asyncio.Event, priority: Priority, order: list) -> None:
+    async with controller.slot(priority):
+        order.append(priority)
+        await release.wait()
+
+
+class TestPriorityAdmission:
+    """Test AdmissionController with priority lanes"""
+
+    @pytest.mark.asyncio
+    async def test_interactive_overtakes_bulk_backlog(self):
+        """Test a freed slot goes to a later interactive caller before queued bulk callers"""
+        controller = AdmissionController(max_in_flight=1, max_queue=10, lane_weights=LANES)
+        release = asyncio.Event()
+        order = []
+        holder = asyncio.create_task(_hold(controller, release, Priority("bulk"), order))
+        await asyncio.sleep(0)
+
+        waiters = [asyncio.create_task(_hold(controller, release, Priority("bulk"), order)) for _ in range(5)]
+        await asyncio.sleep(0)
+        waiters.append(asyncio.create_task(_hold(controller, release, Priority("interactive"), order)))
+        await asyncio.sleep(0)
+        assert controller.stats["lane_queue_depth"] == {"interactive": 1, "default": 0, "bulk": 5}
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order[1] == Priority("interactive")
+
+    @pytest.mark.asyncio
+    async def test_queue_bound_is_per_lane(self):
+        """Test a full bulk queue rejects bulk callers but still queues interactive ones"""
+        controller = AdmissionController(max_in_flight=1, max_queue=1, lane_weights=LANES)
+        release = asyncio.Event()
+        order = []
+        tasks = [asyncio.create_task(_hold(controller, release, Priority("bulk"), order)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloadedError):
+            await controller.acquire(Priority("bulk"))
+        tasks.append(asyncio.create_task(_hold(controller, release, Priority("interactive"), order)))
+        await asyncio.sleep(0)
+
+        assert controller.lane_depth("interactive") == 1
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_tenants_share_a_lane(self):
+        """Test one tenant's backlog does not hold back another tenant of the same lane"""
+        controller = AdmissionController(max_in_flight=1, max_queue=10, lane_weights=LANES)
+        release = asyncio.Event()
+        order = []
+        holder = asyncio.create_task(_hold(controller, release, Priority("bulk", "a"), order))
+        await asyncio.sleep(0)
+
+        waiters = [asyncio.create_task(_hold(controller, release, Priority("bulk", "a"), order)) for _ in range(4)]
+        await asyncio.sleep(0)
+        waiters.append(asyncio.create_task(_hold(controller, release, Priority("bulk", "b"), order)))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert Priority("bulk", "b") in order[1:3]
+
+    @pytest.mark.asyncio
+    async def test_priority_from_context(self):
+        """Test callers without an explicit priority use the current one, unknown lanes the default"""
+        controller = AdmissionController(max_in_flight=1, max_queue=10, lane_weights=LANES)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, release, Priority("default"), []))
+        await asyncio.sleep(0)
+
+        with priority_scope(Priority("interactive")):
+            interactive = asyncio.create_task(controller.acquire())
+        with priority_scope(Priority("unknown")):
+            unknown = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+
+        assert controller.stats["lane_queue_depth"] == {"interactive": 1, "default": 1, "bulk": 0}
+        release.set()
+        await holder
+        await interactive
+        controller.release()
+        await unknown
+        controller.release()
+        assert controller.in_flight == 0
+
+    def test_invalid_lanes(self):
+        """Test the default lane must have a positive weight"""
+        with pytest.raises(ValueError):
+            AdmissionController(lane_weights={"bulk": 1.0})
+        with pytest.raises(ValueError):
+            AdmissionController(lane_weights={"default": 0.0})
+
+
+class TestPriorityMiddleware:
+    """Test request classification"""
+
+    @pytest.fixture
+    def middleware(self):
+        """Middleware with the default lanes, a UI key, a bulk key and a trusted gateway key"""
+        return PriorityMiddleware(
+            Mock(),
+            lane_weights=LANES,
+            api_key_lanes={"ui-key": "interactive", "nightly-key": "bulk", "gateway-key": "default"},
+            default_lane="default",
+            trusted_tenant_keys=["gateway-key"],
+        )
+
+    def test_api_key_lane(self, middleware):
+        """Test callers get their API key's lane and are keyed by it"""
+        headers = Headers({"X-Priority": "urgent", "Authorization": "Bearer ui-key"})
+
+        assert middleware.classify(headers) == Priority("interactive", "ui-key")
+
+    def test_header_cannot_raise_lane(self, middleware):
+        """Test the lane header is ignored when it asks for more than the API key's lane"""
+        bulk = Headers({"X-Priority": "interactive", "X-API-Key": "nightly-key"})
+        anonymous = Headers({"X-Priority": "interactive"})
+
+        assert middleware.classify(bulk) == Priority("bulk", "nightly-key")
+        assert middleware.classify(anonymous) == Priority("default")
+
+    def test_header_can_lower_lane(self, middleware):
+        """Test callers may send their own requests at a lower priority"""
+        headers = Headers({"X-Priority": "Bulk", "X-API-Key": "ui-key"})
+
+        assert middleware.classify(headers) == Priority("bulk", "ui-key")
+
+    def test_tenant_header_needs_trusted_key(self, middleware):
+        """Test untrusted callers cannot multiply their share by naming tenants"""
+        untrusted = Headers({"X-Tenant-ID": "another", "X-API-Key": "nightly-key"})
+        trusted = Headers({"X-Tenant-ID": "user-7", "X-API-Key": "gateway-key"})
+
+        assert middleware.classify(untrusted).tenant == "nightly-key"
+        assert middleware.classify(trusted).tenant == "gateway-key/user-7"
+
+    def test_default_lane(self, middleware):
+        """Test anonymous callers get the default lane"""
+        assert middleware.classify(Headers({})) == Priority("default")
+
+    def test_rotating_unknown_keys_share_one_flow(self, middleware):
+        """Test a caller inventing a key per request stays one tenant and gets one share of its lane"""
+        queue = WeightedFairQueue()
+        for index in range(20):
+            priority = middleware.classify(Headers({"X-API-Key": f"made-up-{index}"}))
+            queue.push(f"a{index}", (priority.lane, priority.tenant))
+        for index in range(10):
+            priority = middleware.classify(Headers({"X-API-Key": "gateway-key"}))
+            queue.push(f"h{index}", (priority.lane, priority.tenant))
+
+        served = "".join(queue.pop()[0] for _ in range(20))
+
+        assert middleware.classify(Headers({"X-API-Key": "made-up-0"})) == Priority("default")
+        assert served.count("h") == 10
+
+    def test_request_priority_reaches_admission(self, monkeypatch):
+        """Test the priority set by the middleware is current when the upstream call is admitted"""
+        monkeypatch.setenv("PRIORITY_API_KEY_LANES", '{"ui-key": "interactive"}')
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="요약", usage_metadata=None))
+            app = create_app()
+            client = TestClient(app)
+            controller = app.state.container.admission_controller()
+            priorities = []
+            controller.acquire = AsyncMock(side_effect=lambda *args: priorities.append(current_priority()))
+
+            client.post(
+                "/api/v1/summary/",
+                json={"text": "우선순위 테스트용 텍스트입니다. 충분히 깁니다."},
+                headers={"X-API-Key": "ui-key"},
+            )
+
+        assert priorities == [Priority("interactive", "ui-key")]
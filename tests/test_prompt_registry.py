@@ -0,0 +1,78 @@
+"""Test the prompt template registry"""
+
+import json
+
+import pytest
+
+from app.infrastructure.external_services.prompt_registry import DEFAULT_TEMPLATES, PromptRegistry
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+
+
+@pytest.fixture
+def budgeter():
+    """Budgeter on the character estimate"""
+    return PromptBudgeter(TokenCounter())
+
+
+class TestPromptRegistry:
+    """Test PromptRegistry"""
+
+    def test_compiles_every_pair(self, budgeter):
+        """Test each language and summary type gets a prompt with precomputed counts"""
+        registry = PromptRegistry(budgeter)
+        registry.load()
+
+        prompt = registry.get("english", "bullet_points")
+
+        assert len(registry) == 9
+        assert registry.version == "v1"
+        assert "Please respond in English." in prompt.system_prompt
+        assert "불릿 포인트" in prompt.system_prompt
+        assert prompt.overhead_tokens == budgeter.overhead(prompt.system_prompt, prompt.user_prefix)
+
+    def test_prompt_is_stable(self, budgeter):
+        """Test repeated requests reuse the identical system prompt"""
+        registry = PromptRegistry(budgeter)
+
+        assert registry.get("korean", "concise") is registry.get("korean", "concise")
+
+    def test_unknown_values_fall_back_to_defaults(self, budgeter):
+        """Test unknown language or summary type use the template defaults"""
+        registry = PromptRegistry(budgeter)
+
+        assert registry.get("klingon", "detailed") is registry.get("korean", "detailed")
+        assert registry.get("english", None) is registry.get("english", "concise")
+
+    def test_loads_versioned_file(self, budgeter, tmp_path):
+        """Test templates are read from a file"""
+        path = tmp_path / "prompts.json"
+        templates = {
+            **DEFAULT_TEMPLATES,
+            "version": "v2",
+            "system": "Summarize. {summary_style} {language_instruction}",
+        }
+        path.write_text(json.dumps(templates, ensure_ascii=False), encoding="utf-8")
+        registry = PromptRegistry(budgeter, templates_path=str(path))
+
+        registry.load()
+
+        assert registry.version == "v2"
+        assert registry.get("english", "concise").system_prompt.startswith("Summarize. ")
+
+    def test_invalid_file(self, budgeter, tmp_path):
+        """Test templates with unknown placeholders are rejected at load time"""
+        path = tmp_path / "prompts.json"
+        path.write_text(json.dumps({**DEFAULT_TEMPLATES, "system": "{tone}"}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid prompt templates"):
+            PromptRegistry(budgeter, templates_path=str(path)).load()
+
+    def test_budget_matches_uncompiled_prompt(self, budgeter):
+        """Test the precomputed overhead gives the same budget as counting per request"""
+        prompt = PromptRegistry(budgeter).get("korean", "concise")
+        text = "예산 계산 테스트 텍스트입니다. " * 50
+
+        precomputed = budgeter.fit(prompt.system_prompt, prompt.user_prefix, text, 500, overhead=prompt.overhead_tokens)
+        counted = budgeter.fit(prompt.system_prompt, prompt.user_prefix, text, 500)
+
+        assert precomputed == counted
@@ -0,0 +1,251 @@
+"""Test per-caller token quotas"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+from app.main import create_app
+from app.presentation.middleware.rate_limit import RateLimitMiddleware
+from app.shared.rate_limiter import TokenBucketRateLimiter
+from app.shared.usage import Usage, record_usage, usage_scope
+
+
+class TestTokenBucketRateLimiter:
+    """Test TokenBucketRateLimiter"""
+
+    def test_spends_and_refills(self):
+        """Test a bucket rejects what it cannot cover, with the wait until it refills enough"""
+        now = 0.0
+        limiter = TokenBucketRateLimiter(tokens_per_minute=600, capacity=100, clock=lambda: now)
+
+        assert limiter.try_acquire("a", 80) == 0
+        assert limiter.try_acquire("a", 50) == pytest.approx(3.0)
+        now = 3.0
+        assert limiter.try_acquire("a", 50) == 0
+        assert limiter.stats["allowed"] == 2
+        assert limiter.stats["rejected"] == 1
+
+    def test_callers_have_separate_buckets(self):
+        """Test one caller's spending does not touch another's quota"""
+        limiter = TokenBucketRateLimiter(tokens_per_minute=60, capacity=100, clock=lambda: 0.0)
+
+        assert limiter.try_acquire("a", 100) == 0
+        assert limiter.try_acquire("a", 1) > 0
+        assert limiter.try_acquire("b", 100) == 0
+
+    def test_oversized_call_runs_on_a_full_bucket_and_leaves_debt(self):
+        """Test a call larger than the bucket is not rejected forever but is paid for afterwards"""
+        now = 0.0
+        limiter = TokenBucketRateLimiter(tokens_per_minute=60, capacity=100, clock=lambda: now)
+
+        assert limiter.try_acquire("a", 250) == 0
+        assert limiter.available("a") == -150
+        assert limiter.try_acquire("a", 250) == pytest.approx(250.0)
+
+    def test_adjust_refunds_up_to_capacity_and_charges_debt(self):
+        """Test reconciliation returns overestimates and charges underestimates"""
+        limiter = TokenBucketRateLimiter(tokens_per_minute=60, capacity=100, clock=lambda: 0.0)
+        limiter.try_acquire("a", 90)
+
+        limiter.adjust("a", 500)
+        assert limiter.available("a") == 100
+        limiter.adjust("a", -130)
+        assert limiter.available("a") == -30
+
+    def test_key_overrides_scale_rate_and_capacity(self):
+        """Test a key with twice the rate also gets twice the burst"""
+        limiter = TokenBucketRateLimiter(
+            tokens_per_minute=60, capacity=100, key_tokens_per_minute={"premium": 120}, clock=lambda: 0.0
+        )
+
+        assert limiter.available("premium") == 200
+        assert limiter.try_acquire("premium", 400) == 0
+        assert limiter.try_acquire("premium", 200) == pytest.approx(200.0)
+
+    def test_buckets_are_bounded(self):
+        """Test full buckets, then the least recently used, are forgotten beyond max_buckets"""
+        limiter = TokenBucketRateLimiter(tokens_per_minute=60, capacity=100, max_buckets=4, clock=lambda: 0.0)
+        for index in range(10):
+            limiter.try_acquire(f"caller{index}", 50)
+
+        assert limiter.stats["buckets"] <= 4
+        assert limiter.available("caller9") == 50
+
+    def test_invalid_arguments(self):
+        """Test the rate and capacity must be positive"""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(tokens_per_minute=0)
+
+
+class TestRateLimitMiddleware:
+    """Test RateLimitMiddleware"""
+
+    @pytest.fixture
+    def middleware(self):
+        """Middleware counting one token per character"""
+        limiter = TokenBucketRateLimiter(tokens_per_minute=60, capacity=1000, clock=lambda: 0.0)
+        return RateLimitMiddleware(
+            Mock(), rate_limiter=limiter, api_keys=["key-1"], default_max_tokens=100, count_tokens=len
+        )
+
+    def test_estimate(self, middleware):
+        """Test the estimate covers the text and the completion limit of each item"""
+        single = json.dumps({"text": "abcd", "max_tokens": 50}).encode()
+        batch = json.dumps({"items": [{"text": "ab"}, {"text": "abc", "max_tokens": 60}]}).encode()
+
+        assert middleware.estimate(single) == 54
+        assert middleware.estimate(batch) == 165
+        assert middleware.estimate(b"not json") == 0
+
+    def test_caller(self, middleware):
+        """Test callers are keyed by known API key, else by client address"""
+        scope = {"type": "http", "headers": [(b"authorization", b"Bearer key-1")], "client": ("10.0.0.1", 5000)}
+        unknown = {**scope, "headers": [(b"x-api-key", b"made-up")]}
+
+        assert middleware.caller(scope) == "key-1"
+        assert middleware.caller({**scope, "headers": []}) == ("client", "10.0.0.1")
+        assert middleware.caller(unknown) == ("client", "10.0.0.1")
+
+    def test_usage_is_metered_per_scope(self):
+        """Test upstream calls add to the current scope only"""
+        record_usage(10, 10)
+        with usage_scope() as usage:
+            record_usage(120, 30)
+            record_usage(None, 5)
+
+        assert (usage.tokens, usage.calls) == (155, 2)
+
+    @pytest.mark.parametrize(
+        ("usage", "settled"),
+        [
+            (Usage(), 1000),
+            (Usage(prompt_tokens=120, completion_tokens=30, calls=1, started=1), 850),
+            (Usage(prompt_tokens=900, completion_tokens=400, calls=1, started=1), -300),
+            (Usage(started=1), 0),
+            (Usage(prompt_tokens=900, completion_tokens=400, calls=1, started=2), -300),
+        ],
+    )
+    def test_settle(self, usage, settled):
+        """Test untouched requests are refunded, reported calls paid exactly, unreported ones at the estimate"""
+        assert RateLimitMiddleware.settle(1000, usage) == settled
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_reports_tokens_so_far(self, lmstudio_config):
+        """Test a stream closed before its end still reports the prompt and the generated tokens"""
+
+        async def generate():
+            for token in ["첫 번째 ", "두 번째 ", "세 번째"]:
+                yield Mock(content=token)
+
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.astream = Mock(side_effect=lambda *args, **kwargs: generate())
+            repository = LMStudioSummaryRepository(lmstudio_config)
+
+            with usage_scope() as usage:
+                stream = repository.summarize_text_stream("스트림 중단 테스트용 텍스트입니다.", SummaryConfig())
+                await anext(stream)
+                await stream.aclose()
+
+        assert (usage.started, usage.calls) == (1, 1)
+        assert usage.prompt_tokens > 0
+        assert usage.completion_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_unreported(self, lmstudio_config):
+        """Test a call that errors after reaching the model counts as started without usage"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(side_effect=TimeoutError("read timeout"))
+            repository = LMStudioSummaryRepository(lmstudio_config)
+
+            with usage_scope() as usage:
+                with pytest.raises(RuntimeError):
+                    await repository.summarize_text("타임아웃 테스트용 텍스트입니다.", SummaryConfig())
+
+        assert (usage.started, usage.unreported) == (1, 1)
+
+
+@pytest.fixture
+def rate_limited_client(tmp_path, monkeypatch):
+    """Application with a 2,000-token bucket refilling one token per second and a mocked LLM using 150 tokens"""
+    monkeypatch.setenv("SUMMARY_STORE_SQLITE_PATH", str(tmp_path / "summaries.sqlite3"))
+    monkeypatch.setenv("SUMMARY_CACHE_ENABLED", "false")
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("RATE_LIMIT_TOKENS_PER_MINUTE", "60")
+    monkeypatch.setenv("RATE_LIMIT_BURST_TOKENS", "2000")
+    monkeypatch.setenv("RATE_LIMIT_API_KEYS", '["key-1", "key-2"]')
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        mock_llm_class.return_value.ainvoke = AsyncMock(
+            return_value=Mock(content="요약", usage_metadata={"input_tokens": 120, "output_tokens": 30})
+        )
+        app = create_app()
+        yield TestClient(app), app.state.container.rate_limiter()
+
+
+class TestRateLimitedApp:
+    """Test token quotas on the summary API"""
+
+    def test_estimate_is_reconciled_with_usage(self, rate_limited_client):
+        """Test callers pay the tokens used, not the 1,000-token completion limit they reserve"""
+        client, limiter = rate_limited_client
+        headers = {"X-API-Key": "key-1"}
+
+        responses = [
+            client.post(
+                "/api/v1/summary/", json={"text": f"{index} 레이트 리밋 테스트용 텍스트입니다."}, headers=headers
+            )
+            for index in range(5)
+        ]
+
+        assert [response.status_code for response in responses] == [200] * 5
+        assert limiter.available("key-1") == pytest.approx(2000 - 5 * 150, abs=5)
+
+    def test_exhausted_quota_returns_429_with_retry_after(self, rate_limited_client):
+        """Test a caller over quota is rejected before any model call while other callers are served"""
+        client, _ = rate_limited_client
+        text = "레이트 리밋 테스트용 텍스트입니다."
+        client.post("/api/v1/summary/", json={"text": text, "max_tokens": 1000}, headers={"X-API-Key": "key-1"})
+
+        response = client.post(
+            "/api/v1/summary/", json={"text": text, "max_tokens": 4000}, headers={"X-API-Key": "key-1"}
+        )
+        other = client.post("/api/v1/summary/", json={"text": text, "max_tokens": 4000}, headers={"X-API-Key": "key-2"})
+
+        assert response.status_code == 429
+        assert response.json()["detail"]["error_code"] == "RATE_LIMITED"
+        assert int(response.headers["Retry-After"]) > 0
+        assert other.status_code == 200
+
+    def test_rotating_unknown_keys_share_one_quota(self, rate_limited_client):
+        """Test a caller inventing a new key per request draws on its address's bucket, not a fresh one each time"""
+        client, limiter = rate_limited_client
+        text = "레이트 리밋 테스트용 텍스트입니다."
+
+        responses = [
+            client.post(
+                "/api/v1/summary/", json={"text": text, "max_tokens": 4000}, headers={"X-API-Key": f"rotated-{index}"}
+            )
+            for index in range(3)
+        ]
+
+        assert [response.status_code for response in responses] == [200, 429, 429]
+        assert limiter.stats["buckets"] == 1
+
+    def test_upstream_error_keeps_the_estimate(self, rate_limited_client):
+        """Test a failed upstream call is not free: the caller pays the estimate"""
+        client, limiter = rate_limited_client
+        limiter_before = limiter.available("key-1")
+        llm = client.app.state.container.lmstudio_endpoints()[0].repository
+        with patch.object(llm, "_get_llm") as get_llm:
+            get_llm.return_value.ainvoke = AsyncMock(side_effect=TimeoutError("read timeout"))
+            response = client.post(
+                "/api/v1/summary/",
+                json={"text": "업스트림 오류 테스트용 텍스트입니다.", "max_tokens": 1000},
+                headers={"X-API-Key": "key-1"},
+            )
+
+        assert response.status_code == 500
+        assert limiter.available("key-1") <= limiter_before - 1000
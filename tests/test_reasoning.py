@@ -0,0 +1,153 @@
+"""Test reasoning control and the <think> block filter"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.external_services.reasoning import ReasoningFilter, ReasoningPolicy, split_reasoning
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+OUTPUT = "<think>\n핵심 문장을 찾는다.\n</think>\n\n요약 결과입니다."
+
+
+class TestReasoningFilter:
+    """Test ReasoningFilter"""
+
+    def test_split_complete_output(self):
+        """Test the reasoning block and the whitespace after it are removed"""
+        assert split_reasoning(OUTPUT) == ("요약 결과입니다.", "\n핵심 문장을 찾는다.\n")
+
+    def test_tags_split_across_chunks(self):
+        """Test character-by-character streaming gives the same answer"""
+        reasoning_filter = ReasoningFilter()
+
+        answer = "".join(reasoning_filter.feed(character) for character in OUTPUT) + reasoning_filter.flush()
+
+        assert answer == "요약 결과입니다."
+        assert reasoning_filter.reasoning == "\n핵심 문장을 찾는다.\n"
+
+    def test_output_without_reasoning_passes_through(self):
+        """Test text that only looks like the start of a tag is released at the end"""
+        reasoning_filter = ReasoningFilter()
+
+        streamed = [reasoning_filter.feed("a < b"), reasoning_filter.feed(" <th"), reasoning_filter.flush()]
+
+        assert "".join(streamed) == "a < b <th"
+        assert reasoning_filter.reasoning == ""
+
+    def test_only_a_leading_block_is_reasoning(self):
+        """Test a tag later in the output is part of the answer, even when streamed"""
+        text = "The HTML uses a <think> tag to mark reasoning. </think> closes it."
+        reasoning_filter = ReasoningFilter()
+
+        streamed = "".join(reasoning_filter.feed(character) for character in text) + reasoning_filter.flush()
+
+        assert split_reasoning(text) == (text, "")
+        assert streamed == text
+        assert split_reasoning(f"  {OUTPUT} 그 다음 <think>") == (
+            "요약 결과입니다. 그 다음 <think>",
+            "\n핵심 문장을 찾는다.\n",
+        )
+
+    def test_partial_tag_at_the_start_passes_through(self):
+        """Test output that only begins like the tag is released once it diverges or ends"""
+        reasoning_filter = ReasoningFilter()
+
+        streamed = [reasoning_filter.feed(" <th"), reasoning_filter.feed("ree>"), reasoning_filter.flush()]
+
+        assert streamed == ["", "<three>", ""]
+        assert split_reasoning("<thi") == ("<thi", "")
+
+    def test_unclosed_block_is_reasoning(self):
+        """Test output cut off while thinking yields no answer"""
+        assert split_reasoning("<think>아직 생각 중") == ("", "아직 생각 중")
+
+
+class TestReasoningPolicy:
+    """Test ReasoningPolicy"""
+
+    def test_thinking_models_are_suppressed_by_default(self):
+        """Test Qwen3 gets the disable method and other models are left alone"""
+        policy = ReasoningPolicy()
+
+        assert policy.suppression("qwen/qwen3-4b") == "no_think"
+        assert policy.suppression("google/gemma-3-4b") is None
+
+    def test_request_and_model_overrides(self):
+        """Test the request setting wins over the per-model one, which wins over the default"""
+        policy = ReasoningPolicy(models={"qwen/qwen3-8b": True})
+
+        assert policy.suppression("qwen/qwen3-8b") is None
+        assert policy.suppression("qwen/qwen3-8b", requested=False) == "no_think"
+        assert policy.suppression("qwen/qwen3-4b", requested=True) is None
+
+    def test_invalid_method(self):
+        """Test unknown disable methods are rejected"""
+        with pytest.raises(ValueError, match="disable_method"):
+            ReasoningPolicy(disable_method="sleep")
+
+
+@pytest.fixture
+def mock_llm():
+    """Patch ChatOpenAI with a handle answering with a reasoning block"""
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        llm = mock_llm_class.return_value
+        llm.ainvoke = AsyncMock(return_value=Mock(content=OUTPUT, usage_metadata=None))
+
+        async def astream(messages, **kwargs):
+            for index in range(0, len(OUTPUT), 3):
+                yield Mock(content=OUTPUT[index : index + 3])
+
+        llm.astream = astream
+        yield llm
+
+
+class TestRepositoryReasoning:
+    """Test reasoning control in LMStudioSummaryRepository"""
+
+    @pytest.mark.asyncio
+    async def test_no_think_directive(self, lmstudio_config, mock_llm, sample_text):
+        """Test the directive is appended to the system prompt unless reasoning is requested"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        await repository.summarize_text(sample_text, SummaryConfig())
+        await repository.summarize_text(sample_text, SummaryConfig(reasoning=True))
+
+        system_prompts = [call.args[0][0]["content"] for call in mock_llm.ainvoke.call_args_list]
+        assert system_prompts[0].endswith("/no_think")
+        assert not system_prompts[1].endswith("/no_think")
+
+    @pytest.mark.asyncio
+    async def test_chat_template_kwargs(self, lmstudio_config, mock_llm, sample_text):
+        """Test the chat template switch is sent as an extra body field"""
+        repository = LMStudioSummaryRepository(
+            lmstudio_config, reasoning_policy=ReasoningPolicy(disable_method="chat_template_kwargs")
+        )
+
+        await repository.summarize_text(sample_text, SummaryConfig())
+
+        call = mock_llm.ainvoke.call_args
+        assert call.kwargs["extra_body"] == {"chat_template_kwargs": {"enable_thinking": False}}
+        assert not call.args[0][0]["content"].endswith("/no_think")
+
+    @pytest.mark.asyncio
+    async def test_summary_excludes_reasoning(self, lmstudio_config, mock_llm, sample_text):
+        """Test the summary drops the reasoning block but its tokens are still counted"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        summary = await repository.summarize_text(sample_text, SummaryConfig(reasoning=True))
+
+        assert summary.summary_text == "요약 결과입니다."
+        assert summary.completion_tokens == repository.prompt_budgeter.token_counter.count(OUTPUT)
+
+    @pytest.mark.asyncio
+    async def test_stream_excludes_reasoning(self, lmstudio_config, mock_llm, sample_text):
+        """Test streamed deltas carry only the answer"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        chunks = [chunk async for chunk in repository.summarize_text_stream(sample_text, SummaryConfig(reasoning=True))]
+
+        assert "".join(chunk.text for chunk in chunks if chunk.text) == "요약 결과입니다."
+        assert chunks[-1].summary.summary_text == "요약 결과입니다."
+        assert chunks[-1].summary.completion_tokens == repository.prompt_budgeter.token_counter.count(OUTPUT)
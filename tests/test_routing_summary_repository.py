@@ -0,0 +1,212 @@
+"""Test load balancing over upstream endpoints"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.exceptions import CircuitOpenError
+from app.domain.repositories.summary_repository import SummaryRepository
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.routing_summary_repository import Endpoint, RoutingSummaryRepository
+from app.main import create_app
+from app.shared.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _endpoint(name, summary, max_concurrency=None, delay=0.0):
+    repository = Mock(spec=SummaryRepository)
+
+    async def summarize(text, config):
+        await asyncio.sleep(delay)
+        return summary
+
+    repository.summarize_text = AsyncMock(side_effect=summarize)
+    repository.health_check = AsyncMock(return_value=True)
+    return Endpoint(name=name, repository=repository, max_concurrency=max_concurrency)
+
+
+class TestRoutingSummaryRepository:
+    """Test RoutingSummaryRepository"""
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_spreads_load(self, sample_summary):
+        """Test concurrent calls are spread evenly over endpoints"""
+        endpoints = [_endpoint(name, sample_summary, delay=0.01) for name in ("a", "b", "c")]
+        repository = RoutingSummaryRepository(endpoints)
+
+        await asyncio.gather(*(repository.summarize_text(f"텍스트 {i}", SummaryConfig()) for i in range(6)))
+
+        assert [endpoint.requests for endpoint in endpoints] == [2, 2, 2]
+        assert all(endpoint.outstanding == 0 for endpoint in endpoints)
+
+    @pytest.mark.asyncio
+    async def test_ewma_prefers_faster_endpoint(self, sample_summary):
+        """Test the latency-weighted strategy routes sequential calls to the faster endpoint"""
+        slow, fast = _endpoint("slow", sample_summary), _endpoint("fast", sample_summary)
+        slow.latency, fast.latency = 2.0, 0.1
+        repository = RoutingSummaryRepository([slow, fast], strategy="ewma")
+
+        for _ in range(4):
+            await repository.summarize_text("텍스트", SummaryConfig())
+
+        assert fast.requests == 4
+        assert slow.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_per_endpoint_cap(self, sample_summary):
+        """Test calls wait rather than exceed an endpoint's concurrency cap"""
+        in_flight = peak = 0
+
+        async def summarize(text, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return sample_summary
+
+        endpoint = _endpoint("a", sample_summary, max_concurrency=2)
+        endpoint.repository.summarize_text.side_effect = summarize
+        repository = RoutingSummaryRepository([endpoint])
+
+        await asyncio.gather(*(repository.summarize_text(f"텍스트 {i}", SummaryConfig()) for i in range(6)))
+
+        assert peak == 2
+        assert endpoint.requests == 6
+
+    @pytest.mark.asyncio
+    async def test_ejects_and_reinstates(self, sample_summary):
+        """Test a failing endpoint leaves rotation and gets a trial call after the recovery timeout"""
+        clock = FakeClock()
+        failing, healthy = _endpoint("failing", sample_summary), _endpoint("healthy", sample_summary)
+        failing.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0, clock=clock)
+        failing.repository.summarize_text.side_effect = RuntimeError("Failed to summarize text")
+        repository = RoutingSummaryRepository([failing, healthy], clock=clock)
+
+        # Sequential calls alternate between the two endpoints
+        for _ in range(4):
+            try:
+                await repository.summarize_text("텍스트", SummaryConfig())
+            except RuntimeError:
+                pass
+
+        assert failing.breaker.state == "open"
+        for _ in range(3):
+            await repository.summarize_text("텍스트", SummaryConfig())
+        assert failing.requests == 2
+
+        clock.now = 31.0
+        failing.repository.summarize_text.side_effect = None
+        failing.repository.summarize_text.return_value = sample_summary
+        for _ in range(2):
+            await repository.summarize_text("텍스트", SummaryConfig())
+
+        assert failing.breaker.state == "closed"
+        assert failing.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_when_every_circuit_is_open(self, sample_summary):
+        """Test calls are rejected without reaching the model while all breakers are open"""
+        clock = FakeClock()
+        endpoint = _endpoint("a", sample_summary)
+        endpoint.breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, clock=clock)
+        endpoint.breaker.record_failure()
+        repository = RoutingSummaryRepository([endpoint], clock=clock)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await repository.summarize_text("텍스트", SummaryConfig())
+
+        assert exc_info.value.retry_after == 30.0
+        endpoint.repository.summarize_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_call(self, sample_summary):
+        """Test a call slower than the latency quantile is raced on another endpoint"""
+        slow, fast = _endpoint("slow", sample_summary, delay=1.0), _endpoint("fast", sample_summary)
+        # The slow endpoint looks fastest, so it gets the first attempt
+        slow.latency, fast.latency = 0.01, 0.1
+        repository = RoutingSummaryRepository(
+            [slow, fast], strategy="ewma", hedging=True, hedge_min_delay=0.01, hedge_min_samples=1
+        )
+        repository._latencies.append(0.01)
+
+        result = await repository.summarize_text("텍스트", SummaryConfig())
+        await asyncio.sleep(0)
+
+        assert result is sample_summary
+        assert slow.requests == 1
+        assert fast.requests == 1
+        assert slow.outstanding == 0
+        assert fast.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_warmup(self, sample_summary):
+        """Test hedging waits for enough latency samples"""
+        slow, fast = _endpoint("slow", sample_summary, delay=0.05), _endpoint("fast", sample_summary)
+        slow.latency, fast.latency = 0.01, 0.1
+        repository = RoutingSummaryRepository([slow, fast], strategy="ewma", hedging=True, hedge_min_delay=0.01)
+
+        await repository.summarize_text("텍스트", SummaryConfig())
+
+        assert fast.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_do_not_count_as_failures(self, sample_summary):
+        """Test rejected input does not trip the circuit breaker"""
+        endpoint = _endpoint("a", sample_summary)
+        endpoint.breaker = CircuitBreaker(failure_threshold=1)
+        endpoint.repository.summarize_text.side_effect = ValueError("Text is too long")
+        repository = RoutingSummaryRepository([endpoint])
+
+        with pytest.raises(ValueError):
+            await repository.summarize_text("텍스트", SummaryConfig())
+
+        assert endpoint.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_health_check_any_endpoint(self, sample_summary):
+        """Test the pool is healthy while one endpoint is"""
+        down, up = _endpoint("down", sample_summary), _endpoint("up", sample_summary)
+        down.repository.health_check.return_value = False
+        repository = RoutingSummaryRepository([down, up])
+
+        assert await repository.health_check() is True
+
+        up.repository.health_check.side_effect = RuntimeError("unreachable")
+        assert await repository.health_check() is False
+
+
+def test_endpoint_pool_from_settings(monkeypatch):
+    """Test each configured URL gets its own repository, health monitor and cap"""
+    monkeypatch.setenv("LMSTUDIO_BASE_URLS", '["http://gpu-0:1234/v1", "http://gpu-1:1234/v1"]')
+    monkeypatch.setenv("LMSTUDIO_ENDPOINT_CONCURRENCY", '{"http://gpu-1:1234/v1": 2}')
+
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI"):
+        app = create_app()
+        response = TestClient(app).get("/api/v1/stats")
+        endpoints = app.state.container.lmstudio_endpoints()
+
+    assert [endpoint.repository.config.base_url for endpoint in endpoints] == [
+        "http://gpu-0:1234/v1",
+        "http://gpu-1:1234/v1",
+    ]
+    assert [endpoint.repository.health_monitor.base_url for endpoint in endpoints] == [
+        "http://gpu-0:1234/v1",
+        "http://gpu-1:1234/v1",
+    ]
+    assert [endpoint.max_concurrency for endpoint in endpoints] == [None, 2]
+    assert [endpoint["name"] for endpoint in response.json()["endpoints"]] == [
+        "http://gpu-0:1234/v1",
+        "http://gpu-1:1234/v1",
+    ]
@@ -0,0 +1,43 @@
+"""Test the production server entry point"""
+
+from unittest.mock import patch
+
+from app import main
+
+
+def test_available_cpus_honours_cgroup_quota(tmp_path, monkeypatch):
+    """Test a CPU quota below the affinity mask caps the count"""
+    monkeypatch.setattr(main.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+
+    with patch.object(main, "Path", return_value=tmp_path / "cpu.max"):
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+        assert main.available_cpus() == 2
+
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert main.available_cpus() == 4
+
+
+def test_run_uses_settings(monkeypatch):
+    """Test workers, keep-alive, backlog and drain timeout come from the settings"""
+    monkeypatch.setattr(main.app.state.settings, "SERVER_WORKERS", 3)
+
+    with patch.object(main.uvicorn, "run") as run:
+        main.run()
+
+    args, kwargs = run.call_args
+    assert args == ("app.main:app",)
+    assert kwargs["workers"] == 3
+    assert kwargs["backlog"] == main.app.state.settings.SERVER_BACKLOG
+    assert kwargs["timeout_keep_alive"] == main.app.state.settings.SERVER_KEEPALIVE_TIMEOUT
+    assert kwargs["timeout_graceful_shutdown"] == main.app.state.settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT
+    assert kwargs["forwarded_allow_ips"] == main.app.state.settings.SERVER_TRUSTED_PROXIES
+
+
+def test_single_worker_serves_preloaded_app(monkeypatch):
+    """Test one worker serves the already imported app instead of importing it again"""
+    monkeypatch.setattr(main.app.state.settings, "SERVER_WORKERS", 1)
+
+    with patch.object(main.uvicorn, "run") as run:
+        main.run()
+
+    assert run.call_args.args == (main.app,)
@@ -0,0 +1,135 @@
+"""Test shortest-expected-job-first admission"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.summary import Summary
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.repositories.admission_controlled_summary_repository import (
+    AdmissionControlledSummaryRepository,
+)
+from app.shared.admission_controller import AdmissionController
+from app.shared.fair_queue import WeightedFairQueue
+from app.shared.service_time import ServiceTimeEstimator
+
+
+class TestShortestFirstQueue:
+    """Test WeightedFairQueue with shortest_first"""
+
+    def test_cheapest_first_within_a_flow(self):
+        """Test items of one flow leave by cost, ties by arrival"""
+        queue = WeightedFairQueue(shortest_first=True)
+        for item, cost in (("long", 9.0), ("short", 1.0), ("medium", 4.0), ("short2", 1.0)):
+            queue.push(item, "default", cost=cost)
+
+        assert [queue.pop() for _ in range(4)] == ["short", "short2", "medium", "long"]
+
+    def test_arrival_order_without_shortest_first(self):
+        """Test costs do not reorder a flow by default"""
+        queue = WeightedFairQueue()
+        queue.push("long", "default", cost=9.0)
+        queue.push("short", "default", cost=1.0)
+
+        assert queue.pop() == "long"
+
+    def test_aging_bounds_the_wait_of_a_long_item(self):
+        """Test a long item overtakes a stream of short ones once it has waited aging_seconds"""
+        now = 0.0
+        queue = WeightedFairQueue(aging_seconds=5.0, shortest_first=True, clock=lambda: now)
+        queue.push("long", "default", cost=100.0)
+        served = []
+        for index in range(10):
+            now = float(index)
+            queue.push(f"short{index}", "default", cost=1.0)
+            served.append(queue.pop())
+
+        assert served.index("long") == 5
+
+
+class TestServiceTimeEstimator:
+    """Test ServiceTimeEstimator"""
+
+    def test_default_ranking(self):
+        """Test an untrained estimator ranks long detailed summaries behind short concise ones"""
+        estimator = ServiceTimeEstimator()
+
+        short = estimator.estimate(20, "concise", 200)
+        long = estimator.estimate(25000, "detailed", 1000)
+
+        assert short < estimator.estimate(2000, "concise", 200) < long
+        assert estimator.estimate(25000, "detailed", 200) < long
+
+    def test_learns_from_observed_calls(self):
+        """Test estimates converge on a backend slower than the defaults assume"""
+        estimator = ServiceTimeEstimator()
+
+        def duration(input_tokens: int, output_tokens: int) -> float:
+            return 0.5 + 0.002 * input_tokens + 0.05 * output_tokens
+
+        for _ in range(100):
+            for input_tokens in (50, 500, 2000, 8000):
+                output_tokens = 20 + input_tokens // 20
+                estimator.observe(input_tokens, "concise", 1000, output_tokens, duration(input_tokens, output_tokens))
+
+        assert estimator.estimate(4000, "concise", 1000) == pytest.approx(duration(4000, 220), rel=0.15)
+        assert estimator.stats["samples"] == 400
+        assert estimator.stats["relative_error"] < 0.1
+
+    def test_capped_completions_do_not_train_output_length(self):
+        """Test completions cut at max_tokens leave the output length model unchanged"""
+        estimator = ServiceTimeEstimator()
+        before = estimator.output_tokens(5000, "detailed", 4000)
+
+        estimator.observe(5000, "detailed", 200, 200, 5.0)
+
+        assert estimator.output_tokens(5000, "detailed", 4000) == before
+
+    def test_unknown_completion_is_ignored(self):
+        """Test calls without token usage are not learned from"""
+        estimator = ServiceTimeEstimator()
+
+        estimator.observe(100, "concise", 200, None, 1.0)
+
+        assert estimator.stats["samples"] == 0
+
+    def test_invalid_learning_rate(self):
+        """Test the learning rate must keep the updates stable"""
+        with pytest.raises(ValueError):
+            ServiceTimeEstimator(learning_rate=2.0)
+
+
+class TestShortestFirstAdmission:
+    """Test AdmissionControlledSummaryRepository with a shortest-first controller"""
+
+    @pytest.mark.asyncio
+    async def test_short_request_admitted_before_queued_long_one(self):
+        """Test a short request waiting behind a long one gets the next slot, and finished calls are learned"""
+        release = asyncio.Event()
+        order = []
+
+        async def summarize(text: str, config: SummaryConfig) -> Summary:
+            order.append(len(text))
+            await release.wait()
+            return Summary(original_text=text, summary_text="요약", completion_tokens=10)
+
+        upstream = AsyncMock()
+        upstream.summarize_text = summarize
+        estimator = ServiceTimeEstimator()
+        repository = AdmissionControlledSummaryRepository(
+            upstream, AdmissionController(max_in_flight=1, max_queue=10, shortest_first=True), estimator
+        )
+        config = SummaryConfig(max_tokens=500)
+
+        holder = asyncio.create_task(repository.summarize_text("가" * 100, config))
+        await asyncio.sleep(0)
+        long = asyncio.create_task(repository.summarize_text("가" * 20000, config))
+        await asyncio.sleep(0)
+        short = asyncio.create_task(repository.summarize_text("가" * 50, config))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, long, short)
+
+        assert order == [100, 50, 20000]
+        assert estimator.stats["samples"] == 3
@@ -0,0 +1,111 @@
+"""Test in-flight request coalescing"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.entities.summary import Summary
+from app.domain.services.summary_service import SummaryService
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.main import create_app
+from app.shared.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test one execution serves every concurrent caller"""
+        group = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+
+        assert calls == 1
+        assert [result for result, _ in results] == ["result"] * 5
+        assert [shared for _, shared in results].count(False) == 1
+        assert group.stats == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_exceptions_reach_every_caller(self):
+        """Test a failed call fails all waiters and is not remembered"""
+        group = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(group.do("key", fail), group.do("key", fail), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert group.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_call(self):
+        """Test followers still get the result when the first caller is cancelled"""
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        leader = asyncio.create_task(group.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("result", True)
+
+
+class TestSummaryServiceCoalescing:
+    """Test SummaryService request coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesce(self, mock_summary_repository, sample_text):
+        """Test identical concurrent requests make one upstream call with distinct ids"""
+
+        async def summarize(text, config):
+            await asyncio.sleep(0.01)
+            return Summary(id="upstream-id", original_text=text, summary_text="요약 결과입니다.")
+
+        mock_summary_repository.summarize_text.side_effect = summarize
+        group = SingleFlight()
+        services = [SummaryService(mock_summary_repository, single_flight=group) for _ in range(3)]
+
+        summaries = await asyncio.gather(*(service.summarize_text(sample_text) for service in services))
+
+        assert mock_summary_repository.summarize_text.call_count == 1
+        assert len({summary.id for summary in summaries}) == 3
+        assert group.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_different_configs_do_not_coalesce(self, mock_summary_repository, sample_summary, sample_text):
+        """Test requests with different configs run separately"""
+        mock_summary_repository.summarize_text.return_value = sample_summary
+        service = SummaryService(mock_summary_repository)
+
+        await asyncio.gather(
+            service.summarize_text(sample_text, SummaryConfig(language="english")),
+            service.summarize_text(sample_text, SummaryConfig(language="japanese")),
+        )
+
+        assert mock_summary_repository.summarize_text.call_count == 2
+
+
+def test_stats_endpoint():
+    """Test coalescing counters are exposed"""
+    client = TestClient(create_app())
+
+    response = client.get("/api/v1/stats")
+
+    assert response.status_code == 200
+    assert response.json()["single_flight"] == {"executed": 0, "coalesced": 0, "in_flight": 0}
@@ -0,0 +1,84 @@
+"""Test the slim response projection and response compression"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+SHORT_TEXT = "슬림 응답 테스트용 텍스트입니다."
+LONG_TEXT = "압축 테스트용으로 충분히 긴 원문 텍스트입니다. " * 100
+
+
+@pytest.fixture
+def test_client(tmp_path, monkeypatch):
+    """Application with a mocked LLM"""
+    monkeypatch.setenv("SUMMARY_STORE_SQLITE_PATH", str(tmp_path / "summaries.sqlite3"))
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="짧은 요약"))
+        yield TestClient(create_app())
+
+
+def test_full_view_is_default(test_client):
+    """Test the original text is echoed unless the slim view is requested"""
+    response = test_client.post("/api/v1/summary/", json={"text": SHORT_TEXT})
+
+    assert response.status_code == 200
+    assert response.json()["original_text"] == SHORT_TEXT
+
+
+@pytest.mark.parametrize(
+    ("params", "headers"),
+    [({"view": "slim"}, {}), ({}, {"Prefer": "return=minimal"})],
+)
+def test_slim_view_omits_original_text(test_client, params, headers):
+    """Test the slim view keeps the summary and its stats only"""
+    response = test_client.post("/api/v1/summary/", json={"text": SHORT_TEXT}, params=params, headers=headers)
+
+    body = response.json()
+    assert response.status_code == 200
+    assert "original_text" not in body
+    assert body["summary_text"] == "짧은 요약"
+    assert body["original_length"] == len(SHORT_TEXT)
+    assert "X-Cache" in response.headers
+
+
+def test_schema_allows_slim_view(test_client):
+    """Test the documented summary schema does not require the text the slim view omits"""
+    schema = test_client.get("/openapi.json").json()["components"]["schemas"]["SummaryResponse"]
+
+    assert "original_text" in schema["properties"]
+    assert "original_text" not in schema["required"]
+
+
+def test_slim_view_for_batch_and_lookup(test_client):
+    """Test the slim view applies to batch results and stored summaries"""
+    batch = test_client.post(
+        "/api/v1/summary/batch", json={"items": [{"text": SHORT_TEXT}, {"text": LONG_TEXT}]}, params={"view": "slim"}
+    ).json()
+    summary_id = batch["items"][0]["result"]["id"]
+
+    stored = test_client.get(f"/api/v1/summary/{summary_id}", params={"view": "slim"}).json()
+
+    assert all("original_text" not in item["result"] for item in batch["items"])
+    assert "original_text" not in stored
+    assert stored["summary_text"] == "짧은 요약"
+
+
+def test_invalid_view(test_client):
+    """Test unknown views are rejected"""
+    response = test_client.post("/api/v1/summary/", json={"text": SHORT_TEXT}, params={"view": "tiny"})
+
+    assert response.status_code == 422
+
+
+def test_small_bodies_are_not_gzipped(test_client):
+    """Test bodies under the minimum size are sent uncompressed and large ones compressed"""
+    headers = {"Accept-Encoding": "gzip"}
+
+    small = test_client.post("/api/v1/summary/", json={"text": LONG_TEXT}, params={"view": "slim"}, headers=headers)
+    large = test_client.post("/api/v1/summary/", json={"text": LONG_TEXT}, headers=headers)
+
+    assert "content-encoding" not in small.headers
+    assert large.headers["content-encoding"] == "gzip"
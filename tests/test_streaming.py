@@ -0,0 +1,150 @@
+"""Test streaming summarization"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.entities.summary import SummaryChunk
+from app.domain.services.summary_service import SummaryService
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.cache.in_memory_summary_cache import InMemorySummaryCache
+from app.infrastructure.repositories.cached_summary_repository import CachedSummaryRepository
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+from app.main import create_app
+
+TOKENS = ["모킹된 ", "스트리밍 ", "요약입니다."]
+
+
+def _astream(*args, **kwargs):
+    async def generate():
+        for token in TOKENS:
+            yield Mock(content=token)
+
+    return generate()
+
+
+@pytest.fixture
+def mock_streaming_llm():
+    """Patch ChatOpenAI with a handle whose astream yields TOKENS"""
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        mock_llm_instance = Mock()
+        mock_llm_instance.astream = Mock(side_effect=_astream)
+        mock_llm_class.return_value = mock_llm_instance
+        yield mock_llm_instance
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestRepositoryStreaming:
+    """Test repository streaming"""
+
+    @pytest.mark.asyncio
+    async def test_lmstudio_stream(self, lmstudio_config, mock_streaming_llm, sample_text):
+        """Test tokens are yielded before the final summary"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        chunks = [chunk async for chunk in repository.summarize_text_stream(sample_text, SummaryConfig())]
+
+        assert [chunk.text for chunk in chunks[:-1]] == TOKENS
+        assert chunks[-1].summary.summary_text == "".join(TOKENS).strip()
+
+    @pytest.mark.asyncio
+    async def test_default_stream_yields_whole_summary(self, mock_summary_repository, sample_summary, sample_text):
+        """Test repositories without native streaming fall back to one chunk"""
+        from app.domain.repositories.summary_repository import SummaryRepository
+
+        mock_summary_repository.summarize_text.return_value = sample_summary
+
+        chunks = [
+            chunk
+            async for chunk in SummaryRepository.summarize_text_stream(
+                mock_summary_repository, sample_text, SummaryConfig()
+            )
+        ]
+
+        assert chunks == [SummaryChunk(text=sample_summary.summary_text), SummaryChunk(summary=sample_summary)]
+
+    @pytest.mark.asyncio
+    async def test_cached_stream_replays_hit(self, lmstudio_config, mock_streaming_llm, sample_text):
+        """Test a streamed miss is cached and replayed on the next stream"""
+        repository = CachedSummaryRepository(
+            LMStudioSummaryRepository(lmstudio_config), InMemorySummaryCache(max_entries=10)
+        )
+        config = SummaryConfig(temperature=0.0)
+
+        first = [chunk async for chunk in repository.summarize_text_stream(sample_text, config)]
+        second = [chunk async for chunk in repository.summarize_text_stream(sample_text, config)]
+
+        assert first[-1].summary.cache_status == "miss"
+        assert second[-1].summary.cache_status == "hit"
+        assert second[0].text == first[-1].summary.summary_text
+        assert mock_streaming_llm.astream.call_count == 1
+
+
+class TestServiceStreaming:
+    """Test SummaryService streaming"""
+
+    def test_validates_before_streaming(self, mock_summary_repository):
+        """Test invalid text fails before a stream is returned"""
+        service = SummaryService(mock_summary_repository)
+
+        with pytest.raises(ValueError, match="Text is too short"):
+            service.summarize_text_stream("짧음")
+
+
+class TestStreamEndpoint:
+    """Test POST /summary/stream"""
+
+    def test_streams_sse_events(self, mock_streaming_llm):
+        """Test deltas are followed by summary metadata and the stream is not gzipped"""
+        client = TestClient(create_app())
+
+        response = client.post(
+            "/api/v1/summary/stream",
+            json={"text": "스트리밍 테스트용 텍스트입니다. 충분히 긴 텍스트입니다."},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers
+
+        events = _parse_sse(response.text)
+        assert [event for event, _ in events] == ["delta"] * len(TOKENS) + ["summary"]
+        assert [data["text"] for _, data in events[:-1]] == TOKENS
+        summary = events[-1][1]
+        assert summary["model_name"] == "qwen/qwen3-4b"
+        assert "compression_ratio" in summary
+        assert "original_text" not in summary
+
+    def test_validation_error_before_stream(self):
+        """Test service validation errors return 400 instead of a stream"""
+        client = TestClient(create_app())
+
+        response = client.post("/api/v1/summary/stream", json={"text": "          짧음"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error_code"] == "VALIDATION_ERROR"
+
+    def test_upstream_failure_emits_error_event(self):
+        """Test upstream failures mid-stream are reported as an error event"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.astream = Mock(side_effect=ConnectionError("refused"))
+            client = TestClient(create_app())
+
+            response = client.post(
+                "/api/v1/summary/stream",
+                json={"text": "스트리밍 테스트용 텍스트입니다. 충분히 긴 텍스트입니다."},
+            )
+
+        events = _parse_sse(response.text)
+        assert events[-1][0] == "error"
+        assert events[-1][1]["error_code"] == "SUMMARIZATION_ERROR"
@@ -0,0 +1,164 @@
+"""Test summary result cache"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.entities.summary import Summary
+from app.domain.value_objects.content_key import content_hash, summary_key
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.cache.in_memory_summary_cache import InMemorySummaryCache
+from app.infrastructure.cache.sqlite_summary_cache import SQLiteSummaryCache
+from app.infrastructure.external_services.prompt_registry import DEFAULT_TEMPLATES, PromptRegistry
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+from app.infrastructure.repositories.cached_summary_repository import CachedSummaryRepository
+from app.main import create_app
+
+
+class TestContentKey:
+    """Test content-addressed keys"""
+
+    def test_normalization(self):
+        """Test cosmetic differences produce the same hash"""
+        assert content_hash("  요약할 텍스트 \r\n두 번째 줄\t\n") == content_hash("요약할 텍스트\n두 번째 줄")
+        assert content_hash("요약할 텍스트") != content_hash("다른 텍스트")
+
+    def test_config_is_part_of_key(self, sample_text):
+        """Test every config field changes the key"""
+        base = summary_key(sample_text, SummaryConfig())
+
+        assert base == summary_key(sample_text, SummaryConfig())
+        assert base != summary_key(sample_text, SummaryConfig(max_tokens=200))
+        assert base != summary_key(sample_text, SummaryConfig(language="english"))
+
+
+class TestCachedSummaryRepository:
+    """Test CachedSummaryRepository"""
+
+    @pytest.fixture
+    def repository(self, mock_summary_repository, sample_summary):
+        """Cached repository over a mock repository"""
+        mock_summary_repository.summarize_text.return_value = sample_summary
+        return CachedSummaryRepository(mock_summary_repository, InMemorySummaryCache(max_entries=10))
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self, repository, mock_summary_repository, sample_text):
+        """Test deterministic requests are served from cache"""
+        config = SummaryConfig(temperature=0.0)
+
+        first = await repository.summarize_text(sample_text, config)
+        second = await repository.summarize_text(sample_text, config)
+
+        assert first.cache_status == "miss"
+        assert second.cache_status == "hit"
+        assert second.summary_text == first.summary_text
+        assert second.original_text == sample_text
+        assert second.id != first.id
+        mock_summary_repository.summarize_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_nondeterministic_bypass(self, repository, mock_summary_repository, sample_text):
+        """Test temperature > 0 skips the cache by default"""
+        config = SummaryConfig(temperature=0.7)
+
+        first = await repository.summarize_text(sample_text, config)
+        second = await repository.summarize_text(sample_text, config)
+
+        assert first.cache_status == second.cache_status == "bypass"
+        assert mock_summary_repository.summarize_text.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nondeterministic_opt_in(self, mock_summary_repository, sample_summary, sample_text):
+        """Test temperature > 0 is cached when allowed"""
+        mock_summary_repository.summarize_text.return_value = sample_summary
+        repository = CachedSummaryRepository(
+            mock_summary_repository, InMemorySummaryCache(max_entries=10), cache_nondeterministic=True
+        )
+        config = SummaryConfig(temperature=0.7)
+
+        await repository.summarize_text(sample_text, config)
+        second = await repository.summarize_text(sample_text, config)
+
+        assert second.cache_status == "hit"
+
+    @pytest.mark.asyncio
+    async def test_prompt_version_is_part_of_key(self, mock_summary_repository, sample_summary, sample_text, tmp_path):
+        """Test results generated with older prompt templates are not served after the version changes"""
+        mock_summary_repository.summarize_text.return_value = sample_summary
+        templates_path = tmp_path / "prompts.json"
+        templates_path.write_text(json.dumps({**DEFAULT_TEMPLATES, "version": "v2"}), encoding="utf-8")
+        cache = InMemorySummaryCache(max_entries=10)
+        budgeter = PromptBudgeter(TokenCounter())
+        config = SummaryConfig(temperature=0.0)
+
+        before = CachedSummaryRepository(mock_summary_repository, cache, prompt_registry=PromptRegistry(budgeter))
+        after = CachedSummaryRepository(
+            mock_summary_repository, cache, prompt_registry=PromptRegistry(budgeter, str(templates_path))
+        )
+        await before.summarize_text(sample_text, config)
+
+        assert (await after.summarize_text(sample_text, config)).cache_status == "miss"
+        assert (await before.summarize_text(sample_text, config)).cache_status == "hit"
+
+
+class TestSQLiteSummaryCache:
+    """Test SQLiteSummaryCache"""
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, tmp_path, sample_summary):
+        """Test summaries persist across cache instances"""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SQLiteSummaryCache(path)
+        await cache.set("key", sample_summary)
+        await cache.close()
+
+        reopened = SQLiteSummaryCache(path)
+        restored = await reopened.get("key")
+        await reopened.close()
+
+        assert isinstance(restored, Summary)
+        assert restored.summary_text == sample_summary.summary_text
+        assert restored.created_at == sample_summary.created_at
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self, tmp_path, sample_summary):
+        """Test expired rows are not returned"""
+        cache = SQLiteSummaryCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+        await cache.set("key", sample_summary)
+
+        assert await cache.get("key") is None
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_reads_through(self, tmp_path, sample_summary):
+        """Test the memory tier falls back to the persistent backend"""
+        backend = SQLiteSummaryCache(str(tmp_path / "cache.sqlite3"))
+        await backend.set("key", sample_summary)
+
+        cache = InMemorySummaryCache(max_entries=10, backend=backend)
+        restored = await cache.get("key")
+        await cache.close()
+
+        assert restored.summary_text == sample_summary.summary_text
+        assert cache.stats["size"] == 1
+
+
+def test_cache_header():
+    """Test cache status is reported in the X-Cache header"""
+    with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+        mock_llm_instance = Mock()
+        mock_llm_instance.ainvoke = AsyncMock(return_value=Mock(content="모킹된 요약 결과입니다."))
+        mock_llm_class.return_value = mock_llm_instance
+
+        client = TestClient(create_app())
+        payload = {"text": "캐시 테스트용 텍스트입니다. 같은 요청이 반복됩니다.", "temperature": 0.0}
+
+        first = client.post("/api/v1/summary/", json=payload)
+        second = client.post("/api/v1/summary/", json=payload)
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json()["cache_status"] == "hit"
+    mock_llm_instance.ainvoke.assert_called_once()
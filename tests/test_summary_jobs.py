@@ -0,0 +1,348 @@
+"""Test background summary jobs"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.dtos.responses.summary_response import SummaryResponse
+from app.application.services.summary_job_worker_pool import SummaryJobWorkerPool
+from app.domain.entities.summary_job import SummaryJob
+from app.domain.exceptions import ServiceOverloadedError
+from app.infrastructure.external_services.webhook_notifier import WebhookNotifier
+from app.infrastructure.jobs.sqlite_summary_job_queue import SQLiteSummaryJobQueue
+from app.main import create_app
+
+REQUEST = {"text": "백그라운드 작업 테스트용 텍스트입니다. 충분히 깁니다.", "summary_type": "detailed"}
+
+
+def _job(
+    job_id: str,
+    dedup_key: str | None = None,
+    priority: int = 0,
+    max_attempts: int = 3,
+    callback_urls: list[str] | None = None,
+) -> SummaryJob:
+    return SummaryJob(
+        id=job_id,
+        request=REQUEST,
+        dedup_key=dedup_key or job_id,
+        priority=priority,
+        max_attempts=max_attempts,
+        callback_urls=callback_urls or [],
+    )
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    """Job queue in a temporary database"""
+    return SQLiteSummaryJobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+class TestSQLiteSummaryJobQueue:
+    """Test SQLiteSummaryJobQueue"""
+
+    @pytest.mark.asyncio
+    async def test_claims_by_priority_then_age(self, job_queue):
+        """Test higher priority jobs run first and equal priorities run in submission order"""
+        for job_id, priority in (("low", 0), ("high", 5), ("low-2", 0)):
+            await job_queue.enqueue(_job(job_id, priority=priority))
+
+        claimed = [(await job_queue.claim(60)).id for _ in range(3)]
+
+        assert claimed == ["high", "low", "low-2"]
+        assert await job_queue.claim(60) is None
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_by_content_key(self, job_queue):
+        """Test an identical request returns the existing job unless it failed"""
+        first = await job_queue.enqueue(_job("first", dedup_key="same"))
+        second = await job_queue.enqueue(_job("second", dedup_key="same"))
+
+        assert second.id == first.id
+        assert job_queue.stats["deduplicated"] == 1
+
+        await job_queue.claim(60)
+        await job_queue.fail("first", {"error": "boom", "error_code": "SUMMARIZATION_ERROR"})
+        third = await job_queue.enqueue(_job("third", dedup_key="same"))
+
+        assert third.id == "third"
+
+    @pytest.mark.asyncio
+    async def test_deduplicated_callbacks_are_attached(self, job_queue):
+        """Test every submitter's callback is kept on the shared job and returned when it finishes"""
+        await job_queue.enqueue(_job("first", dedup_key="same", callback_urls=["http://a.example/hook"]))
+        await job_queue.claim(60)
+        second = await job_queue.enqueue(_job("second", dedup_key="same", callback_urls=["http://b.example/hook"]))
+
+        finished = await job_queue.complete("first", {"summary_text": "요약"})
+
+        assert second.callback_urls == ["http://a.example/hook", "http://b.example/hook"]
+        assert finished.status == "succeeded"
+        assert finished.callback_urls == ["http://a.example/hook", "http://b.example/hook"]
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_delay(self, job_queue):
+        """Test a retried job is not claimable before its delay elapses"""
+        await job_queue.enqueue(_job("job"))
+        job = await job_queue.claim(60)
+
+        await job_queue.retry(job.id, {"error": "busy", "error_code": "SERVICE_OVERLOADED"}, delay=60)
+
+        assert await job_queue.claim(60) is None
+        stored = await job_queue.get("job")
+        assert stored.status == "queued"
+        assert stored.attempts == 1
+        assert stored.error["error_code"] == "SERVICE_OVERLOADED"
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, job_queue):
+        """Test a job whose worker vanished is claimed again"""
+        await job_queue.enqueue(_job("job"))
+        await job_queue.claim(lease_seconds=0)
+
+        job = await job_queue.claim(60)
+
+        assert job.id == "job"
+        assert job.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_survives_reopen(self, tmp_path):
+        """Test jobs persist across queue instances"""
+        path = str(tmp_path / "jobs.sqlite3")
+        queue = SQLiteSummaryJobQueue(path)
+        await queue.enqueue(_job("job"))
+        await queue.close()
+
+        reopened = SQLiteSummaryJobQueue(path)
+        job = await reopened.claim(60)
+        await reopened.close()
+
+        assert job.id == "job"
+        assert job.request == REQUEST
+
+
+class TestSummaryJobWorkerPool:
+    """Test SummaryJobWorkerPool"""
+
+    @pytest.fixture
+    def use_case(self, sample_summary):
+        """Summarize use case returning a fixed summary"""
+        use_case = Mock()
+        use_case.execute = AsyncMock(return_value=SummaryResponse.from_domain_entity(sample_summary))
+        return use_case
+
+    @pytest.mark.asyncio
+    async def test_completes_job_and_calls_webhook(self, job_queue, use_case):
+        """Test a successful job stores its result and is delivered to the callback URL"""
+        notify = AsyncMock(return_value=True)
+        pool = SummaryJobWorkerPool(job_queue, use_case, notify=notify)
+        await job_queue.enqueue(_job("job", callback_urls=["http://client.example/hook"]))
+
+        assert await pool.run_once()
+        await asyncio.sleep(0)
+
+        stored = await job_queue.get("job")
+        assert stored.status == "succeeded"
+        assert stored.result["summary_text"] == "요약된 텍스트입니다."
+        notify.assert_awaited_once()
+        url, payload = notify.await_args.args
+        assert url == "http://client.example/hook"
+        assert payload["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, job_queue, use_case):
+        """Test a failed attempt is retried no sooner than the overload hint"""
+        use_case.execute.side_effect = ServiceOverloadedError("busy", retry_after=30)
+        pool = SummaryJobWorkerPool(job_queue, use_case, retry_backoff=0.01)
+        await job_queue.enqueue(_job("job"))
+        job_queue.retry = AsyncMock(wraps=job_queue.retry)
+
+        await pool.run_once()
+
+        job_id, error, delay = job_queue.retry.await_args.args
+        assert job_id == "job"
+        assert error["error_code"] == "SERVICE_OVERLOADED"
+        assert delay >= 30
+
+    @pytest.mark.asyncio
+    async def test_fails_after_max_attempts(self, job_queue, use_case):
+        """Test the last failed attempt marks the job failed"""
+        use_case.execute.side_effect = RuntimeError("Failed to summarize text")
+        pool = SummaryJobWorkerPool(job_queue, use_case, retry_backoff=0)
+        await job_queue.enqueue(_job("job", max_attempts=2))
+
+        while await pool.run_once():
+            pass
+
+        stored = await job_queue.get("job")
+        assert stored.status == "failed"
+        assert stored.attempts == 2
+        assert stored.error["error_code"] == "SUMMARIZATION_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_invalid_request_fails_at_once(self, job_queue, use_case):
+        """Test validation errors are not retried"""
+        use_case.execute.side_effect = ValueError("Text is too long")
+        pool = SummaryJobWorkerPool(job_queue, use_case)
+        await job_queue.enqueue(_job("job"))
+
+        await pool.run_once()
+
+        stored = await job_queue.get("job")
+        assert stored.status == "failed"
+        assert stored.attempts == 1
+
+
+class TestSummaryJobApi:
+    """Test the job endpoints"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Application with a temporary job database and a mocked LLM"""
+        monkeypatch.setenv("JOBS_SQLITE_PATH", str(tmp_path / "jobs.sqlite3"))
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="백그라운드 요약"))
+            app = create_app()
+            yield app, TestClient(app)
+
+    def test_submit_and_poll(self, client):
+        """Test a job is accepted at once and its result is served after a worker ran it"""
+        app, test_client = client
+
+        response = test_client.post("/api/v1/summary/jobs", json={**REQUEST, "priority": 3})
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert job["priority"] == 3
+
+        pool = app.state.container.summary_job_worker_pool()
+        assert asyncio.run(pool.run_once())
+
+        response = test_client.get(f"/api/v1/summary/jobs/{job['id']}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+        assert response.json()["result"]["summary_text"] == "백그라운드 요약"
+
+    def test_resubmission_returns_same_job(self, client):
+        """Test identical requests share one job"""
+        _, test_client = client
+
+        first = test_client.post("/api/v1/summary/jobs", json=REQUEST).json()
+        second = test_client.post("/api/v1/summary/jobs", json=REQUEST).json()
+
+        assert second["id"] == first["id"]
+
+    def test_unknown_job(self, client):
+        """Test unknown job ids return 404"""
+        _, test_client = client
+
+        response = test_client.get("/api/v1/summary/jobs/does-not-exist")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error_code"] == "NOT_FOUND"
+
+    def test_rejects_non_http_callback(self, client):
+        """Test callback URLs must be http(s)"""
+        _, test_client = client
+
+        response = test_client.post("/api/v1/summary/jobs", json={**REQUEST, "callback_url": "file:///etc/passwd"})
+
+        assert response.status_code == 422
+
+    def test_dedup_key_covers_strategy_and_budgets(self, client):
+        """Test requests differing only in strategy or budget get their own jobs"""
+        _, test_client = client
+
+        ids = {
+            test_client.post("/api/v1/summary/jobs", json={**REQUEST, **options}).json()["id"]
+            for options in ({}, {"strategy": "hierarchical"}, {"token_budget": 500}, {"time_budget": 30})
+        }
+
+        assert len(ids) == 4
+
+    def test_resubmission_of_finished_job_notifies_its_callback(self, client):
+        """Test a submitter deduplicated onto a finished job still gets its webhook"""
+        app, test_client = client
+        pool = app.state.container.summary_job_worker_pool()
+        test_client.post("/api/v1/summary/jobs", json=REQUEST)
+        asyncio.run(pool.run_once())
+
+        with patch.object(pool, "deliver") as deliver:
+            job = test_client.post(
+                "/api/v1/summary/jobs", json={**REQUEST, "callback_url": "https://client.example/hook"}
+            ).json()
+
+        assert job["status"] == "succeeded"
+        finished, callback_urls = deliver.call_args.args
+        assert finished.id == job["id"]
+        assert callback_urls == ["https://client.example/hook"]
+
+    @pytest.mark.parametrize(
+        "callback_url",
+        ["http://127.0.0.1:8000/hook", "http://169.254.169.254/latest", "http://[::1]/", "http://localhost/"],
+    )
+    def test_rejects_private_callback(self, client, callback_url):
+        """Test callbacks into the service's own network are refused"""
+        _, test_client = client
+
+        response = test_client.post("/api/v1/summary/jobs", json={**REQUEST, "callback_url": callback_url})
+
+        assert response.status_code == 400
+
+
+class TestWebhookNotifier:
+    """Test callback URL restrictions"""
+
+    def test_allowed_hosts(self):
+        """Test an allowlist admits its hosts and their subdomains only"""
+        notifier = WebhookNotifier(allowed_hosts=["client.example"])
+
+        notifier.check_url("https://client.example/hook")
+        notifier.check_url("https://hooks.client.example/hook")
+        with pytest.raises(ValueError):
+            notifier.check_url("https://client.example.evil.test/hook")
+
+    def test_allow_private(self):
+        """Test private addresses can be allowed for private deployments"""
+        WebhookNotifier(allow_private=True).check_url("http://10.0.0.5/hook")
+
+    @pytest.mark.asyncio
+    async def test_refuses_host_resolving_to_private_address(self):
+        """Test a public-looking name that resolves into the private network is not called"""
+        notifier = WebhookNotifier()
+        resolved = [(2, 1, 6, "", ("10.0.0.5", 80))]
+
+        with patch("socket.getaddrinfo", return_value=resolved):
+            delivered = await notifier.notify("http://internal.client.example/hook", {})
+
+        assert not delivered
+        assert notifier.stats["refused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delivers_to_checked_address_when_name_rebinds(self):
+        """Test a name that resolves public on the check and private afterwards is still delivered to the public address"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+
+        notifier = WebhookNotifier()
+        notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        public = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        private = [(2, 1, 6, "", ("10.0.0.5", 443))]
+
+        with patch("socket.getaddrinfo", side_effect=[public, private, private]):
+            delivered = await notifier.notify("https://rebind.client.example:8443/hook", {"id": "job-1"})
+        await notifier.close()
+
+        assert delivered
+        assert len(requests) == 1
+        assert requests[0].url.host == "93.184.216.34"
+        assert requests[0].headers["Host"] == "rebind.client.example:8443"
+        assert requests[0].extensions["sni_hostname"] == "rebind.client.example"
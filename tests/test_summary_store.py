@@ -0,0 +1,191 @@
+"""Test summary persistence"""
+
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.entities.summary import Summary
+from app.domain.value_objects.content_key import content_hash
+from app.infrastructure.database.sqlite_summary_store import SQLiteSummaryStore
+from app.main import create_app
+
+
+def _summary(
+    summary_id: str, minutes: int = 0, text: str = "원문 텍스트", model_name: str = "qwen/qwen3-4b"
+) -> Summary:
+    return Summary(
+        id=summary_id,
+        original_text=text,
+        summary_text=f"{summary_id} 요약",
+        created_at=datetime(2025, 1, 1) + timedelta(minutes=minutes),
+        model_name=model_name,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Summary store in a temporary database"""
+    return SQLiteSummaryStore(str(tmp_path / "summaries.sqlite3"), batch_size=2)
+
+
+class TestSQLiteSummaryStore:
+    """Test SQLiteSummaryStore"""
+
+    @pytest.mark.asyncio
+    async def test_buffered_summary_is_readable(self, store):
+        """Test a summary can be fetched before it is written"""
+        await store.add(_summary("a"))
+
+        assert (await store.get("a")).summary_text == "a 요약"
+        assert store.stats["pending"] == 1
+        assert store.stats["written"] == 0
+        assert await store.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batches(self, store):
+        """Test buffered summaries are written batch_size at a time"""
+        for index in range(5):
+            await store.add(_summary(f"s{index}", minutes=index))
+
+        await store.flush()
+
+        assert store.stats["pending"] == 0
+        assert store.stats["written"] == 5
+        assert store.stats["batches"] == 3
+        stored = await store.get("s3")
+        assert stored.created_at == datetime(2025, 1, 1, 0, 3)
+        assert stored.summary_length == len("s3 요약")
+
+    @pytest.mark.asyncio
+    async def test_list_pages_newest_first(self, store):
+        """Test listing includes buffered summaries, orders by creation and counts all matches"""
+        for index in range(5):
+            await store.add(_summary(f"s{index}", minutes=index))
+
+        page, total = await store.list_summaries(limit=2, offset=1)
+
+        assert [summary.id for summary in page] == ["s3", "s2"]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_list_filters(self, store):
+        """Test filtering by model and by text hash"""
+        await store.add(_summary("a", text="첫 번째 텍스트", model_name="qwen/qwen3-4b"))
+        await store.add(_summary("b", minutes=1, text="두 번째 텍스트", model_name="qwen/qwen3-8b"))
+        await store.add(_summary("c", minutes=2, text="첫 번째 텍스트 ", model_name="qwen/qwen3-8b"))
+
+        by_model, model_total = await store.list_summaries(limit=10, model_name="qwen/qwen3-8b")
+        by_text, text_total = await store.list_summaries(limit=10, content_hash=content_hash("첫 번째 텍스트"))
+
+        assert [summary.id for summary in by_model] == ["c", "b"]
+        assert model_total == 2
+        assert [summary.id for summary in by_text] == ["c", "a"]
+        assert text_total == 2
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_summaries(self, tmp_path):
+        """Test closing flushes the buffer so summaries survive a restart"""
+        path = str(tmp_path / "summaries.sqlite3")
+        store = SQLiteSummaryStore(path)
+        await store.start()
+        await store.add(_summary("a"))
+        await store.close()
+
+        reopened = SQLiteSummaryStore(path)
+        stored = await reopened.get("a")
+        await reopened.close()
+
+        assert stored.summary_text == "a 요약"
+
+    @pytest.mark.asyncio
+    async def test_truncated_flag_round_trips(self, store):
+        """Test a truncated summary reads back truncated once written, and others do not"""
+        await store.add(replace(_summary("a"), truncated=True))
+        await store.add(_summary("b"))
+
+        await store.flush()
+
+        assert (await store.get("a")).truncated
+        assert not (await store.get("b")).truncated
+
+    @pytest.mark.asyncio
+    async def test_migrates_database_without_truncated_column(self, tmp_path):
+        """Test a database created before the truncated column is upgraded in place"""
+        path = tmp_path / "summaries.sqlite3"
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE summaries (id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, original_text TEXT NOT NULL, "
+                "summary_text TEXT NOT NULL, created_at REAL NOT NULL, model_name TEXT NOT NULL, "
+                "summary_length INTEGER, prompt_tokens INTEGER, completion_tokens INTEGER)"
+            )
+            connection.execute(
+                "INSERT INTO summaries VALUES ('old', '', '원문', '요약', 0, 'qwen/qwen3-4b', 2, NULL, NULL)"
+            )
+        connection.close()
+        store = SQLiteSummaryStore(str(path))
+
+        await store.add(replace(_summary("new"), truncated=True))
+        await store.close()
+
+        reopened = SQLiteSummaryStore(str(path))
+        old, new = await reopened.get("old"), await reopened.get("new")
+        await reopened.close()
+        assert (old.truncated, new.truncated) == (False, True)
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_oldest(self, tmp_path):
+        """Test a full buffer sheds the oldest summary instead of blocking"""
+        store = SQLiteSummaryStore(str(tmp_path / "summaries.sqlite3"), max_pending=2)
+
+        for summary_id in ("a", "b", "c"):
+            await store.add(_summary(summary_id))
+
+        assert await store.get("a") is None
+        assert await store.get("c") is not None
+        assert store.stats["dropped"] == 1
+
+
+class TestSummaryStoreApi:
+    """Test the stored summary endpoints"""
+
+    @pytest.fixture
+    def test_client(self, tmp_path, monkeypatch):
+        """Application with a temporary summary database and a mocked LLM"""
+        monkeypatch.setenv("SUMMARY_STORE_SQLITE_PATH", str(tmp_path / "summaries.sqlite3"))
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=Mock(content="저장된 요약"))
+            yield TestClient(create_app())
+
+    def test_summary_can_be_fetched_by_id(self, test_client):
+        """Test a generated summary is served again without calling the model"""
+        created = test_client.post("/api/v1/summary/", json={"text": "저장소 테스트용 텍스트입니다. 충분히 깁니다."})
+        assert created.status_code == 200
+
+        response = test_client.get(f"/api/v1/summary/{created.json()['id']}")
+
+        assert response.status_code == 200
+        assert response.json()["summary_text"] == "저장된 요약"
+        assert response.json()["original_text"] == "저장소 테스트용 텍스트입니다. 충분히 깁니다."
+
+    def test_list(self, test_client):
+        """Test listing returns the page and total"""
+        for text in ("첫 번째 저장소 테스트 텍스트", "두 번째 저장소 테스트 텍스트"):
+            test_client.post("/api/v1/summary/", json={"text": text})
+
+        response = test_client.get("/api/v1/summary/", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+        assert len(response.json()["items"]) == 1
+
+    def test_unknown_summary(self, test_client):
+        """Test unknown ids return 404 while fixed routes still resolve"""
+        response = test_client.get("/api/v1/summary/does-not-exist")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error_code"] == "NOT_FOUND"
+        assert test_client.get("/api/v1/summary/health").json()["detail"]["status"] == "unhealthy"
@@ -0,0 +1,169 @@
+"""Test token counting and context window budgeting"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.application.dtos.responses.summary_response import SummaryResponse
+from app.domain.services.text_chunker import estimate_tokens
+from app.domain.value_objects.summary_config import SummaryConfig
+from app.infrastructure.external_services.token_budget import PromptBudgeter, TokenCounter
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+KOREAN_TEXT = "한국어 텍스트는 글자 수보다 토큰 수가 빠르게 늘어납니다. " * 100
+
+
+class _FakeEncoding:
+    """One token per character"""
+
+    def encode(self, text, disallowed_special=()):
+        return [ord(character) for character in text]
+
+    def decode(self, tokens):
+        return "".join(chr(token) for token in tokens)
+
+
+class TestTokenCounter:
+    """Test TokenCounter"""
+
+    def test_estimate_without_encoding(self):
+        """Test the character estimate is used when no encoding is configured"""
+        counter = TokenCounter()
+
+        assert not counter.load()
+        assert counter.backend == "estimate"
+        assert counter.count(KOREAN_TEXT) == estimate_tokens(KOREAN_TEXT)
+
+    def test_falls_back_when_encoding_unavailable(self):
+        """Test a failing tokenizer load keeps the estimate"""
+        counter = TokenCounter("cl100k_base")
+
+        with patch("tiktoken.get_encoding", side_effect=OSError("offline")):
+            assert not counter.load()
+
+        assert counter.backend == "estimate"
+
+    def test_uses_loaded_encoding(self):
+        """Test counts and truncation use the cached encoding once loaded"""
+        counter = TokenCounter("fake")
+
+        with patch("tiktoken.get_encoding", return_value=_FakeEncoding()) as get_encoding:
+            assert counter.load()
+            assert counter.load()
+
+        get_encoding.assert_called_once_with("fake")
+        assert counter.backend == "tiktoken:fake"
+        assert counter.count("abcd") == 4
+        assert counter.truncate("abcdef", 3) == "abc"
+
+    def test_truncate_with_estimate(self):
+        """Test estimate truncation returns the longest fitting prefix"""
+        counter = TokenCounter()
+
+        truncated = counter.truncate(KOREAN_TEXT, 100)
+
+        assert KOREAN_TEXT.startswith(truncated)
+        assert counter.count(truncated) <= 100
+        assert counter.count(KOREAN_TEXT[: len(truncated) + 1]) > 100
+
+
+class TestPromptBudgeter:
+    """Test PromptBudgeter"""
+
+    def test_caps_completion_to_remaining_context(self):
+        """Test max_tokens is lowered to what is left after the prompt"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=4096, min_completion_tokens=256)
+
+        budget = budgeter.fit("시스템", "요약: ", KOREAN_TEXT[:3000], max_tokens=2000)
+
+        assert not budget.truncated
+        assert budget.max_tokens < 2000
+        assert budget.max_tokens == 4096 - budget.prompt_tokens
+
+    def test_keeps_requested_max_tokens_when_it_fits(self):
+        """Test short prompts keep the requested completion length"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=8192)
+
+        assert budgeter.fit("시스템", "요약: ", "짧은 텍스트입니다.", max_tokens=1000).max_tokens == 1000
+
+    def test_reject_policy(self):
+        """Test oversized prompts are rejected"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=1024, overflow_policy="reject")
+
+        with pytest.raises(ValueError, match="context window"):
+            budgeter.fit("시스템", "요약: ", KOREAN_TEXT, max_tokens=1000)
+
+    def test_truncate_policy(self):
+        """Test oversized prompts are trimmed, leaving the minimum completion room"""
+        budgeter = PromptBudgeter(
+            TokenCounter(), context_window=1024, min_completion_tokens=256, overflow_policy="truncate"
+        )
+
+        budget = budgeter.fit("시스템", "요약: ", KOREAN_TEXT, max_tokens=1000)
+
+        assert budget.truncated
+        assert KOREAN_TEXT.startswith(budget.text)
+        assert budget.max_tokens >= 256
+        assert budget.prompt_tokens + budget.max_tokens <= 1024
+
+    def test_invalid_policy(self):
+        """Test unknown overflow policies are rejected"""
+        with pytest.raises(ValueError):
+            PromptBudgeter(TokenCounter(), overflow_policy="ignore")
+
+
+class TestRepositoryBudgeting:
+    """Test budgeting in LMStudioSummaryRepository"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        """Patch ChatOpenAI with a handle reporting server usage"""
+        with patch("app.infrastructure.repositories.lmstudio_summary_repository.ChatOpenAI") as mock_llm_class:
+            response = Mock(content="요약 결과입니다.", usage_metadata={"input_tokens": 1234, "output_tokens": 56})
+            mock_llm_class.return_value.ainvoke = AsyncMock(return_value=response)
+            yield mock_llm_class.return_value
+
+    @pytest.mark.asyncio
+    async def test_reports_server_usage(self, lmstudio_config, mock_llm, sample_text):
+        """Test token counts come from the server when reported"""
+        repository = LMStudioSummaryRepository(lmstudio_config)
+
+        summary = await repository.summarize_text(sample_text, SummaryConfig())
+
+        assert (summary.prompt_tokens, summary.completion_tokens) == (1234, 56)
+        response = SummaryResponse.from_domain_entity(summary)
+        assert (response.prompt_tokens, response.completion_tokens) == (1234, 56)
+
+    @pytest.mark.asyncio
+    async def test_caps_max_tokens_per_call(self, lmstudio_config, mock_llm):
+        """Test a long prompt lowers max_tokens for that call only"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=4096)
+        repository = LMStudioSummaryRepository(lmstudio_config, prompt_budgeter=budgeter)
+
+        await repository.summarize_text(KOREAN_TEXT[:3000], SummaryConfig(max_tokens=2000))
+
+        max_tokens = mock_llm.ainvoke.call_args.kwargs["max_tokens"]
+        assert 256 <= max_tokens < 2000
+
+    @pytest.mark.asyncio
+    async def test_truncated_input_is_reported(self, lmstudio_config, mock_llm, sample_text):
+        """Test a text cut to fit the context window yields a summary marked truncated"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=1024, overflow_policy="truncate")
+        repository = LMStudioSummaryRepository(lmstudio_config, prompt_budgeter=budgeter)
+
+        truncated = await repository.summarize_text(KOREAN_TEXT, SummaryConfig())
+        complete = await repository.summarize_text(sample_text, SummaryConfig())
+
+        assert SummaryResponse.from_domain_entity(truncated).truncated
+        assert not complete.truncated
+
+    @pytest.mark.asyncio
+    async def test_rejects_before_calling_model(self, lmstudio_config, mock_llm):
+        """Test rejected prompts surface as validation errors without an upstream call"""
+        budgeter = PromptBudgeter(TokenCounter(), context_window=1024)
+        repository = LMStudioSummaryRepository(lmstudio_config, prompt_budgeter=budgeter)
+
+        with pytest.raises(ValueError, match="context window"):
+            await repository.summarize_text(KOREAN_TEXT, SummaryConfig())
+
+        mock_llm.ainvoke.assert_not_called()
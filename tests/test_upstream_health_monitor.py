@@ -0,0 +1,168 @@
+"""Test cached upstream health probing"""
+
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from app.infrastructure.external_services.upstream_health_monitor import UpstreamHealthMonitor
+from app.infrastructure.repositories.lmstudio_summary_repository import LMStudioSummaryRepository
+
+
+class _Backend:
+    """Fake LMStudio answering /models and /chat/completions"""
+
+    def __init__(self):
+        self.calls = []
+        self.models_status = 200
+        self.generation_status = 200
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(path)
+        if path == "models":
+            return httpx.Response(self.models_status, json={"data": [{"id": "qwen/qwen3-4b"}]})
+        return httpx.Response(self.generation_status, json={"choices": [{"message": {"content": "Hi"}}]})
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def backend():
+    return _Backend()
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def monitor(backend, clock, lmstudio_config):
+    client = httpx.AsyncClient(base_url=lmstudio_config.base_url, transport=httpx.MockTransport(backend.handle))
+    client_pool = Mock(http_client=client, config=lmstudio_config)
+    return UpstreamHealthMonitor(client_pool, "qwen/qwen3-4b", ttl=10.0, deep_interval=300.0, clock=clock)
+
+
+class TestUpstreamHealthMonitor:
+    """Test UpstreamHealthMonitor"""
+
+    @pytest.mark.asyncio
+    async def test_first_check_probes_liveness_and_generation(self, monitor, backend):
+        """Test the first check runs both tiers"""
+        status = await monitor.check()
+
+        assert status.healthy
+        assert (status.live, status.ready) == (True, True)
+        assert backend.calls == ["models", "completions"]
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, monitor, backend, clock):
+        """Test checks within the TTL do not touch the backend"""
+        await monitor.check()
+        clock.now = 5.0
+
+        for _ in range(10):
+            await monitor.check()
+
+        assert len(backend.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_result_refreshes_in_background(self, monitor, backend, clock):
+        """Test a stale check returns the cached result and refreshes liveness only"""
+        first = await monitor.check()
+        clock.now = 11.0
+
+        assert await monitor.check() is first
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert backend.calls == ["models", "completions", "models"]
+        assert monitor.status.checked_at == 11.0
+
+    @pytest.mark.asyncio
+    async def test_generation_probe_runs_every_deep_interval(self, monitor, backend, clock):
+        """Test the generation probe is repeated only after deep_interval"""
+        await monitor.refresh()
+        clock.now = 100.0
+        await monitor.refresh()
+        clock.now = 300.0
+        await monitor.refresh()
+
+        assert backend.calls.count("completions") == 2
+
+    @pytest.mark.asyncio
+    async def test_liveness_failure(self, monitor, backend):
+        """Test an unreachable backend is unhealthy without a generation attempt"""
+        backend.models_status = 503
+
+        status = await monitor.check()
+
+        assert not status.healthy
+        assert not status.live
+        assert backend.calls == ["models"]
+
+    @pytest.mark.asyncio
+    async def test_generation_failure_is_retried(self, monitor, backend, clock):
+        """Test a failed generation probe marks the backend unready until it passes again"""
+        backend.generation_status = 500
+        assert (await monitor.refresh()).ready is False
+
+        backend.generation_status = 200
+        clock.now = 10.0
+        status = await monitor.refresh()
+
+        assert status.ready
+        assert backend.calls.count("completions") == 2
+
+    @pytest.mark.asyncio
+    async def test_generation_timeout_keeps_backend_healthy(self, backend, clock, lmstudio_config):
+        """Test a generation probe stuck behind real requests leaves a live backend healthy but unready"""
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("completions"):
+                await asyncio.sleep(1)
+            return backend.handle(request)
+
+        client = httpx.AsyncClient(base_url=lmstudio_config.base_url, transport=httpx.MockTransport(handle))
+        client_pool = Mock(http_client=client, config=lmstudio_config)
+        monitor = UpstreamHealthMonitor(client_pool, "qwen/qwen3-4b", probe_timeout=0.01, clock=clock)
+
+        status = await monitor.check()
+
+        assert status.healthy
+        assert (status.live, status.ready) == (True, False)
+        assert "TimeoutError" in status.error
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self, monitor, backend):
+        """Test simultaneous first checks run a single probe"""
+        await asyncio.gather(*(monitor.check() for _ in range(5)))
+
+        assert backend.calls == ["models", "completions"]
+
+    @pytest.mark.asyncio
+    async def test_background_loop(self, monitor, backend):
+        """Test start/stop of the background refresh"""
+        monitor.start()
+        await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert monitor.status is not None
+        assert backend.calls[:1] == ["models"]
+
+    @pytest.mark.asyncio
+    async def test_repository_uses_monitor(self, monitor, backend, lmstudio_config):
+        """Test the repository health check is served by the monitor"""
+        repository = LMStudioSummaryRepository(lmstudio_config, health_monitor=monitor)
+
+        assert await repository.health_check()
+        assert await repository.health_check()
+        assert backend.calls == ["models", "completions"]